@@ -1,6 +1,6 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: January, 2016.
-# Updated at: May, 2016.
+# Updated at: October, 2026.
 
 
 # CLASS: Chromosome
@@ -9,13 +9,25 @@ class Chromosome:
     This class contains the structure that is necessary for every individual in a population. It also has some auxiliary
     methods used by other external functions.
 
+    The genes are not stored as a matrix: every column j is packed in one integer, whose bit i is the gene (i, j), so
+    the column of a node is the bitset of its parents. Copying a chromosome, flipping a gene, swapping a column and
+    counting the ones take a few integer operations, and the structural hash is cached until the genes change.
+
+    The chromosomes are compared by identity: two chromosomes with the same genes are found by their 'structural_key'.
+    'get_genes' returns a new matrix on every call, so the genes are only changed through 'set_genes', 'set_column'
+    and 'bit_changer'.
+
     Args:
         genes : MATRIX[[INT, INT, ...], [INT, INT, ...], ...]
             This matrix is the representation of the genes
 
     Attributes:
-        genes : MATRIX[[INT, INT, ...], [INT, INT, ...], ...]
-            The matrix associated with the class, representing the genes
+        num_genes : INT
+            The amount of genes of the chromosome, the matrix's size is num_genes*num_genes
+        columns : LIST[INT, INT, ...]
+            The genes packed by column, the bit i of the column j is the gene (i, j)
+        structural_hash_value : INT
+            The cached hash of the genes, None if it must be calculated again
         likelihood_result : FLOAT
             A value calculated by the likelihood function selected by the user, very important to measure the quality of
             the genes
@@ -24,20 +36,74 @@ class Chromosome:
         fitness : FLOAT
             This final value is calculated for selection purpose based on the population sorted by the relative
             likelihood result
+        family_scores : LIST[FLOAT, FLOAT, ...]
+            The score of the family of every column (a child and its parents) at the last evaluation, None if the
+            chromosome was never evaluated
+        changed_columns : SET{INT, INT, ...}
+            The columns that changed since the last evaluation, only these families need to be scored again
     """
+    __slots__ = ("num_genes", "columns", "structural_hash_value", "log_likelihood_result",
+                 "relative_likelihood_result", "fitness", "family_scores", "changed_columns")
+
     # CONSTRUCTOR
     def __init__(self, genes):
-        self.genes = genes
+        self.num_genes = len(genes)
+        self.columns = columns_packer(genes)
+        self.structural_hash_value = None
         self.log_likelihood_result = None
         self.relative_likelihood_result = None
         self.fitness = None
+        self.family_scores = None
+        self.changed_columns = set()
+
+    @classmethod
+    def from_columns(cls, columns):
+        """
+        Creates a chromosome from its genes packed by column, see 'get_columns'.
+
+        Args:
+            columns : LIST[INT, INT, ...]
+                The genes packed by column
+
+        Returns:
+            Chromosome
+                The new chromosome
+        """
+        chromosome = cls.__new__(cls)
+        chromosome.num_genes = len(columns)
+        chromosome.columns = list(columns)
+        chromosome.structural_hash_value = None
+        chromosome.log_likelihood_result = None
+        chromosome.relative_likelihood_result = None
+        chromosome.fitness = None
+        chromosome.family_scores = None
+        chromosome.changed_columns = set()
+        return chromosome
 
     # ACCESSOR METHODS
     def get_genes(self):
-        return self.genes
+        """ Returns a new matrix with the genes, changes to it do not change the chromosome (see 'set_genes'). """
+        return columns_unpacker(self.columns)
 
     def set_genes(self, genes):
-        self.genes = genes
+        self.num_genes = len(genes)
+        self.columns = columns_packer(genes)
+        self.structural_hash_value = None
+        self.family_scores = None
+        self.changed_columns = set()
+
+    def get_num_genes(self):
+        return self.num_genes
+
+    def get_columns(self):
+        return self.columns
+
+    def get_column(self, j):
+        return self.columns[j]
+
+    def set_column(self, j, column):
+        self.columns[j] = column
+        self.structural_hash_value = None
 
     def get_log_likelihood_result(self):
         return self.log_likelihood_result
@@ -57,6 +123,16 @@ class Chromosome:
     def set_fitness(self, fitness):
         self.fitness = fitness
 
+    def get_family_scores(self):
+        return self.family_scores
+
+    def set_family_scores(self, family_scores):
+        self.family_scores = family_scores
+        self.changed_columns = set()
+
+    def get_changed_columns(self):
+        return self.changed_columns
+
     # METHODS
     def bit_changer(self, i, j):
         """
@@ -69,7 +145,115 @@ class Chromosome:
             j : INT
                 Position y of the matrix (column)
         """
-        self.genes[i][j] = (1 - self.genes[i][j])
+        self.set_column(j, self.get_column(j) ^ (1 << i))
+        self.changed_columns.add(j)
+
+    def swap_column(self, chromosome, j):
+        """
+        Swaps a column of the genes with the same column of another chromosome. The family scores are not changed.
+
+        Args:
+            chromosome : Chromosome
+                The other chromosome
+            j : INT
+                The column to be swapped
+        """
+        column = self.get_column(j)
+        self.set_column(j, chromosome.get_column(j))
+        chromosome.set_column(j, column)
+
+    def copy(self):
+        """
+        Returns an independent chromosome with the same genes, likelihood results, fitness and family scores.
+
+        Returns:
+            Chromosome
+                The copy of the chromosome
+        """
+        chromosome = Chromosome.from_columns(self.get_columns())
+        chromosome.log_likelihood_result = self.log_likelihood_result
+        chromosome.relative_likelihood_result = self.relative_likelihood_result
+        chromosome.fitness = self.fitness
+        chromosome.inherit_scores(self, set())
+        return chromosome
+
+    def different_columns(self, chromosome):
+        """
+        Returns the columns where the genes of this chromosome and the genes of another chromosome are different.
+
+        Args:
+            chromosome : Chromosome
+                The other chromosome
+
+        Returns:
+            SET{INT, INT, ...}
+                The numbers of the columns that are not equal
+        """
+        columns_a = self.get_columns()
+        columns_b = chromosome.get_columns()
+        return {j for j in range(0, len(columns_a)) if columns_a[j] != columns_b[j]}
+
+    def descendants(self, node):
+        """
+        Returns the nodes that can be reached from a node following the edges of the genes (the node is not included
+        unless it is in a cycle).
+
+        Args:
+            node : INT
+                The first node
+
+        Returns:
+            INT
+                The bitset of the descendants
+        """
+        columns = self.get_columns()
+        children = [0] * len(columns)
+        for j in range(0, len(columns)):
+            for i in bits_iterator(columns[j]):
+                children[i] |= 1 << j
+        reached = 0
+        frontier = children[node]
+        while frontier:
+            reached |= frontier
+            new_frontier = 0
+            for i in bits_iterator(frontier):
+                new_frontier |= children[i]
+            frontier = new_frontier & ~reached
+        return reached
+
+    def creates_cycle(self, i, j):
+        """
+        Returns True if adding the edge from i to j to the genes of a DAG would create a cycle.
+
+        Args:
+            i : INT
+                Position x of the matrix (row)
+            j : INT
+                Position y of the matrix (column)
+
+        Returns:
+            BOOLEAN
+                True if j is i or i is a descendant of j
+        """
+        return i == j or bool(self.descendants(j) >> i & 1)
+
+    def inherit_scores(self, chromosome, changed_columns):
+        """
+        Copies the family scores and the likelihood result of another chromosome whose genes only differ from these
+        genes in the given columns, so only those families are scored in the next evaluation. A chromosome without
+        family scores (scored by its equivalence class) gives its likelihood result, and it is kept if no column
+        changed.
+
+        Args:
+            chromosome : Chromosome
+                The chromosome whose scores are copied
+            changed_columns : SET{INT, INT, ...}
+                The columns where the genes of both chromosomes are different
+        """
+        if chromosome.family_scores is not None:
+            self.family_scores = list(chromosome.family_scores)
+        self.log_likelihood_result = chromosome.log_likelihood_result
+        self.changed_columns = chromosome.changed_columns | set(changed_columns)
 
     def counter_ones(self):
         """
@@ -79,18 +263,94 @@ class Chromosome:
             INT
                 A number representing the number of 1 that the matrix of genes has
         """
-        num_ones = 0
-        for i in range(0, len(self.genes)):
-            for j in range(0, len(self.genes)):
-                num_ones += self.genes[i][j]
-        return num_ones
+        return sum(column.bit_count() for column in self.get_columns())
+
+    def structural_key(self):
+        """
+        Returns a key that is equal for two chromosomes if and only if their genes are equal.
+
+        Returns:
+            TUPLE(INT, ...)
+                The genes packed by column
+        """
+        return tuple(self.get_columns())
+
+    def structural_hash(self):
+        """
+        Returns the hash of the genes, calculated only once while they do not change.
+
+        Returns:
+            INT
+                The hash of the structural key
+        """
+        if self.structural_hash_value is None:
+            self.structural_hash_value = hash(self.structural_key())
+        return self.structural_hash_value
 
     def __repr__(self):
         msg = ""
-        for i in range(0, len(self.genes)):
-            msg += str(self.genes[i]) + "\n"
+        genes = self.get_genes()
+        for i in range(0, len(genes)):
+            msg += str(genes[i]) + "\n"
         msg += "Log Likelihood Result: " + str(self.log_likelihood_result) + "\n"
         msg += "Relative Likelihood Result: " + str(self.relative_likelihood_result) + "\n"
         msg += "Fitness: " + str(self.fitness) + "\n"
         msg += "Num. Ones: " + str(self.counter_ones())
         return msg
+
+
+# FUNCTION: columns_packer
+def columns_packer(genes):
+    """
+    Packs a matrix of genes by column: the bit i of the column j is 1 if the gene (i, j) is not 0.
+
+    Args:
+        genes : MATRIX[[INT, INT, ...], [INT, INT, ...], ...]
+            This matrix is the representation of the genes
+
+    Returns:
+        LIST[INT, INT, ...]
+            The genes packed by column
+    """
+    columns = [0] * len(genes)
+    for i in range(0, len(genes)):
+        bit = 1 << i
+        for j, gene in enumerate(genes[i]):
+            if gene:
+                columns[j] |= bit
+    return columns
+
+
+# FUNCTION: columns_unpacker
+def columns_unpacker(columns):
+    """
+    Unpacks the genes packed by 'columns_packer' into a new matrix.
+
+    Args:
+        columns : LIST[INT, INT, ...]
+            The genes packed by column
+
+    Returns:
+        MATRIX[[INT, INT, ...], [INT, INT, ...], ...]
+            This matrix is the representation of the genes
+    """
+    return [[(column >> i) & 1 for column in columns] for i in range(0, len(columns))]
+
+
+# FUNCTION: bits_iterator
+def bits_iterator(bitset):
+    """
+    An auxiliary function that yields the position of every bit set to 1 in an integer, from the lowest one.
+
+    Args:
+        bitset : INT
+            A bitset of nodes
+
+    Returns:
+        GENERATOR(INT)
+            The nodes of the bitset
+    """
+    while bitset:
+        low = bitset & -bitset
+        yield low.bit_length() - 1
+        bitset ^= low
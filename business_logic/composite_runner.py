@@ -0,0 +1,263 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.models_functions import *
+from business_logic.initialization_functions import *
+from business_logic.mutation_functions import *
+from business_logic.repair_functions import *
+from business_logic.selection_functions import *
+from business_logic.population import Population
+from multiprocessing import Pool
+import numpy as np
+import random
+
+# The replicates and the settings used by the worker processes of 'composite_runs_executor'
+_worker_rep = None
+_worker_collect_families = False
+
+
+# CLASS: CompositeResult
+class CompositeResult:
+    """
+    The compact result of one composite run of the SGA (see 'composite_run'): the unique chromosomes of its last
+    generation with their scores, and its composite model. It is small enough to be sent back by a worker process.
+
+    Args:
+        population : Population
+            The unique chromosomes of the last generation, sorted by the likelihood result and with their fitness
+        composite_model : MATRIX[[FLOAT, FLOAT, ...], [FLOAT, FLOAT, ...], ...]
+            The composite model of the run
+        num_evaluations : INT
+            The number of chromosomes evaluated by the likelihood function during the generations
+        families : LIST[TUPLE(INT, TUPLE(INT, ...), FLOAT), ...]
+            The families scored by the worker process since its previous result, as (child, parents, score), so the
+            parent process can keep them (see 'ScoreStore'); an empty list when the run was done by the parent process
+        disk_hits : INT
+            The lookups of the worker process answered by a score loaded from a 'ScoreStore' since its previous result
+    """
+    # CONSTRUCTOR
+    def __init__(self, population, composite_model, num_evaluations, families=None, disk_hits=0):
+        self.population = population
+        self.composite_model = composite_model
+        self.num_evaluations = num_evaluations
+        self.families = [] if families is None else families
+        self.disk_hits = disk_hits
+
+    # ACCESSOR METHODS
+    def get_population(self):
+        return self.population
+
+    def get_composite_model(self):
+        return self.composite_model
+
+    def get_num_evaluations(self):
+        return self.num_evaluations
+
+    def get_families(self):
+        return self.families
+
+    def get_disk_hits(self):
+        return self.disk_hits
+
+
+# FUNCTION: composite_run
+def composite_run(seed, rep, pop_size, num_genes, per_ones, likelihood_function, num_survivors, selection_prop,
+                  mutation_prop, num_mutations, num_matings, max_parents=3, by_score=False, by_equivalence=False,
+                  acyclic=False, use_bigfloat=False, verbose=False, migrator=None):
+    """
+    Does one complete run of the SGA, from the seeding of the initial population to the composite model of its last
+    generation. Every random number of the run comes from the 'random' module seeded with 'seed' (the numpy
+    generators of the operators are seeded by it), so a run only depends on its seed and its parameters (and on the
+    chromosomes received from the other islands, when it is an island, see 'Migrator').
+
+    Args:
+        seed : INT
+            The seed of the run
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        pop_size : INT
+            The population size
+        num_genes : INT
+            The amount of genes for each chromosome
+        per_ones : INT
+            The percentage of ones of every chromosome of the initial population
+        likelihood_function : INT
+            Indicates the likelihood function that is going to be used
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+        num_survivors : INT
+            The number of survivors of the elitism, see 'calc_num_survivors'
+        selection_prop : FLOAT
+            The probability of selection
+        mutation_prop : FLOAT
+            The probability of mutation
+        num_mutations : INT
+            The amount of mutations per chromosome
+        num_matings : INT
+            The amount of matings (generations)
+        max_parents : INT
+            The maximum number of parents of every gene
+        by_score : BOOLEAN
+            True for finding the unique chromosomes by their relative likelihood result instead of their genes
+        by_equivalence : BOOLEAN
+            True for treating Markov equivalent DAGs as one chromosome, see 'equivalence_likelihood_calculator'
+        acyclic : BOOLEAN
+            True for using the crossover and mutation operators that never create cycles
+        use_bigfloat : BOOLEAN
+            True for calculating the relative likelihood results with 'bigfloat'
+        verbose : BOOLEAN
+            True for printing the progress of every generation
+        migrator : Migrator
+            The migrator of the island of the run, None for an isolated run
+
+    Returns:
+        CompositeResult
+            The unique chromosomes of the last generation and the composite model
+    """
+    random.seed(seed)
+
+    # Creation of the initial population using "seeding" method. See the function documentation.
+    if verbose:
+        print("* Creating the initial population...")
+    current_population = Population.from_chromosomes(seed_population(pop_size, num_genes, per_ones, likelihood_function,
+                                                                     rep, by_score, by_equivalence, max_parents,
+                                                                     use_bigfloat))
+    num_evaluations = 0  # chromosomes evaluated by the likelihood function, the unchanged ones are not evaluated
+    if verbose:
+        print("* Initial Population created, having " +
+              str(len(select_uniques_chromosomes(current_population, by_score, by_equivalence))) +
+              " unique chromosomes.")
+
+    for j in range(0, num_matings):
+        if verbose:
+            print("* Working on generation " + str(j + 1) + "...")
+        # 1) Given a sorted population, this function add ranks used on selection
+        fitness_calculator(current_population)
+
+        # 2) Creation of the new population, by doing the selection process
+        new_population = selection_function(current_population, num_survivors, selection_prop, by_score,
+                                            by_equivalence, acyclic)
+
+        # 3) Application of the mutation function to the population
+        if acyclic:
+            acyclic_mutation_function(new_population, mutation_prop, num_mutations, max_parents)
+        else:
+            mutation_function(new_population, mutation_prop, num_mutations)
+
+        # 4) Application of the repairing function to the population, in place (the acyclic operators don't need it)
+        if not acyclic:
+            repair_population(new_population, max_parents)
+        current_population = new_population
+
+        # 5) The applying of the likelihood on every changed chromosome to obtain the 'likelihood result'
+        num_evaluations += likelihood_result_calculator(current_population, likelihood_function, rep,
+                                                        by_equivalence=by_equivalence)
+
+        # 6) Finding the 'relative likelihood result' for every chromosome
+        relative_likelihood_result_calculator(current_population, use_bigfloat)
+
+        # 7) Sorting of the population based on the 'likelihood result' of every chromosome
+        relative_likelihood_result_sorting(current_population)
+
+        # 8) Exchange of the best chromosomes with the other islands, which take the place of the worst ones
+        if migrator is not None and migrator.is_migration_generation(j + 1):
+            current_population = migrator.migrate(current_population, j + 1, by_score, by_equivalence)
+            num_evaluations += likelihood_result_calculator(current_population, likelihood_function, rep,
+                                                            by_equivalence=by_equivalence)
+            relative_likelihood_result_calculator(current_population, use_bigfloat)
+            relative_likelihood_result_sorting(current_population)
+
+        if verbose:
+            print("\tcreated.")
+
+    # Removing from the population the repeated chromosomes
+    current_population = Population.from_chromosomes(select_uniques_chromosomes(current_population, by_score,
+                                                                                by_equivalence))
+
+    # Recalculation of 'likelihood' values and fitness on the current population (unique chromosomes). The
+    # chromosomes keep their scores, so only the ones without a likelihood result are evaluated.
+    likelihood_result_calculator(current_population, likelihood_function, rep, by_equivalence=by_equivalence)
+    relative_likelihood_result_calculator(current_population, use_bigfloat)
+    relative_likelihood_result_sorting(current_population)
+    fitness_calculator(current_population)
+
+    composite_model = model_creator(current_population, num_genes, likelihood_function)
+    return CompositeResult(current_population, composite_model, num_evaluations)
+
+
+# FUNCTION: composite_runs_executor
+def composite_runs_executor(num_runs, rep, random_seed=None, num_workers=1, collect_families=False, **parameters):
+    """
+    Does 'num_runs' independent composite runs (see 'composite_run') and yields their results in the order of the runs.
+    The seed of every run is spawned from 'random_seed' by a numpy 'SeedSequence', so it doesn't depend on the worker
+    that does the run, and the results are the same for any number of workers. With one worker the runs are done one
+    after another by this process, printing their progress; otherwise every run is sent to a pool of worker processes
+    and the results are yielded as soon as every previous run is done.
+
+    Args:
+        num_runs : INT
+            The number of composite runs
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        random_seed : INT
+            The seed of the whole execution, None for a different one every time
+        num_workers : INT
+            The number of worker processes, None for the number of CPUs
+        collect_families : BOOLEAN
+            True for sending back the families scored by every worker process, see 'CompositeResult'
+        parameters : DICT{STRING: ...}
+            The parameters of 'composite_run' (from 'pop_size' to 'use_bigfloat')
+
+    Returns:
+        GENERATOR(CompositeResult)
+            The result of every run, in order
+    """
+    seeds = run_seeds_creator(np.random.SeedSequence(random_seed), num_runs)
+    if num_workers == 1:
+        for seed in seeds:
+            yield composite_run(seed, rep, verbose=True, **parameters)
+        return
+    tasks = [(seed, parameters) for seed in seeds]
+    with Pool(num_workers, initializer=_worker_initializer, initargs=(rep, collect_families)) as pool:
+        for result in pool.imap(_worker_composite_run, tasks):
+            yield result
+
+
+# FUNCTION: run_seeds_creator
+def run_seeds_creator(seed_sequence, num_runs):
+    """
+    Returns the seeds of the runs of an execution, spawned from its 'SeedSequence'. The seed of a run only depends on
+    the seed of the execution and on the position of the run.
+
+    Args:
+        seed_sequence : np.random.SeedSequence
+            The seed sequence of the execution
+        num_runs : INT
+            The number of seeds
+
+    Returns:
+        LIST[INT, ...]
+            The seed of every run
+    """
+    return [int(sequence.generate_state(1, np.uint64)[0]) for sequence in seed_sequence.spawn(num_runs)]
+
+
+# FUNCTION: _worker_initializer
+def _worker_initializer(rep, collect_families):
+    global _worker_rep, _worker_collect_families
+    _worker_rep = rep
+    _worker_collect_families = collect_families
+    # the scoring pools of the parent process can't be used by its workers
+    scoring_pools.clear()
+
+
+# FUNCTION: _worker_composite_run
+def _worker_composite_run(task):
+    seed, parameters = task
+    result = composite_run(seed, _worker_rep, **parameters)
+    if _worker_collect_families:
+        fingerprint = find_dataset_fingerprint(_worker_rep)
+        result.families = family_score_cache.new_used_families(parameters["likelihood_function"], fingerprint)
+        result.disk_hits = family_score_cache.new_disk_hits()
+    return result
@@ -0,0 +1,405 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.composite_runner import *
+from collections import deque
+from multiprocessing import Process
+from multiprocessing.connection import Client, Listener
+import numpy as np
+import threading
+import time
+
+
+# CLASS: RunSpec
+class RunSpec:
+    """
+    Everything a worker needs to do one composite run (see 'composite_run') for a coordinator: the number of the run,
+    the fingerprint of the dataset (the worker must have the same data), the parameters and the seed.
+
+    Args:
+        run_number : INT
+            The position of the run in the execution, from 0
+        fingerprint : STRING
+            The fingerprint of the replicates, see 'dataset_fingerprint'
+        parameters : DICT{STRING: ...}
+            The parameters of 'composite_run' (from 'pop_size' to 'use_bigfloat'), and 'collect_families' (True for
+            sending back the families scored by the worker, see 'CompositeResult')
+        seed : INT
+            The seed of the run
+    """
+    # CONSTRUCTOR
+    def __init__(self, run_number, fingerprint, parameters, seed):
+        self.run_number = run_number
+        self.fingerprint = fingerprint
+        self.parameters = parameters
+        self.seed = seed
+
+    # ACCESSOR METHODS
+    def get_run_number(self):
+        return self.run_number
+
+    def get_fingerprint(self):
+        return self.fingerprint
+
+    def get_parameters(self):
+        return self.parameters
+
+    def get_seed(self):
+        return self.seed
+
+
+# CLASS: RunCoordinator
+class RunCoordinator:
+    """
+    Serves the runs of an execution to workers on other machines (or local processes standing in for them) through a
+    socket, see 'run_worker'. A worker asks for a run, does it and sends back its compact result ('CompositeResult').
+    The messages are pickled, so only the clients that know the key of the coordinator are accepted; there is no
+    default key, it must be given by the user (see 'authkey_checker').
+    A run is leased to one worker at a time; if the connection of the worker is lost, or the lease is older than
+    'lease_timeout' seconds, the run is given to the next worker that asks. The first result of every run is kept and
+    any other one is discarded, so a run that was done twice is only counted once. The seeds of the runs are the ones
+    of 'composite_runs_executor', so the results don't depend on the workers.
+
+    Args:
+        specs : LIST[RunSpec, ...]
+            The runs of the execution, in order
+        authkey : BYTES
+            The secret key shared by the coordinator and the workers
+        address : TUPLE(STRING, INT)
+            The host and the port of the socket (the port 0 picks a free one)
+        lease_timeout : FLOAT
+            The seconds a worker has to send the result of a run, None for no limit
+        max_attempts : INT
+            The maximum number of times a run is leased before the execution is stopped
+
+    Attributes:
+        specs : LIST[RunSpec, ...]
+            The runs of the execution, in order
+        lease_timeout : FLOAT
+            The seconds a worker has to send the result of a run
+        max_attempts : INT
+            The maximum number of times a run is leased
+        pending_runs : deque(INT, ...)
+            The runs waiting for a worker
+        leases : DICT{INT: FLOAT}
+            The time when every leased run was given to a worker
+        attempts : LIST[INT, ...]
+            The number of times every run was leased
+        results : DICT{INT: CompositeResult}
+            The result of every finished run
+        num_duplicates : INT
+            The number of results discarded because the run was already finished
+        condition : threading.Condition
+            The lock of the state, notified when a result arrives
+        listener : Listener
+            The socket where the workers connect
+    """
+    # CONSTRUCTOR
+    def __init__(self, specs, authkey, address=("localhost", 0), lease_timeout=None, max_attempts=3):
+        authkey_checker(authkey)
+        self.specs = specs
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.pending_runs = deque(range(0, len(specs)))
+        self.leases = {}
+        self.attempts = [0] * len(specs)
+        self.results = {}
+        self.num_duplicates = 0
+        self.condition = threading.Condition()
+        self.listener = Listener(address, authkey=authkey)
+        threading.Thread(target=self.accept_workers, daemon=True).start()
+
+    # ACCESSOR METHODS
+    def get_address(self):
+        return self.listener.address
+
+    def get_num_duplicates(self):
+        return self.num_duplicates
+
+    # METHODS
+    def accept_workers(self):
+        """ Accepts the connections of the workers, serving every one in its own thread, until it is closed. """
+        while True:
+            try:
+                connection = self.listener.accept()
+            except (OSError, EOFError):
+                return
+            except Exception:
+                continue  # a client with a wrong key
+            threading.Thread(target=self.serve_worker, args=(connection,), daemon=True).start()
+
+    def serve_worker(self, connection):
+        """
+        Answers the messages of a worker until it disconnects: ("request",) is answered with ("run", RunSpec),
+        ("wait", seconds) or ("done",); ("result", run_number, result) is answered with ("ok",); ("reject",
+        run_number) gives the run back. The runs leased to the worker and not finished are given back when the
+        connection is lost.
+
+        Args:
+            connection : Connection
+                The connection of the worker
+        """
+        leased_runs = set()
+        try:
+            while True:
+                message = connection.recv()
+                if message[0] == "request":
+                    run_number = self.lease()
+                    if run_number is None:
+                        connection.send(("done",) if self.is_done() else ("wait", 0.5))
+                    else:
+                        leased_runs.add(run_number)
+                        connection.send(("run", self.specs[run_number]))
+                elif message[0] == "result":
+                    self.finish(message[1], message[2])
+                    leased_runs.discard(message[1])
+                    connection.send(("ok",))
+                elif message[0] == "reject":
+                    self.release(message[1])
+                    leased_runs.discard(message[1])
+        except (EOFError, OSError):
+            pass
+        finally:
+            for run_number in leased_runs:
+                self.release(run_number)
+            connection.close()
+
+    def lease(self):
+        """
+        Returns the next run for a worker, giving back first the leases that expired.
+
+        Returns:
+            INT
+                The number of the run, None if no run is waiting
+        """
+        with self.condition:
+            if self.lease_timeout is not None:
+                now = time.monotonic()
+                for run_number, leased_at in list(self.leases.items()):
+                    if now - leased_at > self.lease_timeout:
+                        del self.leases[run_number]
+                        self.pending_runs.append(run_number)
+            while self.pending_runs:
+                run_number = self.pending_runs.popleft()
+                if run_number in self.results:
+                    continue
+                self.attempts[run_number] += 1
+                self.leases[run_number] = time.monotonic()
+                return run_number
+            return None
+
+    def release(self, run_number):
+        """
+        Gives back a leased run that was not finished, so another worker can do it.
+
+        Args:
+            run_number : INT
+                The number of the run
+        """
+        with self.condition:
+            if run_number in self.leases and run_number not in self.results:
+                del self.leases[run_number]
+                self.pending_runs.appendleft(run_number)
+            self.condition.notify_all()
+
+    def finish(self, run_number, result):
+        """
+        Keeps the result of a run, unless the run was already finished.
+
+        Args:
+            run_number : INT
+                The number of the run
+            result : CompositeResult
+                The result sent by the worker
+        """
+        with self.condition:
+            if run_number in self.results:
+                self.num_duplicates += 1
+            else:
+                self.results[run_number] = result
+            self.leases.pop(run_number, None)
+            self.condition.notify_all()
+
+    def is_done(self):
+        with self.condition:
+            return len(self.results) == len(self.specs)
+
+    def wait_result(self, run_number):
+        """
+        Waits until the result of a run arrives.
+
+        Args:
+            run_number : INT
+                The number of the run
+
+        Returns:
+            CompositeResult
+                The result of the run
+        """
+        with self.condition:
+            while run_number not in self.results:
+                if self.attempts[run_number] >= self.max_attempts and run_number not in self.leases:
+                    raise RuntimeError("the run " + str(run_number) + " was lost by " + str(self.max_attempts) +
+                                       " workers")
+                self.condition.wait(timeout=1.0)
+            return self.results[run_number]
+
+    def close(self):
+        """ Stops accepting workers. """
+        self.listener.close()
+
+
+# FUNCTION: coordinator_runs_executor
+def coordinator_runs_executor(num_runs, rep, authkey, random_seed=None, address=("localhost", 0), num_local_workers=0,
+                              collect_families=False, lease_timeout=None, **parameters):
+    """
+    Does 'num_runs' composite runs through a 'RunCoordinator', yielding their results in the order of the runs. The
+    workers are started on every machine with 'run_worker' (see the option 'distributed_mode' of 'main'), and
+    'num_local_workers' worker processes can also be started on this machine, for example to test the execution.
+
+    Args:
+        num_runs : INT
+            The number of composite runs
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        authkey : BYTES
+            The secret key shared by the coordinator and the workers
+        random_seed : INT
+            The seed of the whole execution, None for a different one every time
+        address : TUPLE(STRING, INT)
+            The host and the port where the coordinator listens, the host "0.0.0.0" listens on every interface of this
+            machine (the workers of other machines dial the name or the address of this machine)
+        num_local_workers : INT
+            The number of worker processes started on this machine
+        collect_families : BOOLEAN
+            True for asking the workers for the families they scored, see 'CompositeResult'
+        lease_timeout : FLOAT
+            The seconds a worker has to send the result of a run, None for no limit
+        parameters : DICT{STRING: ...}
+            The parameters of 'composite_run' (from 'pop_size' to 'use_bigfloat')
+
+    Returns:
+        GENERATOR(CompositeResult)
+            The result of every run, in order
+    """
+    fingerprint = find_dataset_fingerprint(rep)
+    seeds = run_seeds_creator(np.random.SeedSequence(random_seed), num_runs)
+    specs = [RunSpec(run_number, fingerprint, dict(parameters, collect_families=collect_families), seeds[run_number])
+             for run_number in range(0, num_runs)]
+    coordinator = RunCoordinator(specs, authkey, address, lease_timeout)
+    local_workers = [Process(target=run_worker, args=(local_address_finder(coordinator.get_address()), authkey, rep))
+                     for worker in range(0, num_local_workers)]
+    for local_worker in local_workers:
+        local_worker.start()
+    try:
+        for run_number in range(0, num_runs):
+            yield coordinator.wait_result(run_number)
+    finally:
+        coordinator.close()
+        for local_worker in local_workers:
+            local_worker.join(timeout=5.0)
+            if local_worker.is_alive():
+                local_worker.terminate()
+
+
+# FUNCTION: run_worker
+def run_worker(address, authkey, rep, max_connection_attempts=30):
+    """
+    Does the runs served by a 'RunCoordinator' until every run of the execution is finished. If the connection is
+    lost, the worker connects again (the coordinator gives the interrupted run to another worker). A run for another
+    dataset is given back and the worker stops.
+
+    Args:
+        address : TUPLE(STRING, INT)
+            The host and the port of the coordinator
+        authkey : BYTES
+            The secret key shared by the coordinator and the workers
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result, the same data of the coordinator
+        max_connection_attempts : INT
+            The number of failed connections (one per second) before the worker stops
+
+    Returns:
+        INT
+            The number of runs done by the worker
+    """
+    authkey_checker(authkey)
+    # the scoring pools of the parent process can't be used by a local worker
+    scoring_pools.clear()
+    fingerprint = find_dataset_fingerprint(rep)
+    num_runs = 0
+    failed_connections = 0
+    while failed_connections < max_connection_attempts:
+        try:
+            connection = Client(tuple(address), authkey=authkey)
+        except (OSError, EOFError):
+            failed_connections += 1
+            time.sleep(1.0)
+            continue
+        failed_connections = 0
+        try:
+            while True:
+                connection.send(("request",))
+                message = connection.recv()
+                if message[0] == "done":
+                    return num_runs
+                if message[0] == "wait":
+                    time.sleep(message[1])
+                    continue
+                spec = message[1]
+                if spec.get_fingerprint() != fingerprint:
+                    connection.send(("reject", spec.get_run_number()))
+                    raise ValueError("the worker has other data than the coordinator (" + fingerprint + " instead of "
+                                     + spec.get_fingerprint() + ")")
+                parameters = dict(spec.get_parameters())
+                collect_families = parameters.pop("collect_families", False)
+                result = composite_run(spec.get_seed(), rep, **parameters)
+                if collect_families:
+                    likelihood_function = parameters["likelihood_function"]
+                    result.families = family_score_cache.new_used_families(likelihood_function, fingerprint)
+                    result.disk_hits = family_score_cache.new_disk_hits()
+                connection.send(("result", spec.get_run_number(), result))
+                connection.recv()
+                num_runs += 1
+        except (EOFError, OSError):
+            time.sleep(1.0)
+        finally:
+            connection.close()
+    return num_runs
+
+
+# FUNCTION: local_address_finder
+def local_address_finder(address):
+    """
+    Returns the address that a worker of this machine dials to reach a coordinator listening on the given address. A
+    coordinator listening on every interface ("0.0.0.0" or "") is dialed through "localhost".
+
+    Args:
+        address : TUPLE(STRING, INT)
+            The host and the port where the coordinator listens
+
+    Returns:
+        TUPLE(STRING, INT)
+            The host and the port to dial
+    """
+    host, port = address
+    if host in ("0.0.0.0", ""):
+        host = "localhost"
+    return host, port
+
+
+# FUNCTION: authkey_checker
+def authkey_checker(authkey):
+    """
+    Stops a coordinator or a worker that has no key. The coordinator unpickles the messages of its clients, so the key
+    must be a secret given by the user (for example through an environment variable, see 'main'), never one written in
+    the code.
+
+    Args:
+        authkey : BYTES
+            The secret key shared by the coordinator and the workers
+    """
+    if not isinstance(authkey, bytes) or not authkey:
+        raise ValueError("a secret key shared by the coordinator and the workers is required")
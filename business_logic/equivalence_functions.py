@@ -0,0 +1,148 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.chromosome import bits_iterator
+
+
+# =====================
+# EQUIVALENCE FUNCTIONS
+# =====================
+
+# FUNCTION: cpdag_creator
+def cpdag_creator(columns):
+    """
+    Returns the CPDAG (completed partially directed acyclic graph, or essential graph) of a DAG: the graph with the
+    skeleton of the DAG where only the compelled edges are directed. Two DAGs are Markov equivalent if and only if they
+    have the same CPDAG. The edges of the v-structures (a -> c <- b with a and b not adjacent) are compelled, and the
+    Meek rules R1, R2 and R3 are applied until no other undirected edge can be oriented. Every set of nodes is an
+    integer bitset, like the columns of a 'Chromosome'.
+
+    Args:
+        columns : LIST[INT, INT, ...]
+            The DAG packed by column, the bit i of the column j is 1 if there is an edge from i to j
+
+    Returns:
+        LIST[INT, INT, ...]
+            The CPDAG packed by column: the bit i of the column j is 1 if there is an edge i -> j or an undirected
+            edge i - j (in the last case the bit j of the column i is also 1)
+    """
+    num_genes = len(columns)
+    children = [0] * num_genes
+    for j in range(0, num_genes):
+        for i in bits_iterator(columns[j]):
+            children[i] |= 1 << j
+    adjacent = [columns[j] | children[j] for j in range(0, num_genes)]
+
+    # the edges of the v-structures are compelled
+    directed_parents = [0] * num_genes
+    directed_children = [0] * num_genes
+    for c in range(0, num_genes):
+        parents = list(bits_iterator(columns[c]))
+        for a in parents:
+            if columns[c] & ~adjacent[a] & ~(1 << a):
+                directed_parents[c] |= 1 << a
+                directed_children[a] |= 1 << c
+    undirected = [adjacent[j] & ~directed_parents[j] & ~directed_children[j] for j in range(0, num_genes)]
+
+    # Meek rules, every undirected edge u - v is oriented as u -> v when:
+    #   R1) there is a -> u where a and v are not adjacent
+    #   R2) there is u -> w -> v
+    #   R3) there are u - w1, u - w2, w1 -> v and w2 -> v where w1 and w2 are not adjacent
+    changed = True
+    while changed:
+        changed = False
+        for u in range(0, num_genes):
+            for v in list(bits_iterator(undirected[u])):
+                if not undirected[u] >> v & 1:
+                    continue
+                oriented = directed_parents[u] & ~adjacent[v] & ~(1 << v) or \
+                    directed_children[u] & directed_parents[v] or \
+                    nonadjacent_pair_finder(undirected[u] & directed_parents[v], adjacent)
+                if oriented:
+                    undirected[u] &= ~(1 << v)
+                    undirected[v] &= ~(1 << u)
+                    directed_parents[v] |= 1 << u
+                    directed_children[u] |= 1 << v
+                    changed = True
+    return [directed_parents[j] | undirected[j] for j in range(0, num_genes)]
+
+
+# FUNCTION: equivalence_key
+def equivalence_key(chromosome):
+    """
+    Returns a key that is equal for two chromosomes if and only if their DAGs are Markov equivalent (they have the same
+    skeleton and the same v-structures).
+
+    Args:
+        chromosome : Chromosome
+            An object 'Chromosome' whose genes are a DAG
+
+    Returns:
+        TUPLE(INT, ...)
+            The CPDAG of the chromosome packed by column
+    """
+    return tuple(cpdag_creator(chromosome.get_columns()))
+
+
+# FUNCTION: canonical_dag_creator
+def canonical_dag_creator(cpdag):
+    """
+    Returns the canonical DAG of an equivalence class: the consistent extension of its CPDAG found by the algorithm of
+    Dor and Tarsi, always removing the sink with the lowest number, so equivalent DAGs have the same canonical DAG.
+
+    Args:
+        cpdag : LIST[INT, INT, ...]
+            The CPDAG packed by column, see 'cpdag_creator'
+
+    Returns:
+        LIST[INT, INT, ...]
+            The canonical DAG packed by column
+    """
+    num_genes = len(cpdag)
+    rows = [0] * num_genes
+    for j in range(0, num_genes):
+        for i in bits_iterator(cpdag[j]):
+            rows[i] |= 1 << j
+    undirected = [cpdag[j] & rows[j] for j in range(0, num_genes)]
+    directed_parents = [cpdag[j] & ~undirected[j] for j in range(0, num_genes)]
+    directed_children = [rows[j] & ~undirected[j] for j in range(0, num_genes)]
+    adjacent = [cpdag[j] | rows[j] for j in range(0, num_genes)]
+
+    dag = list(directed_parents)
+    remaining = (1 << num_genes) - 1
+    while remaining:
+        for x in bits_iterator(remaining):
+            if directed_children[x] & remaining:
+                continue
+            # every undirected neighbour of x must be adjacent to every other neighbour of x
+            neighbours = adjacent[x] & remaining
+            if all(neighbours & ~adjacent[y] & ~(1 << y) == 0 for y in bits_iterator(undirected[x] & remaining)):
+                break
+        else:
+            raise ValueError("the graph is not a CPDAG, it has no consistent extension")
+        dag[x] |= undirected[x] & remaining
+        remaining &= ~(1 << x)
+    return dag
+
+
+# FUNCTION: nonadjacent_pair_finder
+def nonadjacent_pair_finder(nodes, adjacent):
+    """
+    An auxiliary function that returns True if there are two nodes in a set that are not adjacent.
+
+    Args:
+        nodes : INT
+            The bitset of the nodes
+        adjacent : LIST[INT, INT, ...]
+            The bitset of the neighbours of every node
+
+    Returns:
+        BOOLEAN
+            True if a pair of not adjacent nodes is found
+    """
+    for w in bits_iterator(nodes):
+        if nodes & ~adjacent[w] & ~(1 << w):
+            return True
+    return False
@@ -0,0 +1,289 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.gram_tensors import SufficientStatistics
+from collections import OrderedDict
+import hashlib
+import numpy as np
+
+
+# CLASS: FamilyScoreCache
+class FamilyScoreCache:
+    """
+    A bounded cache of family scores. The Patton-Norris likelihoods are a sum of independent per-child terms, where
+    each term depends only on the child and its parent set, so a family that was already scored for a dataset and a
+    paradigm never needs to be computed again. When the cache is full, the least recently used family is evicted.
+
+    Args:
+        max_size : INT
+            The maximum number of families kept in the cache
+
+    Attributes:
+        max_size : INT
+            The maximum number of families kept in the cache
+        entries : OrderedDict{TUPLE: FLOAT}
+            The cached scores, ordered from the least to the most recently used
+        hits : INT
+            The number of lookups answered by the cache
+        misses : INT
+            The number of lookups that were not found in the cache
+        disk_keys : SET{TUPLE, ...}
+            The keys whose scores were loaded from a 'ScoreStore' instead of being computed
+        disk_hits : INT
+            The number of lookups answered by a score loaded from a 'ScoreStore'
+        used_disk_keys : SET{TUPLE, ...}
+            The keys loaded from a 'ScoreStore' that answered at least one lookup
+        collected_keys : SET{TUPLE, ...}
+            The keys already returned by 'new_used_families'
+        collected_disk_hits : INT
+            The disk hits already returned by 'new_disk_hits'
+    """
+    # CONSTRUCTOR
+    def __init__(self, max_size=200000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_keys = set()
+        self.disk_hits = 0
+        self.used_disk_keys = set()
+        self.collected_keys = set()
+        self.collected_disk_hits = 0
+
+    # ACCESSOR METHODS
+    def get_max_size(self):
+        return self.max_size
+
+    def get_hits(self):
+        return self.hits
+
+    def get_misses(self):
+        return self.misses
+
+    def get_disk_hits(self):
+        return self.disk_hits
+
+    # METHODS
+    @staticmethod
+    def family_key(likelihood_function, fingerprint, child, parents):
+        """
+        Builds the key of a family: (paradigm, dataset fingerprint, child, frozen parent set).
+
+        Args:
+            likelihood_function : INT
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+            fingerprint : STRING
+                The fingerprint of the dataset, see 'dataset_fingerprint'
+            child : INT
+                The node whose family is being scored
+            parents : LIST[INT, INT, ...]
+                The parents of the child
+
+        Returns:
+            TUPLE
+                The key of the family
+        """
+        return likelihood_function, fingerprint, child, frozenset(parents)
+
+    def get(self, key):
+        """
+        Returns the score stored for a key, or None if the key is not in the cache.
+
+        Args:
+            key : TUPLE
+                A key created by 'family_key'
+
+        Returns:
+            FLOAT
+                The cached score, None if it was not found
+        """
+        score = self.entries.get(key)
+        if score is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if key in self.disk_keys:
+                self.disk_hits += 1
+                self.used_disk_keys.add(key)
+            self.entries.move_to_end(key)
+        return score
+
+    def put(self, key, score):
+        """
+        Stores a score, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key : TUPLE
+                A key created by 'family_key'
+            score : FLOAT
+                The score of the family
+        """
+        self.entries[key] = score
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            key = self.entries.popitem(last=False)[0]
+            self.disk_keys.discard(key)
+            self.used_disk_keys.discard(key)
+            self.collected_keys.discard(key)
+
+    def preload(self, likelihood_function, fingerprint, families):
+        """
+        Puts in the cache the scores read from a 'ScoreStore', so they are counted as served from disk.
+
+        Args:
+            likelihood_function : INT
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+            fingerprint : STRING
+                The fingerprint of the dataset, see 'dataset_fingerprint'
+            families : LIST[TUPLE(INT, TUPLE(INT, ...), FLOAT), ...]
+                The stored families, as (child, parents, score), the least recently used first
+        """
+        for child, parents, score in families[-self.max_size:]:
+            key = self.family_key(likelihood_function, fingerprint, child, parents)
+            self.put(key, score)
+            self.disk_keys.add(key)
+
+    def used_families(self, likelihood_function, fingerprint):
+        """
+        Returns the families of a dataset and a paradigm that are in the cache because they were computed, or that
+        were loaded from a 'ScoreStore' and used, so they can be saved back to the store.
+
+        Args:
+            likelihood_function : INT
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+            fingerprint : STRING
+                The fingerprint of the dataset, see 'dataset_fingerprint'
+
+        Returns:
+            LIST[TUPLE(INT, TUPLE(INT, ...), FLOAT), ...]
+                The used families, as (child, parents, score)
+        """
+        families = []
+        for key, score in self.entries.items():
+            if key[0] == likelihood_function and key[1] == fingerprint and \
+                    (key not in self.disk_keys or key in self.used_disk_keys):
+                families.append((key[2], tuple(sorted(key[3])), score))
+        return families
+
+    def new_used_families(self, likelihood_function, fingerprint):
+        """
+        Returns the used families (see 'used_families') that were not returned by a previous call, so a worker process
+        that does many runs only sends back the families of every run once.
+
+        Args:
+            likelihood_function : INT
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+            fingerprint : STRING
+                The fingerprint of the dataset, see 'dataset_fingerprint'
+
+        Returns:
+            LIST[TUPLE(INT, TUPLE(INT, ...), FLOAT), ...]
+                The used families that were not returned yet, as (child, parents, score)
+        """
+        families = []
+        for child, parents, score in self.used_families(likelihood_function, fingerprint):
+            key = self.family_key(likelihood_function, fingerprint, child, parents)
+            if key not in self.collected_keys:
+                self.collected_keys.add(key)
+                families.append((child, parents, score))
+        return families
+
+    def new_disk_hits(self):
+        """
+        Returns the number of lookups answered by a score loaded from a 'ScoreStore' since the previous call, so a
+        worker process can report them with every result.
+
+        Returns:
+            INT
+                The new disk hits
+        """
+        disk_hits = self.disk_hits - self.collected_disk_hits
+        self.collected_disk_hits = self.disk_hits
+        return disk_hits
+
+    def merge_families(self, likelihood_function, fingerprint, families, disk_hits=0):
+        """
+        Keeps the families used by a worker process (see 'new_used_families'). A family that was loaded from a
+        'ScoreStore' is marked as used, so it is saved back to the store with the ones used by this process, and the
+        disk hits of the worker are added to the ones of this process.
+
+        Args:
+            likelihood_function : INT
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+            fingerprint : STRING
+                The fingerprint of the dataset, see 'dataset_fingerprint'
+            families : LIST[TUPLE(INT, TUPLE(INT, ...), FLOAT), ...]
+                The families used by the worker, as (child, parents, score)
+            disk_hits : INT
+                The lookups of the worker answered by a score loaded from a 'ScoreStore'
+        """
+        for child, parents, score in families:
+            key = self.family_key(likelihood_function, fingerprint, child, parents)
+            self.put(key, score)
+            if key in self.disk_keys:
+                self.used_disk_keys.add(key)
+        self.disk_hits += disk_hits
+
+    def hit_rate(self):
+        """
+        Returns the fraction of lookups answered by the cache.
+
+        Returns:
+            FLOAT
+                A number between 0 and 1
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def clear(self):
+        """ Removes every entry and resets the counters. """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.disk_keys.clear()
+        self.disk_hits = 0
+        self.used_disk_keys.clear()
+        self.collected_keys.clear()
+        self.collected_disk_hits = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        msg = "Entries: " + str(len(self.entries)) + "/" + str(self.max_size) + "\n"
+        msg += "Hits: " + str(self.hits) + "\n"
+        msg += "Misses: " + str(self.misses) + "\n"
+        msg += "Served From Disk: " + str(self.disk_hits) + "\n"
+        msg += "Hit Rate: " + "{:.3f}".format(self.hit_rate())
+        return msg
+
+
+# FUNCTION: dataset_fingerprint
+def dataset_fingerprint(rep):
+    """
+    Returns a fingerprint of the replicates, so scores computed for one dataset are never used for another one. Every
+    replicate is hashed on its own and the digests are combined with the shape of the data. The fingerprint of some
+    'SufficientStatistics' was computed in the same way while the replicates were streamed, over the chunks
+    transformed by the stream (see 'sufficient_statistics_creator').
+
+    Args:
+        rep : LIST[rep1, rep2, rep3, ...] or SufficientStatistics
+            A repN is a biological data used to calc the likelihood result
+
+    Returns:
+        STRING
+            A hexadecimal digest identifying the data
+    """
+    if isinstance(rep, SufficientStatistics):
+        return rep.get_fingerprint()
+    digests = []
+    for replicate in rep:
+        data = np.ascontiguousarray(replicate, dtype=np.float64)
+        digests.append(hashlib.sha1(data.tobytes()).hexdigest())
+    shape = np.shape(rep[0])
+    header = str(len(rep)) + "x" + str(shape[0]) + "x" + str(shape[1])
+    return hashlib.sha1((header + ":" + ",".join(digests)).encode()).hexdigest()
@@ -0,0 +1,214 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from itertools import combinations
+from math import comb
+from multiprocessing import Pool
+import numpy as np
+import os
+
+# The scoring plan used by the worker processes of 'family_score_table_creator'
+_worker_scoring_plan = None
+
+
+# CLASS: FamilyScoreTable
+class FamilyScoreTable:
+    """
+    The score of every admissible family (a child with at most 'max_parents' parents) of a dataset and a paradigm,
+    stored in a memory-mapped binary file. A family is found by its combinatorial-number-system index, see
+    'family_index', so scoring a DAG is reduced to one table lookup per node.
+
+    Args:
+        scores : np.memmap
+            The score of every family, ordered by the family index
+        num_genes : INT
+            The amount of genes for each chromosome
+        max_parents : INT
+            The maximum number of parents of a family in the table
+        path : STRING
+            The file where the table is stored
+
+    Attributes:
+        scores : np.memmap
+            The score of every family, ordered by the family index
+        num_genes : INT
+            The amount of genes for each chromosome
+        max_parents : INT
+            The maximum number of parents of a family in the table
+        path : STRING
+            The file where the table is stored
+    """
+    # CONSTRUCTOR
+    def __init__(self, scores, num_genes, max_parents, path):
+        self.scores = scores
+        self.num_genes = num_genes
+        self.max_parents = max_parents
+        self.path = path
+
+    # ACCESSOR METHODS
+    def get_num_genes(self):
+        return self.num_genes
+
+    def get_max_parents(self):
+        return self.max_parents
+
+    def get_path(self):
+        return self.path
+
+    # METHODS
+    def lookup(self, child, parents):
+        """
+        Returns the score of a family.
+
+        Args:
+            child : INT
+                The node whose family is being scored
+            parents : LIST[INT, INT, ...]
+                The parents of the child, at most 'max_parents'
+
+        Returns:
+            FLOAT
+                The log likelihood contribution of the family
+        """
+        return float(self.scores[family_index(child, parents, self.num_genes, self.max_parents)])
+
+    def __len__(self):
+        return len(self.scores)
+
+
+# FUNCTION: num_families
+def num_families(num_genes, max_parents):
+    """
+    Returns the number of admissible families: n * sum(C(n-1, k)) for k = 0 .. max_parents.
+
+    Args:
+        num_genes : INT
+            The amount of genes for each chromosome
+        max_parents : INT
+            The maximum number of parents of a family
+
+    Returns:
+        INT
+            The number of families
+    """
+    return num_genes * sum(comb(num_genes-1, k) for k in range(0, max_parents+1))
+
+
+# FUNCTION: family_index
+def family_index(child, parents, num_genes, max_parents):
+    """
+    Returns the position of a family in the table. The families of every child take a contiguous block, inside the
+    block the parent sets are ordered by their number of parents, and the parent sets of the same size are ranked by
+    the combinatorial number system: sum(C(c_i, i+1)) where c_1 < c_2 < ... are the parents renumbered without the
+    child.
+
+    Args:
+        child : INT
+            The node whose family is being scored
+        parents : LIST[INT, INT, ...]
+            The parents of the child, at most 'max_parents'
+        num_genes : INT
+            The amount of genes for each chromosome
+        max_parents : INT
+            The maximum number of parents of a family in the table
+
+    Returns:
+        INT
+            The index of the family
+    """
+    per_child = sum(comb(num_genes-1, k) for k in range(0, max_parents+1))
+    offset = sum(comb(num_genes-1, k) for k in range(0, len(parents)))
+    renumbered = sorted(parent if parent < child else parent-1 for parent in parents)
+    rank = 0
+    for i in range(0, len(renumbered)):
+        rank += comb(renumbered[i], i+1)
+    return child*per_child + offset + rank
+
+
+# FUNCTION: child_families
+def child_families(child, num_genes, max_parents):
+    """
+    Lists every admissible family of a child together with its index in the table.
+
+    Args:
+        child : INT
+            The node whose families are listed
+        num_genes : INT
+            The amount of genes for each chromosome
+        max_parents : INT
+            The maximum number of parents of a family
+
+    Returns:
+        TUPLE(LIST[INT, ...], LIST[TUPLE(INT, TUPLE(INT, ...)), ...])
+            The indexes and the families, as (child, parents)
+    """
+    candidates = [node for node in range(0, num_genes) if node != child]
+    indexes = []
+    families = []
+    for k in range(0, max_parents+1):
+        for parents in combinations(candidates, k):
+            indexes.append(family_index(child, parents, num_genes, max_parents))
+            families.append((child, parents))
+    return indexes, families
+
+
+# FUNCTION: _worker_initializer
+def _worker_initializer(scoring_plan):
+    global _worker_scoring_plan
+    _worker_scoring_plan = scoring_plan
+
+
+# FUNCTION: _worker_score_child
+def _worker_score_child(task):
+    child, num_genes, max_parents = task
+    indexes, families = child_families(child, num_genes, max_parents)
+    return indexes, _worker_scoring_plan.score_families(families)
+
+
+# FUNCTION: family_score_table_creator
+def family_score_table_creator(scoring_plan, likelihood_function, fingerprint, directory, max_parents=3,
+                               num_workers=None):
+    """
+    Returns the family score table of a dataset and a paradigm. If the file of the table already exists in the
+    directory it is only opened; otherwise every admissible family is scored, one child per task in a pool of worker
+    processes, and the table is written to a new file.
+
+    Args:
+        scoring_plan : ScoringPlan
+            The scoring plan of the replicates for the paradigm, see 'scoring_plan_creator'
+        likelihood_function : INT
+            Indicates the likelihood function that is going to be used
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+        fingerprint : STRING
+            The fingerprint of the replicates, see 'dataset_fingerprint'
+        directory : STRING
+            The folder where the tables are stored
+        max_parents : INT
+            The maximum number of parents of a family
+        num_workers : INT
+            The number of worker processes, by default the number of CPUs
+
+    Returns:
+        FamilyScoreTable
+            The table of the dataset and the paradigm
+    """
+    num_genes = scoring_plan.get_num_genes()
+    size = num_families(num_genes, max_parents)
+    path = os.path.join(directory, fingerprint + "-" + str(likelihood_function) + "-" + str(max_parents) + ".scores")
+
+    if not (os.path.exists(path) and os.path.getsize(path) == size*np.dtype(np.float64).itemsize):
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        temporary_path = path + "." + str(os.getpid()) + ".tmp"
+        scores = np.memmap(temporary_path, dtype=np.float64, mode="w+", shape=(size,))
+        tasks = [(child, num_genes, max_parents) for child in range(0, num_genes)]
+        with Pool(num_workers, initializer=_worker_initializer, initargs=(scoring_plan,)) as pool:
+            for indexes, child_scores in pool.imap_unordered(_worker_score_child, tasks):
+                scores[indexes] = child_scores
+        scores.flush()
+        del scores
+        os.replace(temporary_path, path)
+
+    return FamilyScoreTable(np.memmap(path, dtype=np.float64, mode="r", shape=(size,)), num_genes, max_parents, path)
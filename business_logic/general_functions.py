@@ -1,14 +1,41 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: January, 2016.
-# Updated at: May, 2016.
+# Updated at: October, 2026.
 
 # LIBRARIES
-import bigfloat as bf
+from business_logic.chromosome import Chromosome
+from business_logic.equivalence_functions import canonical_dag_creator, equivalence_key
+from business_logic.family_score_cache import FamilyScoreCache, dataset_fingerprint
+from business_logic.family_score_table import family_score_table_creator
+from business_logic.scoring_plan import scoring_plan_creator, parent_sets_extractor
 from business_logic.log_pnml_functions import *
+from business_logic.parallel_scoring import ScoringPool
+from business_logic.population import Population
+from scipy.special import logsumexp
+import math
 import networkx as nx
 import numpy as np
 import sys
 
+# The family scores shared by every call to 'likelihood_result_calculator'
+family_score_cache = FamilyScoreCache()
+
+# The fingerprints of the replicates already used, keyed by their id (the replicates are kept, so no other data can
+# take their id)
+dataset_fingerprints = {}
+
+# The scoring plans of every dataset and paradigm already used, keyed by (paradigm, dataset fingerprint)
+scoring_plans = {}
+
+# The pools of worker processes started by 'scoring_pool_starter', keyed by (paradigm, dataset fingerprint)
+scoring_pools = {}
+
+# The exhaustive family score tables loaded by 'family_score_table_loader', keyed by (paradigm, dataset fingerprint)
+family_score_tables = {}
+
+# The likelihood results of the equivalence classes already scored, keyed by (paradigm, dataset fingerprint, CPDAG)
+equivalence_score_cache = FamilyScoreCache()
+
 
 # =================
 # GENERAL FUNCTIONS
@@ -22,7 +49,8 @@ def filter_likelihood_selection(num):
     Args:
         num : INT
             A number representing the desired likelihood function to use:
-                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two, n = not valid type
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two, n > 3 = next step with lag n-1,
+                n < 1 = not valid type
     """
     if num == 1:
         print("* LIKELIHOOD FUNCTION: Cotemporal")
@@ -30,6 +58,8 @@ def filter_likelihood_selection(num):
         print("* LIKELIHOOD FUNCTION: Next-Step One")
     elif num == 3:
         print("* LIKELIHOOD FUNCTION: Next-Step One-Two")
+    elif num > 3:
+        print("* LIKELIHOOD FUNCTION: Next-Step Lag " + str(num-1))
     else:
         sys.exit("ERROR: You need to select a valid likelihood function type.")
 
@@ -48,55 +78,373 @@ def view_population(population):
 
 
 # FUNCTION: likelihood_result_calculator
-def likelihood_result_calculator(population, likelihood_function, rep):
-    """
-    Given a population and the replicates, it adds the likelihood result to every chromosome.
+def likelihood_result_calculator(population, likelihood_function, rep, score_cache=None, by_equivalence=False):
+    """
+    Given a population and the replicates, it adds the likelihood result to every chromosome. The likelihood is the
+    sum of the scores of every family (a child and its parents) of the DAG. A chromosome that already carries its
+    family scores only gets the families of its changed columns scored again, and its likelihood result is updated
+    by the difference; if no column changed (an elite, an offspring of a crossover that didn't happen, a chromosome
+    that was not mutated nor repaired) the chromosome is not evaluated at all. If a family score table was loaded for
+    the data and the paradigm (see 'family_score_table_loader'), the families are read from it. Otherwise every
+    family is first looked up in a 'FamilyScoreCache'; the families that are not found are collected for the whole
+    population and scored together by the scoring plan of the data and the paradigm, or sharded between the worker
+    processes of its 'ScoringPool' if one was started (see 'scoring_pool_starter').
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
+            A list filled with 'Chromosome' objects
+        likelihood_function: INT
+            Indicates the likelihood function that is going to be used
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        score_cache : FamilyScoreCache
+            The cache of family scores, the module cache 'family_score_cache' is used by default
+        by_equivalence : BOOLEAN
+            True for giving every chromosome the likelihood result of its equivalence class, see
+            'equivalence_likelihood_calculator'
+
+    Returns:
+        INT
+            The number of chromosomes that were evaluated
+    """
+    if score_cache is None:
+        score_cache = family_score_cache
+    if by_equivalence:
+        return equivalence_likelihood_calculator(population, likelihood_function, rep, score_cache)
+    fingerprint = find_dataset_fingerprint(rep)
+    scoring_plan = find_scoring_plan(rep, likelihood_function, fingerprint)
+    score_table = family_score_tables.get((likelihood_function, fingerprint))
+
+    # 0) only the chromosomes that were never evaluated, that changed since their last evaluation or whose likelihood
+    # result is missing or not finite are evaluated
+    evaluated = [i for i in range(0, len(population))
+                 if population[i].get_family_scores() is None or population[i].get_changed_columns()
+                 or not finite_likelihood(population[i])]
+    if not evaluated:
+        return 0
+
+    # 1) lookup of every family that must be scored, keeping the ones that are not in the cache
+    pending_families = []
+    unscored_families = {}
+    if isinstance(population, Population):
+        population_parent_sets = parent_sets_extractor(population.get_genes()[evaluated])
+    else:
+        population_parent_sets = parent_sets_extractor([population[i].get_genes() for i in evaluated])
+    for k, i in enumerate(evaluated):
+        parent_sets = population_parent_sets[k]
+        if population[i].get_family_scores() is None:
+            columns = range(0, len(parent_sets))
+        else:
+            columns = sorted(population[i].get_changed_columns())
+        family_scores = {}
+        for child in columns:
+            parents = parent_sets[child]
+            key = score_cache.family_key(likelihood_function, fingerprint, child, parents)
+            if score_table is not None and len(parents) <= score_table.get_max_parents():
+                score = score_table.lookup(child, parents)
+            else:
+                score = score_cache.get(key)
+            if score is None:
+                unscored_families[key] = (child, parents)
+            family_scores[child] = (key, score)
+        pending_families.append(family_scores)
+
+    # 2) scoring of the unscored families in one batch
+    keys = list(unscored_families.keys())
+    scorer = scoring_pools.get((likelihood_function, fingerprint), scoring_plan)
+    scores = scorer.score_families([unscored_families[key] for key in keys])
+    new_scores = {}
+    for key, score in zip(keys, scores.tolist()):
+        score_cache.put(key, score)
+        new_scores[key] = score
+
+    # 3) likelihood result of every evaluated chromosome, as a full sum or as a difference over the changed families.
+    # The difference of two infinite scores (a singular family) is NaN, so then the families are summed again, as they
+    # are when the stored likelihood result is missing or not finite.
+    for k, i in enumerate(evaluated):
+        family_scores = population[i].get_family_scores()
+        if family_scores is None:
+            family_scores = [0.0] * len(pending_families[k])
+            log_likelihood_result = -1.0
+        else:
+            family_scores = list(family_scores)
+            log_likelihood_result = population[i].get_log_likelihood_result()
+        summed = log_likelihood_result is None or not math.isfinite(log_likelihood_result)
+        for child, (key, score) in pending_families[k].items():
+            if score is None:
+                score = new_scores[key]
+            if not summed and math.isfinite(score) and math.isfinite(family_scores[child]):
+                log_likelihood_result += score - family_scores[child]
+            else:
+                summed = True
+            family_scores[child] = score
+        if summed:
+            log_likelihood_result = float(sum(family_scores)) - 1.0
+        population[i].set_family_scores(family_scores)
+        population[i].set_log_likelihood_result(log_likelihood_result)
+    return len(evaluated)
+
+
+# FUNCTION: equivalence_likelihood_calculator
+def equivalence_likelihood_calculator(population, likelihood_function, rep, score_cache=None):
+    """
+    Given a population and the replicates, it adds to every chromosome the likelihood result of its Markov equivalence
+    class: the likelihood result of the canonical DAG of its CPDAG (see 'canonical_dag_creator'). Every class is scored
+    only once and kept in the module cache 'equivalence_score_cache', so the DAGs of the same class always get the
+    same value. The Patton-Norris likelihoods are not score equivalent (two equivalent DAGs can have different
+    likelihoods), so this is meant for the cotemporal paradigm, where the models only keep the skeleton and the
+    v-structures of the DAGs. The chromosomes that already have a likelihood result and did not change since then
+    keep it, and only the classes of the other ones are looked up.
+
+    Args:
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
         likelihood_function: INT
             Indicates the likelihood function that is going to be used
                 1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
         rep : LIST[rep1, rep2, rep3, ...]
             A repN is a biological data used to calc the likelihood result
+        score_cache : FamilyScoreCache
+            The cache of family scores used for the canonical DAGs
+
+    Returns:
+        INT
+            The number of chromosomes that were evaluated
+    """
+    fingerprint = find_dataset_fingerprint(rep)
+    evaluated = [i for i in range(0, len(population))
+                 if not finite_likelihood(population[i]) or population[i].get_changed_columns()]
+    keys = [(likelihood_function, fingerprint, equivalence_key(population[i])) for i in evaluated]
+    class_scores = {}
+    canonical_dags = {}
+    for key in keys:
+        if key in class_scores or key in canonical_dags:
+            continue
+        score = equivalence_score_cache.get(key)
+        if score is None:
+            canonical_dags[key] = Chromosome.from_columns(canonical_dag_creator(key[2]))
+        else:
+            class_scores[key] = score
+    likelihood_result_calculator(list(canonical_dags.values()), likelihood_function, rep, score_cache)
+    for key, canonical_dag in canonical_dags.items():
+        class_scores[key] = canonical_dag.get_log_likelihood_result()
+        equivalence_score_cache.put(key, class_scores[key])
+
+    for k, i in enumerate(evaluated):
+        population[i].set_family_scores(None)
+        population[i].set_log_likelihood_result(class_scores[keys[k]])
+    return len(evaluated)
+
+
+# FUNCTION: finite_likelihood
+def finite_likelihood(chromosome):
+    """
+    Returns True if a chromosome has a finite likelihood result, so it can be updated by a difference of scores.
+
+    Args:
+        chromosome : Chromosome
+            An object 'Chromosome'
+
+    Returns:
+        BOOLEAN
+            False if the likelihood result is None, NaN or infinite
     """
-    if likelihood_function == 1:
-        for i in range(0, len(population)):
-            di_graph = convert_matrix_to_digraph(population[i].get_genes())
-            population[i].set_log_likelihood_result(log_pnml_cotemporal(di_graph, rep))
-    elif likelihood_function == 2:
-        for i in range(0, len(population)):
-            di_graph = convert_matrix_to_digraph(population[i].get_genes())
-            population[i].set_log_likelihood_result(log_pnml_next_step_one(di_graph, rep))
-    elif likelihood_function == 3:
-        for i in range(0, len(population)):
-            di_graph = convert_matrix_to_digraph(population[i].get_genes())
-            population[i].set_log_likelihood_result(log_pnml_next_step_one_two(di_graph, rep))
+    log_likelihood_result = chromosome.get_log_likelihood_result()
+    return log_likelihood_result is not None and math.isfinite(log_likelihood_result)
+
+
+# FUNCTION: find_dataset_fingerprint
+def find_dataset_fingerprint(rep):
+    """
+    Returns the fingerprint of the replicates (see 'dataset_fingerprint'), hashing them only the first time they are
+    used, so the data is not hashed again at every generation. The replicates must not be changed once they are used.
+
+    Args:
+        rep : LIST[rep1, rep2, rep3, ...] or SufficientStatistics
+            A repN is a biological data used to calc the likelihood result
+
+    Returns:
+        STRING
+            A hexadecimal digest identifying the data
+    """
+    if id(rep) not in dataset_fingerprints:
+        dataset_fingerprints[id(rep)] = (rep, dataset_fingerprint(rep))
+    return dataset_fingerprints[id(rep)][1]
+
+
+# FUNCTION: find_scoring_plan
+def find_scoring_plan(rep, likelihood_function, fingerprint):
+    """
+    Returns the scoring plan of the replicates for a paradigm, building it only the first time it is needed.
+
+    Args:
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        likelihood_function: INT
+            Indicates the likelihood function that is going to be used
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+        fingerprint : STRING
+            The fingerprint of the replicates, see 'dataset_fingerprint'
+
+    Returns:
+        ScoringPlan
+            The scoring plan of the replicates for the paradigm
+    """
+    key = (likelihood_function, fingerprint)
+    if key not in scoring_plans:
+        scoring_plans[key] = scoring_plan_creator(rep, paradigm_lag(likelihood_function))
+    return scoring_plans[key]
+
+
+# FUNCTION: scoring_pool_starter
+def scoring_pool_starter(rep, likelihood_function, num_workers=None):
+    """
+    Starts a persistent pool of worker processes for the replicates and a paradigm, with the Gram tensors of its
+    scoring plan in shared memory (see 'ScoringPool'). Until 'scoring_pools_closer' is called, every batch of
+    families scored by 'likelihood_result_calculator' for the data and the paradigm is sharded between the workers.
+
+    Args:
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        likelihood_function: INT
+            Indicates the likelihood function that is going to be used
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+        num_workers : INT
+            The number of worker processes, by default the number of CPUs
+
+    Returns:
+        ScoringPool
+            The pool of the replicates for the paradigm
+    """
+    fingerprint = find_dataset_fingerprint(rep)
+    key = (likelihood_function, fingerprint)
+    if key not in scoring_pools:
+        scoring_pools[key] = ScoringPool(find_scoring_plan(rep, likelihood_function, fingerprint), num_workers)
+    return scoring_pools[key]
+
+
+# FUNCTION: scoring_pools_closer
+def scoring_pools_closer():
+    """ Stops the worker processes of every pool started by 'scoring_pool_starter' and releases their memory. """
+    for scoring_pool in scoring_pools.values():
+        scoring_pool.close()
+    scoring_pools.clear()
+
+
+# FUNCTION: family_score_table_loader
+def family_score_table_loader(rep, likelihood_function, directory, max_parents=3, num_workers=None):
+    """
+    Loads the exhaustive family score table of the replicates for a paradigm, precomputing it if it was not stored
+    in the directory by a previous run, and makes 'likelihood_result_calculator' read the family scores from it.
+
+    Args:
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        likelihood_function: INT
+            Indicates the likelihood function that is going to be used
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+        directory : STRING
+            The folder where the tables are stored
+        max_parents : INT
+            The maximum number of parents of a family
+        num_workers : INT
+            The number of worker processes used by the precomputation, by default the number of CPUs
+
+    Returns:
+        FamilyScoreTable
+            The loaded table
+    """
+    fingerprint = find_dataset_fingerprint(rep)
+    scoring_plan = find_scoring_plan(rep, likelihood_function, fingerprint)
+    score_table = family_score_table_creator(scoring_plan, likelihood_function, fingerprint, directory, max_parents,
+                                             num_workers)
+    family_score_tables[(likelihood_function, fingerprint)] = score_table
+    return score_table
 
 
 # FUNCTION: relative_likelihood_result_sorting
 def relative_likelihood_result_sorting(population):
     """
-    Sorts a population given, in descending order, based on the relative likelihood result of every chromosome.
+    Sorts a population given, in descending order, based on the relative likelihood result of every chromosome. The
+    order is found with a stable 'argsort', so chromosomes with the same value keep their order.
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
+            A list filled with 'Chromosome' objects
+    """
+    order = np.argsort(-population_values(population, "relative_likelihood_result"), kind="stable")
+    if isinstance(population, Population):
+        population.reorder(order)
+    else:
+        population[:] = [population[i] for i in order.tolist()]
+
+
+# FUNCTION: population_values
+def population_values(population, attribute):
+    """
+    An auxiliary function that returns a value of every chromosome of a population as an array. The arrays of a
+    'Population' are returned directly (not copied).
+
+    Args:
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
+        attribute : STRING
+            'log_likelihood_result', 'relative_likelihood_result' or 'fitness'
+
+    Returns:
+        ARRAY(FLOAT64)
+            The value of every chromosome, in the order of the population
     """
-    population.sort(key=lambda x: x.relative_likelihood_result, reverse=True)
+    if isinstance(population, Population):
+        arrays = {"log_likelihood_result": population.get_log_likelihood_results(),
+                  "relative_likelihood_result": population.get_relative_likelihood_results(),
+                  "fitness": population.get_fitness()}
+        return arrays[attribute]
+    return np.array([getattr(chromosome, attribute) for chromosome in population], dtype=np.float64)
 
 
 # FUNCTION: relative_likelihood_result_calculator
-def relative_likelihood_result_calculator(population):
+def relative_likelihood_result_calculator(population, use_bigfloat=False):
     """
     Given a population, this function calculates the relative likelihood result (it is a way to make
-    the likelihood result bigger) to every chromosome.
+    the likelihood result bigger) to every chromosome: exp(likelihood result) divided by the sum of exp(likelihood
+    result) over the population. It is calculated for the whole population at once as exp(ll - logsumexp(ll)) in
+    float64, which never overflows nor underflows the sum because the biggest likelihood result is subtracted before
+    the exponentiation. With 'use_bigfloat' the old calculation in quadruple precision is done instead, as a
+    reference (it needs the 'bigfloat' library).
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
+        use_bigfloat : BOOLEAN
+            True for calculating every value with 'bigfloat' in quadruple precision
+    """
+    if len(population) == 0:
+        return
+    if use_bigfloat:
+        bigfloat_relative_likelihood_calculator(population)
+        return
+    log_likelihood_results = population_values(population, "log_likelihood_result")
+    relative_likelihood_results = np.exp(log_likelihood_results - logsumexp(log_likelihood_results))
+    if isinstance(population, Population):
+        population.get_relative_likelihood_results()[:] = relative_likelihood_results
+    else:
+        for chromosome, value in zip(population, relative_likelihood_results.tolist()):
+            chromosome.set_relative_likelihood_result(value)
+
+
+# FUNCTION: bigfloat_relative_likelihood_calculator
+def bigfloat_relative_likelihood_calculator(population):
     """
+    Calculates the relative likelihood result of every chromosome in quadruple precision with the 'bigfloat' library,
+    the reference for 'relative_likelihood_result_calculator'.
+
+    Args:
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
+            A list filled with 'Chromosome' objects
+    """
+    import bigfloat as bf
     with bf.quadruple_precision:
         total = sum_likelihood_result(population)
         for i in range(0, len(population)):
@@ -107,16 +455,18 @@ def relative_likelihood_result_calculator(population):
 # FUNCTION: sum_likelihood_result
 def sum_likelihood_result(population):
     """
-    Sums all the likelihood results values on a population.
+    Sums the exponentials of all the likelihood results values on a population, in quadruple precision with the
+    'bigfloat' library.
 
     Args:
         population : LIST[Chromosome(), Chromosome(), ...]
             A list filled with 'Chromosome' objects
 
     Returns:
-        INT
+        BigFloat
             The sum of all likelihood results on a population
     """
+    import bigfloat as bf
     with bf.quadruple_precision:
         total = bf.BigFloat("0.0")
         for i in range(0, len(population)):
@@ -200,48 +550,44 @@ def extract_column(matrix, column_number):
 
 
 # FUNCTION: select_uniques_chromosomes
-def select_uniques_chromosomes(population):
+def select_uniques_chromosomes(population, by_score=False, by_equivalence=False):
     """
-    Returns a filtered population with only unique elements. The comparison criteria is the 'relative likelihood
-    result'.
+    Returns a filtered population with only unique elements, keeping the first chromosome of every group of equal
+    ones. The comparison criteria is the genes: every chromosome is keyed by its structural key (the genes packed by
+    column) and the keys already seen are kept in a set, so the population is filtered in linear time and different
+    DAGs are never merged. With 'by_score' the comparison criteria is the 'relative likelihood result', as in the
+    first versions of the SGA, and with 'by_equivalence' it is the Markov equivalence class (see 'equivalence_key').
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
+        by_score : BOOLEAN
+            True for comparing the chromosomes by their relative likelihood result instead of their genes
+        by_equivalence : BOOLEAN
+            True for comparing the chromosomes by their CPDAG instead of their genes
 
     Returns:
         LIST[Chromosome(), Chromosome(), ...]
             A new list filled with 'Chromosome' objects
     """
+    if by_score:
+        keys = [chromosome.get_relative_likelihood_result() for chromosome in population]
+    elif by_equivalence:
+        keys = [equivalence_key(chromosome) for chromosome in population]
+    elif isinstance(population, Population):
+        keys = population.structural_keys()
+    else:
+        keys = [chromosome.structural_key() for chromosome in population]
+
     unique_population = []
-    for i in range(0, len(population)):
-        if find_element_on_list(population[i].get_relative_likelihood_result(), unique_population):
+    seen_keys = set()
+    for i in range(0, len(keys)):
+        if keys[i] not in seen_keys:
+            seen_keys.add(keys[i])
             unique_population.append(population[i])
     return unique_population
 
 
-# FUNCTION: find_element_on_list
-def find_element_on_list(relative_likelihood_result, unique_population):
-    """
-    An auxiliary function that returns a boolean value if the element exists on the 'unique_population' parameter.
-
-    Args:
-        relative_likelihood_result : FLOAT
-            A number representing the value of certain chromosome's relative likelihood result
-        unique_population: LIST[Chromosome(), Chromosome(), ...]
-            A list filled with 'Chromosome' objects where each one is unique
-
-    Returns:
-        BOOLEAN
-            True it the value is found or False if not
-    """
-    for i in range(0, len(unique_population)):
-        # based on the 'relative likelihood  result'
-        if relative_likelihood_result == unique_population[i].get_relative_likelihood_result():
-            return False
-    return True
-
-
 # FUNCTION: view_model
 def view_model(model, model_title):
     """
@@ -295,17 +641,14 @@ def fitness_average(population):
     Given a population, it calculates the average of the fitness value.
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
 
     Returns:
         FLOAT
             The average of the fitness value in the population
     """
-    fitness_avg = 0
-    for item in population:
-        fitness_avg += item.get_fitness()
-    return fitness_avg/len(population)
+    return float(np.mean(population_values(population, "fitness")))
 
 
 # FUNCTION: fitness_variance
@@ -314,18 +657,14 @@ def fitness_variance(population):
     Given a population, it calculates the variance of the fitness value.
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
 
     Returns:
         FLOAT
             The variance of the fitness value in the population
     """
-    fitness_avg = fitness_average(population)
-    fitness_var = 0
-    for i in range(0, len(population)):
-        fitness_var += (population[i].get_fitness()-fitness_avg)**2
-    return fitness_var/len(population)
+    return float(np.var(population_values(population, "fitness")))
 
 
 # FUNCTION: rlr_average
@@ -334,17 +673,14 @@ def rlr_average(population):
     Given a population, it calculates the average of the relative likelihood result.
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
 
     Returns:
         FLOAT
             The average of the relative likelihood result in the population
     """
-    rlr_avg = 0
-    for item in population:
-        rlr_avg += item.get_relative_likelihood_result()
-    return rlr_avg/len(population)
+    return float(np.mean(population_values(population, "relative_likelihood_result")))
 
 
 # FUNCTION: rlr_variance
@@ -353,18 +689,14 @@ def rlr_variance(population):
     Given a population, it calculates the variance of the relative likelihood result.
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
 
     Returns:
         FLOAT
             The variance of the relative likelihood result in the population
     """
-    rlr_avg = rlr_average(population)
-    rlr_var = 0
-    for i in range(0, len(population)):
-        rlr_var += (population[i].get_relative_likelihood_result()-rlr_avg)**2
-    return rlr_var/len(population)
+    return float(np.var(population_values(population, "relative_likelihood_result")))
 
 
 # FUNCTION: sum_matrix
@@ -0,0 +1,348 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+import hashlib
+import numpy as np
+
+
+# CLASS: GramTensors
+class GramTensors:
+    """
+    The products of the replicates needed by the Patton-Norris likelihood, computed once for every gene. Every matrix
+    used by a family term is a submatrix of these tensors, so a family can be scored by indexing them, with a cost
+    that does not depend on the number of time points.
+
+    Args:
+        child_gram : ARRAY(r, n, n)
+            The Gram matrix of the child rows of every replicate
+        parent_gram : ARRAY(r, n, n)
+            The Gram matrix of the parent rows of every replicate
+        cross_gram : ARRAY(r, n, n)
+            The product of the parent rows (transposed) by the child rows of every replicate
+        avg_parent_gram : ARRAY(n, n)
+            The Gram matrix of the parent rows averaged over the replicates
+        num_obs : INT
+            The number of observations per replicate used by the paradigm
+
+    Attributes:
+        child_gram : ARRAY(r, n, n)
+            The Gram matrix of the child rows of every replicate
+        parent_gram : ARRAY(r, n, n)
+            The Gram matrix of the parent rows of every replicate
+        cross_gram : ARRAY(r, n, n)
+            The product of the parent rows (transposed) by the child rows of every replicate
+        avg_parent_gram : ARRAY(n, n)
+            The Gram matrix of the parent rows averaged over the replicates
+        num_reps : INT
+            The number of replicates
+        num_obs : INT
+            The number of observations per replicate used by the paradigm
+    """
+    # CONSTRUCTOR
+    def __init__(self, child_gram, parent_gram, cross_gram, avg_parent_gram, num_obs):
+        self.child_gram = child_gram
+        self.parent_gram = parent_gram
+        self.cross_gram = cross_gram
+        self.avg_parent_gram = avg_parent_gram
+        self.num_reps = len(child_gram)
+        self.num_obs = num_obs
+
+    # ACCESSOR METHODS
+    def get_num_reps(self):
+        return self.num_reps
+
+    def get_num_obs(self):
+        return self.num_obs
+
+    def get_num_genes(self):
+        return self.avg_parent_gram.shape[0]
+
+
+# FUNCTION: lag_slices
+def lag_slices(lag, t):
+    """
+    Returns the rows of every replicate used for the child data and for the parent data, together with the number
+    of observations per replicate that the Patton-Norris formula uses for a time lag. The cotemporal paradigm (lag 0)
+    uses every time point; a lag L > 0 pairs the child rows L .. t-2 with the parent rows 0 .. t-L-2 and counts t-L
+    observations, as the 'next step one' (L = 1) and 'next step one-two' (L = 2) paradigms always did.
+
+    Args:
+        lag : INT
+            The number of time points between the parent data and the child data
+        t : INT
+            The number of time points of every replicate
+
+    Returns:
+        TUPLE(slice, slice, INT)
+            The child rows, the parent rows and the number of observations
+    """
+    if lag == 0:
+        return slice(0, t), slice(0, t), t
+    if lag < 0 or lag > t-2:
+        raise ValueError("Not a valid time lag for " + str(t) + " time points: " + str(lag))
+    return slice(lag, t-1), slice(0, t-1-lag), t-lag
+
+
+# FUNCTION: gram_tensors_creator
+def gram_tensors_creator(rep, lag):
+    """
+    Computes the Gram tensors of the replicates for a time lag.
+
+    Args:
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        lag : INT
+            The number of time points between the parent data and the child data, 0 for the cotemporal paradigm
+
+    Returns:
+        GramTensors
+            The products of the replicates for the lag
+    """
+    data = np.asarray([np.asarray(replicate, dtype=np.float64) for replicate in rep])
+    child_rows, parent_rows, num_obs = lag_slices(lag, data.shape[1])
+    child_data = data[:, child_rows, :]
+    parent_data = data[:, parent_rows, :]
+    avg_parent_data = parent_data.mean(axis=0)
+
+    child_gram = np.matmul(np.transpose(child_data, (0, 2, 1)), child_data)
+    parent_gram = np.matmul(np.transpose(parent_data, (0, 2, 1)), parent_data)
+    cross_gram = np.matmul(np.transpose(parent_data, (0, 2, 1)), child_data)
+    avg_parent_gram = np.dot(avg_parent_data.T, avg_parent_data)
+    return GramTensors(child_gram, parent_gram, cross_gram, avg_parent_gram, num_obs)
+
+
+# CLASS: GramAccumulator
+class GramAccumulator:
+    """
+    Accumulates the Gram tensors of a time lag from the replicates read in row chunks, so the whole series never has
+    to be in memory. The last 'lag'+1 rows of every chunk are carried to the next one, because they are still needed
+    as parent rows (and the very last row of the series is not a child row when the lag is bigger than 0).
+
+    Args:
+        lag : INT
+            The number of time points between the parent data and the child data
+        num_reps : INT
+            The number of replicates
+        num_genes : INT
+            The number of genes (columns) of every replicate
+
+    Attributes:
+        lag : INT
+            The number of time points between the parent data and the child data
+        carry : ARRAY(r, lag+1, n)
+            The last rows read, that are still needed by the next chunk
+        child_gram, parent_gram, cross_gram : ARRAY(r, n, n)
+            The partial sums of the Gram tensors of every replicate
+        avg_parent_gram : ARRAY(n, n)
+            The partial sum of the Gram matrix of the parent rows averaged over the replicates
+    """
+    # CONSTRUCTOR
+    def __init__(self, lag, num_reps, num_genes):
+        self.lag = lag
+        self.carry = np.zeros((num_reps, 0, num_genes))
+        self.child_gram = np.zeros((num_reps, num_genes, num_genes))
+        self.parent_gram = np.zeros((num_reps, num_genes, num_genes))
+        self.cross_gram = np.zeros((num_reps, num_genes, num_genes))
+        self.avg_parent_gram = np.zeros((num_genes, num_genes))
+
+    # METHODS
+    def update(self, block):
+        """
+        Adds the rows of a chunk of every replicate.
+
+        Args:
+            block : ARRAY(r, m, n)
+                The next 'm' time points of every replicate
+        """
+        data = np.concatenate((self.carry, block), axis=1)
+        stop = data.shape[1]-1  # the last row is held back until it is known if it is the last of the series
+        if stop > self.lag:
+            self.add_rows(data[:, self.lag:stop, :], data[:, 0:stop-self.lag, :])
+        self.carry = data[:, -(self.lag+1):, :]
+
+    def add_rows(self, child_data, parent_data):
+        """
+        Adds the products of paired child and parent rows to the partial sums.
+
+        Args:
+            child_data : ARRAY(r, m, n)
+                The child rows of every replicate
+            parent_data : ARRAY(r, m, n)
+                The parent rows of every replicate, paired with the child rows
+        """
+        avg_parent_data = parent_data.mean(axis=0)
+        self.child_gram += np.matmul(np.transpose(child_data, (0, 2, 1)), child_data)
+        self.parent_gram += np.matmul(np.transpose(parent_data, (0, 2, 1)), parent_data)
+        self.cross_gram += np.matmul(np.transpose(parent_data, (0, 2, 1)), child_data)
+        self.avg_parent_gram += np.dot(avg_parent_data.T, avg_parent_data)
+
+    def finish(self, num_times):
+        """
+        Returns the Gram tensors once every chunk was added.
+
+        Args:
+            num_times : INT
+                The number of time points of every replicate
+
+        Returns:
+            GramTensors
+                The products of the replicates for the lag
+        """
+        num_obs = lag_slices(self.lag, num_times)[2]
+        if self.lag == 0 and self.carry.shape[1] > 0:
+            self.add_rows(self.carry[:, -1:, :], self.carry[:, -1:, :])
+        return GramTensors(self.child_gram, self.parent_gram, self.cross_gram, self.avg_parent_gram, num_obs)
+
+
+# CLASS: SufficientStatistics
+class SufficientStatistics:
+    """
+    Everything the likelihood needs from the replicates: the Gram tensors of the time lags that will be scored, plus
+    the shape of the data and its fingerprint. It can be passed everywhere the replicates 'rep' are expected by the
+    likelihood functions, so the raw series can be discarded once it was read.
+
+    Args:
+        gram_tensors : DICT{INT: GramTensors}
+            The Gram tensors of every accumulated time lag
+        num_times : INT
+            The number of time points of every replicate
+        fingerprint : STRING
+            The fingerprint of the transformed replicates, see 'dataset_fingerprint'
+
+    Attributes:
+        gram_tensors : DICT{INT: GramTensors}
+            The Gram tensors of every accumulated time lag
+        num_reps : INT
+            The number of replicates
+        num_times : INT
+            The number of time points of every replicate
+        num_genes : INT
+            The number of genes (columns) of every replicate
+        fingerprint : STRING
+            The fingerprint of the transformed replicates
+    """
+    # CONSTRUCTOR
+    def __init__(self, gram_tensors, num_times, fingerprint):
+        any_tensors = next(iter(gram_tensors.values()))
+        self.gram_tensors = gram_tensors
+        self.num_reps = any_tensors.get_num_reps()
+        self.num_times = num_times
+        self.num_genes = any_tensors.get_num_genes()
+        self.fingerprint = fingerprint
+
+    # ACCESSOR METHODS
+    def get_num_reps(self):
+        return self.num_reps
+
+    def get_num_times(self):
+        return self.num_times
+
+    def get_num_genes(self):
+        return self.num_genes
+
+    def get_fingerprint(self):
+        return self.fingerprint
+
+    def get_gram_tensors(self, lag):
+        if lag not in self.gram_tensors:
+            raise ValueError("The time lag " + str(lag) + " was not accumulated, the available lags are: " +
+                             str(sorted(self.gram_tensors.keys())))
+        return self.gram_tensors[lag]
+
+    def __len__(self):
+        return self.num_reps
+
+
+# FUNCTION: sufficient_statistics_creator
+def sufficient_statistics_creator(chunk_reader, lags, a_switch_log=False, a_switch_zscore=False):
+    """
+    Streams the replicates in row chunks and accumulates their sufficient statistics for some time lags. The
+    transforms of 'data_switcher' are applied to every chunk; the zscore transform needs a first pass over the data to
+    find the mean and the standard deviation of every column of every replicate.
+
+    The fingerprint is computed like 'dataset_fingerprint', over the transformed chunks. Without the zscore transform
+    it is the fingerprint of the same replicates transformed in memory by 'data_switcher'. The streamed zscore merges
+    the moments chunk by chunk, so its values can differ from the ones of 'data_switcher' in the last bits; then the
+    fingerprints differ, and a streamed run doesn't share the cached, tabled or stored scores of an in-memory run.
+
+    Args:
+        chunk_reader : FUNCTION
+            A function without arguments that returns a new iterator over the data; every item is a list with the
+            next rows of every replicate (the same number of rows for all of them)
+        lags : LIST[INT, INT, ...]
+            The time lags that will be scored, 0 for the cotemporal paradigm
+        a_switch_log : BOOLEAN
+            A flag value for the log() function
+        a_switch_zscore : BOOLEAN
+            A flag value for the zscore() function
+
+    Returns:
+        SufficientStatistics
+            The statistics of the transformed replicates
+    """
+    # 1st pass (zscore only): mean and sum of squared deviations of every column, merged chunk by chunk
+    if a_switch_zscore:
+        count = 0
+        mean = m2 = None
+        for chunks in chunk_reader():
+            block = chunk_block(chunks, a_switch_log)
+            block_mean = block.mean(axis=1)
+            block_m2 = np.sum((block - block_mean[:, None, :])**2, axis=1)
+            if mean is None:
+                count, mean, m2 = block.shape[1], block_mean, block_m2
+            else:
+                total = count + block.shape[1]
+                delta = block_mean - mean
+                mean = mean + delta*block.shape[1]/total
+                m2 = m2 + block_m2 + delta**2*count*block.shape[1]/total
+                count = total
+        std = np.sqrt(m2/count)
+
+    # 2nd pass: transformed chunks, fingerprint and Gram tensors
+    accumulators = None
+    hashers = None
+    num_times = 0
+    for chunks in chunk_reader():
+        block = chunk_block(chunks, a_switch_log)
+        if a_switch_zscore:
+            block = (block - mean[:, None, :]) / std[:, None, :]
+        if accumulators is None:
+            accumulators = [GramAccumulator(lag, block.shape[0], block.shape[2]) for lag in lags]
+            hashers = [hashlib.sha1() for i in range(0, block.shape[0])]
+        for i in range(0, block.shape[0]):
+            hashers[i].update(np.ascontiguousarray(block[i]).tobytes())
+        for accumulator in accumulators:
+            accumulator.update(block)
+        num_times += block.shape[1]
+    if accumulators is None:
+        raise ValueError("The chunk reader did not return any data")
+
+    header = str(len(hashers)) + "x" + str(num_times) + "x" + str(block.shape[2])
+    fingerprint = hashlib.sha1((header + ":" + ",".join(hasher.hexdigest() for hasher in hashers)).encode())
+    gram_tensors = {}
+    for lag, accumulator in zip(lags, accumulators):
+        gram_tensors[lag] = accumulator.finish(num_times)
+    return SufficientStatistics(gram_tensors, num_times, fingerprint.hexdigest())
+
+
+# FUNCTION: chunk_block
+def chunk_block(chunks, a_switch_log):
+    """
+    An auxiliary function that stacks the chunks of every replicate into one array.
+
+    Args:
+        chunks : LIST[chunk1, chunk2, chunk3, ...]
+            The next rows of every replicate
+        a_switch_log : BOOLEAN
+            A flag value for the log() function
+
+    Returns:
+        ARRAY(r, m, n)
+            The stacked rows
+    """
+    block = np.asarray([np.asarray(chunk, dtype=np.float64) for chunk in chunks])
+    if a_switch_log:
+        block = np.log(block)
+    return block
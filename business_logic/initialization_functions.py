@@ -1,6 +1,6 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: January, 2016.
-# Updated at: March, 2016.
+# Updated at: October, 2026.
 
 # LIBRARIES
 from business_logic.mutation_functions import *
@@ -14,7 +14,8 @@ from random import randint
 # ========================
 
 # FUNCTION: seed_population
-def seed_population(pop_size, num_genes, per_ones, likelihood_function, rep):
+def seed_population(pop_size, num_genes, per_ones, likelihood_function, rep, by_score=False, by_equivalence=False,
+                    max_parents=3, use_bigfloat=False):
     """
     An algorithm to create a more diverse first population. Based on the following steps:
         1) Randomly generate N DAGS (generate N DGs and then fix). Compute relative likelihoods for these N
@@ -40,6 +41,17 @@ def seed_population(pop_size, num_genes, per_ones, likelihood_function, rep):
                 1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two, n = not valid type
         rep : LIST[rep1, rep2, rep3, ...]
             A repN is a biological data used to calc the likelihood result
+        by_score : BOOLEAN
+            True for finding the unique chromosomes by their relative likelihood result instead of their genes, see
+            'select_uniques_chromosomes'
+        by_equivalence : BOOLEAN
+            True for finding the unique chromosomes by their Markov equivalence class and giving every chromosome the
+            likelihood result of its class, see 'equivalence_likelihood_calculator'
+        max_parents : INT
+            The maximum number of parents of every node, see 'repair_population'
+        use_bigfloat : BOOLEAN
+            True for calculating the relative likelihood results with 'bigfloat', see
+            'relative_likelihood_result_calculator'
 
     Returns:
         LIST[Chromosome(), Chromosome(), ...]
@@ -50,15 +62,15 @@ def seed_population(pop_size, num_genes, per_ones, likelihood_function, rep):
 
     initial_population = []
     initial_population.extend(population_creator(pop_size, num_genes, per_ones))
-    initial_population = repair_population(initial_population)
+    initial_population = repair_population(initial_population, max_parents)
 
-    likelihood_result_calculator(initial_population, likelihood_function, rep)
-    relative_likelihood_result_calculator(initial_population)
+    likelihood_result_calculator(initial_population, likelihood_function, rep, by_equivalence=by_equivalence)
+    relative_likelihood_result_calculator(initial_population, use_bigfloat)
     relative_likelihood_result_sorting(initial_population)
 
     # Part A
     for percentage in part_a_percentage:
-        unique_population = select_uniques_chromosomes(initial_population)
+        unique_population = select_uniques_chromosomes(initial_population, by_score, by_equivalence)
 
         keep_percentage = (len(initial_population)*percentage)//100
         complete_percentage = len(initial_population)-keep_percentage
@@ -80,15 +92,15 @@ def seed_population(pop_size, num_genes, per_ones, likelihood_function, rep):
         new_population.extend(population_creator(complete_percentage, num_genes, per_ones))
 
         initial_population = new_population
-        initial_population = repair_population(initial_population)
+        initial_population = repair_population(initial_population, max_parents)
 
-        likelihood_result_calculator(initial_population, likelihood_function, rep)
-        relative_likelihood_result_calculator(initial_population)
+        likelihood_result_calculator(initial_population, likelihood_function, rep, by_equivalence=by_equivalence)
+        relative_likelihood_result_calculator(initial_population, use_bigfloat)
         relative_likelihood_result_sorting(initial_population)
 
     # Part B
     for percentage in part_b_percentage:
-        unique_population = select_uniques_chromosomes(initial_population)
+        unique_population = select_uniques_chromosomes(initial_population, by_score, by_equivalence)
 
         keep_percentage = (len(initial_population)*percentage)//100
         complete_percentage = len(initial_population)-keep_percentage
@@ -115,10 +127,10 @@ def seed_population(pop_size, num_genes, per_ones, likelihood_function, rep):
 
         initial_population = new_population
         initial_population.extend(aux_population)
-        initial_population = repair_population(initial_population)
+        initial_population = repair_population(initial_population, max_parents)
 
-        likelihood_result_calculator(initial_population, likelihood_function, rep)
-        relative_likelihood_result_calculator(initial_population)
+        likelihood_result_calculator(initial_population, likelihood_function, rep, by_equivalence=by_equivalence)
+        relative_likelihood_result_calculator(initial_population, use_bigfloat)
         relative_likelihood_result_sorting(initial_population)
     return initial_population
 
@@ -0,0 +1,217 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.composite_runner import *
+from multiprocessing import Process, Queue
+import numpy as np
+import queue
+
+
+# CLASS: Migrator
+class Migrator:
+    """
+    The exchange of chromosomes of one island of the island model (see 'island_runs_executor'). Every
+    'migration_interval' generations (a migration epoch) the island sends copies of its best 'num_migrants' unique
+    chromosomes to the inbox of the next island of the topology, and the chromosomes received from the previous island
+    take the place of its worst ones. In the 'ring' topology the next island of i is always i+1; in the 'random'
+    topology the islands are put in a new random ring at every epoch, the same for every island because it is drawn
+    from the epoch and a seed shared by all of them. The migrants carry their scores, so they are never evaluated
+    again, and the received chromosomes only depend on the epoch, not on the speed of the islands.
+
+    Args:
+        island : INT
+            The number of the island, from 0
+        inboxes : LIST[Queue, ...]
+            The inbox of every island
+        migration_interval : INT
+            The number of generations between two migrations
+        num_migrants : INT
+            The number of chromosomes sent by every island in a migration
+        topology : STRING
+            'ring' or 'random'
+        topology_seed : INT
+            The seed shared by every island for the 'random' topology
+
+    Attributes:
+        island : INT
+            The number of the island, from 0
+        inboxes : LIST[Queue, ...]
+            The inbox of every island
+        migration_interval : INT
+            The number of generations between two migrations
+        num_migrants : INT
+            The number of chromosomes sent by every island in a migration
+        topology : STRING
+            'ring' or 'random'
+        topology_seed : INT
+            The seed shared by every island for the 'random' topology
+        pending_migrants : DICT{INT: Population}
+            The chromosomes received for epochs that are not reached yet by this island
+    """
+    # CONSTRUCTOR
+    def __init__(self, island, inboxes, migration_interval, num_migrants, topology, topology_seed):
+        if topology not in ("ring", "random"):
+            raise ValueError("the topology of the islands must be 'ring' or 'random', not " + repr(topology))
+        self.island = island
+        self.inboxes = inboxes
+        self.migration_interval = migration_interval
+        self.num_migrants = num_migrants
+        self.topology = topology
+        self.topology_seed = topology_seed
+        self.pending_migrants = {}
+
+    # ACCESSOR METHODS
+    def get_island(self):
+        return self.island
+
+    def get_num_islands(self):
+        return len(self.inboxes)
+
+    # METHODS
+    def is_migration_generation(self, generation):
+        """
+        Returns True if there is a migration after the given generation (counted from 1).
+
+        Args:
+            generation : INT
+                The number of the generation
+
+        Returns:
+            BOOLEAN
+                True if the generation ends a migration epoch
+        """
+        return self.migration_interval > 0 and self.num_migrants > 0 and generation % self.migration_interval == 0
+
+    def destinations(self, epoch):
+        """
+        Returns the island that receives the migrants of every island in a migration epoch.
+
+        Args:
+            epoch : INT
+                The number of the migration epoch
+
+        Returns:
+            LIST[INT, ...]
+                The destination of every island
+        """
+        num_islands = self.get_num_islands()
+        if self.topology == "ring":
+            order = np.arange(num_islands)
+        else:
+            order = np.random.default_rng([self.topology_seed, epoch]).permutation(num_islands)
+        destinations = np.empty(num_islands, dtype=np.intp)
+        destinations[order] = np.roll(order, -1)
+        return destinations.tolist()
+
+    def migrate(self, population, generation, by_score=False, by_equivalence=False):
+        """
+        Sends the best unique chromosomes of the island to the next island and puts the chromosomes received from the
+        previous island in the place of the worst ones. It waits until the migrants of the same epoch arrive.
+
+        Args:
+            population : Population
+                The population of the island, sorted by the likelihood result
+            generation : INT
+                The number of the generation that ends the migration epoch
+            by_score : BOOLEAN
+                True for finding the unique chromosomes by their relative likelihood result instead of their genes
+            by_equivalence : BOOLEAN
+                True for finding the unique chromosomes by their Markov equivalence class
+
+        Returns:
+            Population
+                The population with the received chromosomes, which must be sorted again
+        """
+        epoch = generation // self.migration_interval
+        best_chromosomes = select_uniques_chromosomes(population, by_score, by_equivalence)[:self.num_migrants]
+        migrants = population.take([chromosome.index for chromosome in best_chromosomes])
+        self.inboxes[self.destinations(epoch)[self.island]].put((epoch, migrants))
+
+        while epoch not in self.pending_migrants:
+            received_epoch, received_migrants = self.inboxes[self.island].get()
+            self.pending_migrants[received_epoch] = received_migrants
+        immigrants = self.pending_migrants.pop(epoch)
+        num_immigrants = min(len(immigrants), len(population))
+        if num_immigrants > 0:
+            population.put(np.arange(len(population) - num_immigrants, len(population)),
+                           immigrants.take(np.arange(0, num_immigrants)))
+        return population
+
+
+# FUNCTION: island_runs_executor
+def island_runs_executor(num_islands, rep, random_seed=None, migration_interval=25, num_migrants=2, topology="ring",
+                         collect_families=False, **parameters):
+    """
+    Does 'num_islands' composite runs (see 'composite_run') at the same time as the islands of an island model: every
+    island is a worker process that evolves its own population, and every 'migration_interval' generations the islands
+    exchange their best chromosomes through queues (see 'Migrator'). Every island ends with its own composite model.
+    The seed of every island is the seed of the same run of 'composite_runs_executor', and the migrations don't
+    depend on the speed of the islands, so the results only depend on 'random_seed'.
+
+    Args:
+        num_islands : INT
+            The number of islands (composite runs), all of them run at the same time
+        rep : LIST[rep1, rep2, rep3, ...]
+            A repN is a biological data used to calc the likelihood result
+        random_seed : INT
+            The seed of the whole execution, None for a different one every time
+        migration_interval : INT
+            The number of generations between two migrations
+        num_migrants : INT
+            The number of chromosomes sent by every island in a migration
+        topology : STRING
+            'ring' or 'random', see 'Migrator'
+        collect_families : BOOLEAN
+            True for sending back the families scored by every island, see 'CompositeResult'
+        parameters : DICT{STRING: ...}
+            The parameters of 'composite_run' (from 'pop_size' to 'use_bigfloat')
+
+    Returns:
+        GENERATOR(CompositeResult)
+            The result of every island, in order
+    """
+    seeds = run_seeds_creator(np.random.SeedSequence(random_seed), num_islands + 1)
+    topology_seed = seeds.pop()
+    inboxes = [Queue() for island in range(0, num_islands)]
+    results = Queue()
+    processes = []
+    for island in range(0, num_islands):
+        migrator = Migrator(island, inboxes, migration_interval, num_migrants, topology, topology_seed)
+        processes.append(Process(target=_island_process,
+                                 args=(seeds[island], rep, migrator, results, collect_families, parameters)))
+    for process in processes:
+        process.start()
+
+    island_results = {}
+    try:
+        while len(island_results) < num_islands:
+            try:
+                island, result = results.get(timeout=1.0)
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise RuntimeError("an island stopped before sending its result")
+                continue
+            island_results[island] = result
+    except BaseException:
+        for process in processes:
+            process.terminate()
+        raise
+    for process in processes:
+        process.join()
+
+    for island in range(0, num_islands):
+        yield island_results[island]
+
+
+# FUNCTION: _island_process
+def _island_process(seed, rep, migrator, results, collect_families, parameters):
+    # the scoring pools of the parent process can't be used by its islands
+    scoring_pools.clear()
+    result = composite_run(seed, rep, migrator=migrator, **parameters)
+    if collect_families:
+        fingerprint = find_dataset_fingerprint(rep)
+        result.families = family_score_cache.new_used_families(parameters["likelihood_function"], fingerprint)
+        result.disk_hits = family_score_cache.new_disk_hits()
+    results.put((migrator.get_island(), result))
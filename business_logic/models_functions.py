@@ -1,9 +1,8 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: February, 2016.
-# Updated at: May, 2016.
+# Updated at: October, 2026.
 
 # LIBRARIES
-from business_logic.chromosome import Chromosome
 from business_logic.general_functions import *
 
 
@@ -30,10 +29,10 @@ def model_creator(population, num_genes, likelihood_function):
         MATRIX[[FLOAT, FLOAT, ...], [FLOAT, FLOAT, ...], ...]
             The composite / amalgamated model
     """
-    new_population = fitness_x_genes(population)
+    weighted_genes = fitness_x_genes(population)
     model = [[0 for i in range(num_genes)] for i in range(num_genes)]
-    for i in range(0, len(new_population)):
-        genes = population[i].get_genes()
+    for i in range(0, len(weighted_genes)):
+        genes = weighted_genes[i]
         for j in range(0, len(genes)):
             for k in range(0, len(genes)):
                 model[j][k] += genes[j][k]
@@ -51,21 +50,22 @@ def model_creator(population, num_genes, likelihood_function):
 def fitness_x_genes(population):
     """
     This is an auxiliary function that multiplies the fitness by the genes on every chromosome of a given population.
+    The chromosomes are not changed.
 
     Args:
         population : LIST[Chromosome(), Chromosome(), ...]
             A list filled with 'Chromosome' objects
 
     Returns:
-        LIST[Chromosome(), Chromosome(), ...]
-            The new population with the genes multiplied by the fitness
+        LIST[MATRIX[[FLOAT, FLOAT, ...], [FLOAT, FLOAT, ...], ...], ...]
+            The genes of every chromosome multiplied by its fitness
     """
-    new_population = []
+    weighted_genes = []
     for i in range(0, len(population)):
         genes = population[i].get_genes()
         fitness = population[i].get_fitness()
         for j in range(0, len(genes)):
             for k in range(0, len(genes)):
                 genes[j][k] *= fitness
-        new_population.append(Chromosome(genes))
-    return new_population
+        weighted_genes.append(genes)
+    return weighted_genes
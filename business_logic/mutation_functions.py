@@ -1,9 +1,11 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: January, 2016.
-# Updated at: April, 2016.
+# Updated at: October, 2026.
 
 # LIBRARIES
+from business_logic.population import Population
 from random import randint
+import numpy as np
 import random
 
 
@@ -12,24 +14,122 @@ import random
 # ==================
 
 # FUNCTION: mutation_function
-def mutation_function(population, mutation_prob, num_mutations):
+def mutation_function(population, mutation_prob, num_mutations, rng=None):
     """
     Given a probability of mutation, this function applies a mutation (change of a bit in the genes) to every
-    chromosome in the population.
+    chromosome in the population. A 'Population' is mutated at once by 'mutation_kernel'.
 
     Args:
-        population : LIST[Chromosome]
+        population : LIST[Chromosome] or Population
             A list filled with 'Chromosome' objects
         mutation_prob : FLOAT
             The desired probability of mutation
         num_mutations : INT
             The desired amount of mutations per chromosome
+        rng : np.random.Generator
+            The random generator of 'mutation_kernel', by default a generator seeded by the 'random' module
     """
+    if isinstance(population, Population):
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+        mutation_kernel(population, mutation_prob, num_mutations, rng)
+        return
     for i in range(0, len(population)):
         for j in range(0, num_mutations):
             if random.random() <= mutation_prob:
-                random1 = randint(0, len(population[0].get_genes())-1)
-                random2 = randint(0, len(population[0].get_genes())-1)
+                random1 = randint(0, population[0].get_num_genes()-1)
+                random2 = randint(0, population[0].get_num_genes()-1)
                 while random1 == random2:  # for avoiding having two equal random numbers
-                    random2 = randint(0, len(population[0].get_genes())-1)
+                    random2 = randint(0, population[0].get_num_genes()-1)
                 population[i].bit_changer(random1, random2)
+
+
+# FUNCTION: mutation_kernel
+def mutation_kernel(population, mutation_prob, num_mutations, rng):
+    """
+    Does the mutations of 'mutation_function' on a whole population at once. Every mutation of every chromosome
+    happens with the probability of mutation, and the positions of all the mutations are drawn together: the row is
+    any node and the column is drawn among the other n-1 nodes, so the diagonal is never drawn and every position
+    out of it has the same probability. The bits are changed over the gene tensor without buffering, so two mutations
+    of the same position undo each other, as they do one after the other.
+
+    Args:
+        population : Population
+            The population to be mutated
+        mutation_prob : FLOAT
+            The desired probability of mutation
+        num_mutations : INT
+            The desired amount of mutations per chromosome
+        rng : np.random.Generator
+            The random generator
+    """
+    genes = population.get_genes()
+    num_genes = genes.shape[2]
+    mutated = np.flatnonzero(rng.random((len(population), num_mutations)) <= mutation_prob) // num_mutations
+    rows = rng.integers(0, num_genes, size=len(mutated))
+    columns = rng.integers(0, num_genes-1, size=len(mutated))
+    columns += columns >= rows
+    np.bitwise_xor.at(genes, (mutated, rows, columns), 1)
+    for i, j in zip(mutated.tolist(), columns.tolist()):
+        population.changed_columns[i].add(j)
+
+
+# FUNCTION: acyclic_mutation_function
+def acyclic_mutation_function(population, mutation_prob, num_mutations, max_parents=3):
+    """
+    Given a probability of mutation, this function applies a mutation (change of a bit in the genes) to every
+    chromosome in a population of DAGs, keeping them as DAGs: an edge can always be removed, but it is only added if it
+    does not create a cycle and the column keeps at most 'max_parents' parents. When the drawn position can't be
+    changed, a new one is drawn, so every valid change has the same probability and the population doesn't need to be
+    repaired. A 'Population' is mutated in place, over its gene tensor.
+
+    Args:
+        population : LIST[Chromosome] or Population
+            A list filled with 'Chromosome' objects whose genes are DAGs
+        mutation_prob : FLOAT
+            The desired probability of mutation
+        num_mutations : INT
+            The desired amount of mutations per chromosome
+        max_parents : INT
+            The maximum number of parents of every node
+    """
+    for i in range(0, len(population)):
+        num_genes = population[i].get_num_genes()
+        for j in range(0, num_mutations):
+            if random.random() <= mutation_prob:
+                for attempt in range(0, num_genes*num_genes):
+                    random1 = randint(0, num_genes-1)
+                    random2 = randint(0, num_genes-1)
+                    while random1 == random2:  # for avoiding having two equal random numbers
+                        random2 = randint(0, num_genes-1)
+                    if acyclic_change_checker(population[i], random1, random2, max_parents):
+                        population[i].bit_changer(random1, random2)
+                        break
+
+
+# FUNCTION: acyclic_change_checker
+def acyclic_change_checker(chromosome, i, j, max_parents):
+    """
+    An auxiliary function that returns True if the bit (i,j) of the genes of a DAG can be changed without creating a
+    cycle or giving the column j more than 'max_parents' parents.
+
+    Args:
+        chromosome : Chromosome
+            An object 'Chromosome' whose genes are a DAG
+        i : INT
+            Position x of the matrix (row)
+        j : INT
+            Position y of the matrix (column)
+        max_parents : INT
+            The maximum number of parents of every node
+
+    Returns:
+        BOOLEAN
+            True if the bit can be changed
+    """
+    column = chromosome.get_column(j)
+    if column >> i & 1:
+        return True
+    if column.bit_count() >= max_parents:
+        return False
+    return not chromosome.creates_cycle(i, j)
@@ -0,0 +1,149 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.gram_tensors import GramTensors
+from business_logic.scoring_plan import ScoringPlan
+from multiprocessing import Pool, shared_memory
+import numpy as np
+import os
+
+# The scoring plan of the worker processes of 'ScoringPool', built over the shared memory, and the blocks it uses
+_worker_scoring_plan = None
+_worker_memories = []
+
+
+# CLASS: ScoringPool
+class ScoringPool:
+    """
+    A persistent pool of worker processes that scores families for a 'ScoringPlan'. The Gram tensors of the plan are
+    copied once into blocks of shared memory, and every worker builds its own plan over them when it starts, so the
+    data is never pickled again: only the families (a child and its parents) go to the workers and only their scores
+    come back. A batch of families is split in one contiguous shard per worker, and the scores are joined in the order
+    of the batch. The pool has the 'score_families' method of a 'ScoringPlan', so it can be used in its place.
+
+    Args:
+        scoring_plan : ScoringPlan
+            The scoring plan whose families are scored
+        num_workers : INT
+            The number of worker processes, None for the number of CPUs
+        min_shard_size : INT
+            The minimum number of families of a shard, smaller batches are scored by this process
+
+    Attributes:
+        scoring_plan : ScoringPlan
+            The scoring plan whose families are scored
+        num_workers : INT
+            The number of worker processes
+        min_shard_size : INT
+            The minimum number of families of a shard
+        memories : LIST[SharedMemory, ...]
+            The blocks of shared memory of the Gram tensors
+        pool : Pool
+            The worker processes
+    """
+    # CONSTRUCTOR
+    def __init__(self, scoring_plan, num_workers=None, min_shard_size=64):
+        self.scoring_plan = scoring_plan
+        self.num_workers = os.cpu_count() if num_workers is None else num_workers
+        self.min_shard_size = min_shard_size
+        gram_tensors = scoring_plan.get_gram_tensors()
+        self.memories = []
+        descriptions = []
+        for tensor in (gram_tensors.child_gram, gram_tensors.parent_gram, gram_tensors.cross_gram,
+                       gram_tensors.avg_parent_gram):
+            memory, description = shared_array_creator(tensor)
+            self.memories.append(memory)
+            descriptions.append(description)
+        self.pool = Pool(self.num_workers, initializer=_worker_initializer,
+                         initargs=(descriptions, gram_tensors.get_num_obs(), scoring_plan.get_lag()))
+
+    # ACCESSOR METHODS
+    def get_scoring_plan(self):
+        return self.scoring_plan
+
+    def get_num_workers(self):
+        return self.num_workers
+
+    # METHODS
+    def score_families(self, families):
+        """
+        Computes the term of many families, sharding them between the worker processes.
+
+        Args:
+            families : LIST[TUPLE(INT, TUPLE(INT, ...)), ...]
+                The families to be scored, every one as (child, parents)
+
+        Returns:
+            ARRAY(FLOAT)
+                The log likelihood contribution of every family, in the same order
+        """
+        num_shards = min(self.num_workers, len(families) // self.min_shard_size)
+        if num_shards < 2:
+            return self.scoring_plan.score_families(families)
+        bounds = np.linspace(0, len(families), num_shards + 1).astype(int).tolist()
+        shards = [families[bounds[k]:bounds[k + 1]] for k in range(0, num_shards)]
+        return np.concatenate(self.pool.map(_worker_score_families, shards))
+
+    def close(self):
+        """ Stops the worker processes and releases the shared memory. """
+        self.pool.close()
+        self.pool.join()
+        for memory in self.memories:
+            memory.close()
+            memory.unlink()
+        self.memories = []
+
+
+# FUNCTION: shared_array_creator
+def shared_array_creator(array):
+    """
+    Copies an array into a new block of shared memory.
+
+    Args:
+        array : ARRAY
+            The array to be shared
+
+    Returns:
+        TUPLE(SharedMemory, TUPLE(STRING, TUPLE(INT, ...), STRING))
+            The block of shared memory and its description (name, shape and dtype), see 'shared_array_loader'
+    """
+    array = np.ascontiguousarray(array)
+    memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+    return memory, (memory.name, array.shape, array.dtype.str)
+
+
+# FUNCTION: shared_array_loader
+def shared_array_loader(description):
+    """
+    Opens an array that was copied into shared memory by 'shared_array_creator', without copying it.
+
+    Args:
+        description : TUPLE(STRING, TUPLE(INT, ...), STRING)
+            The name, the shape and the dtype of the array
+
+    Returns:
+        TUPLE(SharedMemory, ARRAY)
+            The block of shared memory (it must be kept open while the array is used) and the array
+    """
+    name, shape, dtype = description
+    memory = shared_memory.SharedMemory(name=name)
+    return memory, np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf)
+
+
+# FUNCTION: _worker_initializer
+def _worker_initializer(descriptions, num_obs, lag):
+    global _worker_scoring_plan
+    tensors = []
+    for description in descriptions:
+        memory, tensor = shared_array_loader(description)
+        _worker_memories.append(memory)
+        tensors.append(tensor)
+    _worker_scoring_plan = ScoringPlan(GramTensors(tensors[0], tensors[1], tensors[2], tensors[3], num_obs), lag)
+
+
+# FUNCTION: _worker_score_families
+def _worker_score_families(families):
+    return _worker_scoring_plan.score_families(families)
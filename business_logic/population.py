@@ -0,0 +1,355 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.chromosome import Chromosome, columns_packer
+import numpy as np
+
+
+# CLASS: Population
+class Population:
+    """
+    A population stored in contiguous arrays instead of a list of 'Chromosome' objects: a (pop_size, n, n) gene tensor
+    and parallel float64 arrays for the likelihood result, the relative likelihood result and the fitness (NaN when
+    a value was not calculated yet). Indexing or iterating a population gives 'ChromosomeView' objects, which have the
+    same methods as a 'Chromosome', so every function written for lists of chromosomes also works with it.
+
+    Args:
+        genes : ARRAY(pop_size, n, n)
+            The genes of every chromosome
+
+    Attributes:
+        genes : ARRAY(pop_size, n, n) of UINT8
+            The genes of every chromosome
+        log_likelihood_results : ARRAY(pop_size) of FLOAT64
+            The likelihood result of every chromosome
+        relative_likelihood_results : ARRAY(pop_size) of FLOAT64
+            The relative likelihood result of every chromosome
+        fitness : ARRAY(pop_size) of FLOAT64
+            The fitness of every chromosome
+        family_scores : ARRAY(pop_size, n) of FLOAT64
+            The family scores of every chromosome at its last evaluation
+        scored : ARRAY(pop_size) of BOOL
+            True for the chromosomes whose family scores are known
+        changed_columns : LIST[SET{INT, ...}, ...]
+            The columns of every chromosome that changed since its last evaluation
+    """
+    # CONSTRUCTOR
+    def __init__(self, genes):
+        self.genes = np.array(genes, dtype=np.uint8).reshape((len(genes), -1, np.shape(genes)[-1]))
+        size, num_genes = self.genes.shape[0], self.genes.shape[2]
+        self.log_likelihood_results = np.full(size, np.nan)
+        self.relative_likelihood_results = np.full(size, np.nan)
+        self.fitness = np.full(size, np.nan)
+        self.family_scores = np.zeros((size, num_genes))
+        self.scored = np.zeros(size, dtype=bool)
+        self.changed_columns = [set() for i in range(0, size)]
+
+    # ACCESSOR METHODS
+    def get_genes(self):
+        return self.genes
+
+    def get_log_likelihood_results(self):
+        return self.log_likelihood_results
+
+    def get_relative_likelihood_results(self):
+        return self.relative_likelihood_results
+
+    def get_fitness(self):
+        return self.fitness
+
+    # METHODS
+    @classmethod
+    def from_chromosomes(cls, chromosomes):
+        """
+        Creates a population from a list of chromosomes, copying their genes and every calculated value.
+
+        Args:
+            chromosomes : LIST[Chromosome(), Chromosome(), ...]
+                A list filled with 'Chromosome' objects
+
+        Returns:
+            Population
+                The new population
+        """
+        population = cls([chromosome.get_genes() for chromosome in chromosomes])
+        for i in range(0, len(chromosomes)):
+            population[i].copy_values(chromosomes[i])
+        return population
+
+    def to_chromosomes(self):
+        """
+        Creates a list of independent 'Chromosome' objects with the genes and the values of the population.
+
+        Returns:
+            LIST[Chromosome(), Chromosome(), ...]
+                A list filled with 'Chromosome' objects
+        """
+        chromosomes = []
+        population_columns = tensor_columns_packer(self.genes)
+        for i in range(0, len(self)):
+            chromosome = Chromosome.from_columns(population_columns[i])
+            ChromosomeView.copy_values(chromosome, self[i])
+            chromosomes.append(chromosome)
+        return chromosomes
+
+    def structural_keys(self):
+        """
+        Returns a key for every chromosome that is equal for two chromosomes if and only if their genes are equal. The
+        keys are found for the whole tensor at once, packing the genes of every chromosome into bytes.
+
+        Returns:
+            LIST[BYTES, ...]
+                The key of every chromosome
+        """
+        packed = np.packbits(self.genes.reshape((len(self), -1)), axis=1)
+        return [row.tobytes() for row in packed]
+
+    def take(self, indexes):
+        """
+        Returns a new population with copies of the chromosomes at the given positions, with their genes and every
+        calculated value. A position can be given more than once.
+
+        Args:
+            indexes : ARRAY(new_size) of INT
+                The positions of the chromosomes in this population
+
+        Returns:
+            Population
+                The new population
+        """
+        indexes = np.asarray(indexes, dtype=np.intp)
+        population = Population(self.genes[indexes])
+        population.log_likelihood_results = self.log_likelihood_results[indexes]
+        population.relative_likelihood_results = self.relative_likelihood_results[indexes]
+        population.fitness = self.fitness[indexes]
+        population.family_scores = self.family_scores[indexes]
+        population.scored = self.scored[indexes]
+        population.changed_columns = [set(self.changed_columns[i]) for i in indexes.tolist()]
+        return population
+
+    def put(self, indexes, population):
+        """
+        Puts copies of the chromosomes of another population, with their genes and every calculated value, in the
+        given positions of this population.
+
+        Args:
+            indexes : ARRAY(size) of INT
+                The positions in this population, one for every chromosome of the other population
+            population : Population
+                The chromosomes to be copied
+        """
+        indexes = np.asarray(indexes, dtype=np.intp)
+        self.genes[indexes] = population.genes
+        self.log_likelihood_results[indexes] = population.log_likelihood_results
+        self.relative_likelihood_results[indexes] = population.relative_likelihood_results
+        self.fitness[indexes] = population.fitness
+        self.family_scores[indexes] = population.family_scores
+        self.scored[indexes] = population.scored
+        for i, changed_columns in zip(indexes.tolist(), population.changed_columns):
+            self.changed_columns[i] = set(changed_columns)
+
+    def reorder(self, order):
+        """
+        Puts the chromosomes in a new order.
+
+        Args:
+            order : ARRAY(pop_size) of INT
+                The old position of every chromosome in the new order
+        """
+        self.genes = self.genes[order]
+        self.log_likelihood_results = self.log_likelihood_results[order]
+        self.relative_likelihood_results = self.relative_likelihood_results[order]
+        self.fitness = self.fitness[order]
+        self.family_scores = self.family_scores[order]
+        self.scored = self.scored[order]
+        self.changed_columns = [self.changed_columns[i] for i in order]
+
+    def __len__(self):
+        return self.genes.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ChromosomeView(self, i) for i in range(0, len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("population index out of range")
+        return ChromosomeView(self, index)
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield ChromosomeView(self, i)
+
+
+# CLASS: ChromosomeView
+class ChromosomeView(Chromosome):
+    """
+    A chromosome of a 'Population'. It has every method of a 'Chromosome', but its genes and values are read from and
+    written to the arrays of the population, so the genes are packed when they are needed and the structural hash is
+    not cached.
+
+    Args:
+        population : Population
+            The population that holds the chromosome
+        index : INT
+            The position of the chromosome in the population
+    """
+    __slots__ = ("population", "index")
+
+    # CONSTRUCTOR
+    def __init__(self, population, index):
+        self.population = population
+        self.index = index
+
+    # PROPERTIES
+    @property
+    def num_genes(self):
+        return self.population.genes.shape[1]
+
+    @property
+    def columns(self):
+        return self.get_columns()
+
+    @property
+    def log_likelihood_result(self):
+        return nan_to_none(self.population.log_likelihood_results[self.index])
+
+    @log_likelihood_result.setter
+    def log_likelihood_result(self, log_likelihood_result):
+        self.population.log_likelihood_results[self.index] = none_to_nan(log_likelihood_result)
+
+    @property
+    def relative_likelihood_result(self):
+        return nan_to_none(self.population.relative_likelihood_results[self.index])
+
+    @relative_likelihood_result.setter
+    def relative_likelihood_result(self, relative_likelihood_result):
+        self.population.relative_likelihood_results[self.index] = none_to_nan(relative_likelihood_result)
+
+    @property
+    def fitness(self):
+        return nan_to_none(self.population.fitness[self.index])
+
+    @fitness.setter
+    def fitness(self, fitness):
+        self.population.fitness[self.index] = none_to_nan(fitness)
+
+    @property
+    def family_scores(self):
+        if not self.population.scored[self.index]:
+            return None
+        return self.population.family_scores[self.index]
+
+    @family_scores.setter
+    def family_scores(self, family_scores):
+        if family_scores is None:
+            self.population.scored[self.index] = False
+        else:
+            self.population.family_scores[self.index] = family_scores
+            self.population.scored[self.index] = True
+
+    @property
+    def changed_columns(self):
+        return self.population.changed_columns[self.index]
+
+    @changed_columns.setter
+    def changed_columns(self, changed_columns):
+        self.population.changed_columns[self.index] = changed_columns
+
+    # ACCESSOR METHODS
+    def get_genes(self):
+        return self.population.genes[self.index].tolist()
+
+    def set_genes(self, genes):
+        self.population.genes[self.index] = genes
+        self.family_scores = None
+        self.changed_columns = set()
+
+    def get_columns(self):
+        return columns_packer(self.population.genes[self.index])
+
+    def get_column(self, j):
+        return sum(1 << i for i in np.flatnonzero(self.population.genes[self.index, :, j]).tolist())
+
+    def set_column(self, j, column):
+        self.population.genes[self.index, :, j] = [(column >> i) & 1 for i in range(0, self.num_genes)]
+
+    # METHODS
+    def bit_changer(self, i, j):
+        self.population.genes[self.index, i, j] ^= 1
+        self.changed_columns.add(j)
+
+    def counter_ones(self):
+        return int(np.count_nonzero(self.population.genes[self.index]))
+
+    def structural_hash(self):
+        return hash(self.structural_key())
+
+    def copy_values(self, chromosome):
+        """
+        Copies the likelihood results, the fitness and the family scores of another chromosome.
+
+        Args:
+            chromosome : Chromosome
+                The chromosome whose values are copied
+        """
+        self.log_likelihood_result = chromosome.log_likelihood_result
+        self.relative_likelihood_result = chromosome.relative_likelihood_result
+        self.fitness = chromosome.fitness
+        self.family_scores = None if chromosome.family_scores is None else list(chromosome.family_scores)
+        self.changed_columns = set(chromosome.changed_columns)
+
+
+# FUNCTION: nan_to_none
+def nan_to_none(value):
+    """
+    An auxiliary function that converts a NaN of the population arrays into the None used by 'Chromosome'.
+
+    Args:
+        value : FLOAT
+            A value read from an array
+
+    Returns:
+        FLOAT
+            The value, or None if it was NaN
+    """
+    return None if np.isnan(value) else float(value)
+
+
+# FUNCTION: none_to_nan
+def none_to_nan(value):
+    """
+    An auxiliary function that converts the None used by 'Chromosome' into a NaN for the population arrays.
+
+    Args:
+        value : FLOAT
+            A value of a chromosome
+
+    Returns:
+        FLOAT
+            The value, or NaN if it was None
+    """
+    return np.nan if value is None else value
+
+
+# FUNCTION: tensor_columns_packer
+def tensor_columns_packer(genes):
+    """
+    Packs the stacked genes of a population by column (see 'columns_packer') with a few array operations.
+
+    Args:
+        genes : ARRAY(pop_size, n, n)
+            The stacked genes of a population
+
+    Returns:
+        LIST[LIST[INT, INT, ...], ...]
+            The genes of every chromosome packed by column
+    """
+    num_genes = genes.shape[-1]
+    if num_genes < 64:
+        weights = np.left_shift(np.uint64(1), np.arange(num_genes, dtype=np.uint64))
+        return (genes.astype(np.uint64) * weights[:, None]).sum(axis=-2, dtype=np.uint64).tolist()
+    weights = np.array([1 << i for i in range(0, num_genes)], dtype=object)
+    return (genes.astype(object) * weights[:, None]).sum(axis=-2).tolist()
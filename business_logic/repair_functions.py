@@ -1,12 +1,12 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: January, 2016.
-# Updated at: May, 2016.
+# Updated at: October, 2026.
 
 # LIBRARIES
-from business_logic.chromosome import Chromosome
-from business_logic.general_functions import *
-from random import randint
-import networkx as nx
+from business_logic.chromosome import Chromosome, bits_iterator
+from business_logic.population import Population, tensor_columns_packer
+import numpy as np
+import random
 
 
 # ================
@@ -14,119 +14,307 @@ import networkx as nx
 # ================
 
 # FUNCTION: repair_population
-def repair_population(population):
+def repair_population(population, max_parents=3, rng=None):
     """
     Repairs a DAG when it has cycles to be deleted. This function runs 3 important steps:
         I) Eliminates cycles on the diagonal of the matrix
-        II) Restricts the number of edges on each column by 3 maximum. If the number of edges is bigger than 3, the
-        algorithm eliminates edges randomly
+        II) Restricts the number of edges on each column by 'max_parents' maximum. If the number of edges is bigger,
+        the algorithm eliminates edges randomly
         III) Break edges that appear the most in the cycles, for breaking as many cycles as possible, until no more
-        cycles are found in the matrix
+        cycles are found in the matrix. The cycles are not enumerated: the edges are chosen inside every strongly
+        connected component with a feedback arc set heuristic, see 'cycles_breaker'
+    The steps I and II are done for the whole population at once, over the stacked genes. A 'Population' is repaired
+    in place, over its gene tensor; the chromosomes of a list are not changed, and new repaired chromosomes are
+    returned. A repaired chromosome keeps its family scores, and the columns touched by the repair are marked as
+    changed.
 
     Args:
-        population : LIST[Chromosome(), Chromosome(), ...]
+        population : LIST[Chromosome(), Chromosome(), ...] or Population
             A list filled with 'Chromosome' objects
+        max_parents : INT
+            The maximum number of parents of every node
+        rng : np.random.Generator
+            The random generator of the step II, by default a generator seeded by the 'random' module
 
     Returns:
-        LIST[Chromosome()]
-            A new list of chromosomes with fixed DAG (no cycles)
+        LIST[Chromosome()] or Population
+            A new list of chromosomes with fixed DAG (no cycles), or the same population repaired
     """
+    in_place = isinstance(population, Population)
+    if len(population) == 0:
+        return population if in_place else []
+    if in_place:
+        genes = population.get_genes().copy()
+    else:
+        genes = np.array([chromosome.get_genes() for chromosome in population], dtype=np.uint8)
+
+    # I)
+    diagonal_loops_breaker(genes)
+
+    # II)
+    genes = in_degree_limiter(genes, max_parents, rng)
+
+    population_columns = tensor_columns_packer(genes)
+    if in_place:
+        old_genes = population.get_genes()
+        for i, j in zip(*np.nonzero(np.any(old_genes != genes, axis=1))):
+            population.changed_columns[i].add(int(j))
+        old_genes[...] = genes
+        for i in range(0, len(population)):
+            # III)
+            repaired_columns = cycles_breaker(population_columns[i])
+            for j in range(0, len(repaired_columns)):
+                if repaired_columns[j] != population_columns[i][j]:
+                    population[i].set_column(j, repaired_columns[j])
+                    population.changed_columns[i].add(j)
+        return population
+
     repaired_population = []
     for i in range(0, len(population)):
-        # I)
-        diagonal_loops_breaker(population[i].get_genes())
-
-        # II)
-        population[i].set_genes(transpose_matrix(population[i].get_genes()))
-        for j in range(0, len(population[i].get_genes())):
-            while sum(population[i].get_genes()[j]) > 3:
-                list_positions_ones = [n for n, x in enumerate(population[i].get_genes()[j]) if x == 1]
-                random_one = randint(0, len(list_positions_ones)-1)
-                population[i].get_genes()[j][list_positions_ones[random_one]] = 0
-        population[i].set_genes(transpose_matrix(population[i].get_genes()))
-
         # III)
-        di_graph = convert_matrix_to_digraph(population[i].get_genes())
-        while not find_most_repeated_cycles(di_graph) == []:
-            most_repeated_cycles = find_most_repeated_cycles(di_graph)
-            most_repeated_cycles.sort(key=lambda x: x[1], reverse=True)  # A sorting of the list, bigger ones first
-            di_graph.remove_edge(most_repeated_cycles[0][0][0], most_repeated_cycles[0][0][1])
-
-        repaired_population.append(Chromosome(convert_digraph_to_matrix(di_graph)))
+        repaired_chromosome = Chromosome.from_columns(cycles_breaker(population_columns[i]))
+        repaired_chromosome.inherit_scores(population[i], population[i].different_columns(repaired_chromosome))
+        repaired_population.append(repaired_chromosome)
     return repaired_population
 
 
 # FUNCTION: diagonal_loops_breaker
-def diagonal_loops_breaker(matrix):
+def diagonal_loops_breaker(genes):
     """
     Breaks cycles when the i and j are the same. Example: edge (1,1), edge (2,2), etc.
 
     Args:
-        matrix : MATRIX[[INT, INT, ...], [INT, INT, ...], ...]
-            This matrix represents the genes of a chromosome
+        genes : ARRAY(n, n) or ARRAY(pop_size, n, n)
+            The genes of a chromosome, or the stacked genes of a population
+    """
+    diagonal = np.arange(genes.shape[-1])
+    genes[..., diagonal, diagonal] = 0
+
+
+# FUNCTION: in_degree_limiter
+def in_degree_limiter(genes, max_parents, rng=None):
+    """
+    Restricts the number of edges on every column of every chromosome to 'max_parents'. The in-degrees of all the
+    columns are found at once, and if a column has more edges, a random subset of 'max_parents' of them is kept: every
+    gene gets a random key (the genes that are 0 get a key bigger than any other), the genes of every column are ranked
+    by their keys, and only the ranks lower than 'max_parents' are kept. This is the same as removing random edges
+    one at a time until the column has 'max_parents' edges.
+
+    Args:
+        genes : ARRAY(pop_size, n, n)
+            The stacked genes of a population
+        max_parents : INT
+            The maximum number of parents of every node
+        rng : np.random.Generator
+            The random generator, by default a generator seeded by the 'random' module
+
+    Returns:
+        ARRAY(pop_size, n, n)
+            The genes with at most 'max_parents' ones in every column
+    """
+    if genes.size == 0 or genes.sum(axis=1).max() <= max_parents:
+        return genes
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    keys = rng.random(genes.shape)
+    keys[genes == 0] = 2.0
+    ranks = np.argsort(np.argsort(keys, axis=1), axis=1)
+    return ((genes != 0) & (ranks < max_parents)).astype(np.uint8)
+
+
+# FUNCTION: cycles_breaker
+def cycles_breaker(columns):
+    """
+    Breaks every cycle of a directed graph. In every pass the strongly connected components of the graph are found, and
+    one edge is removed from every component with more than one node: the nodes of the component are ordered by the
+    greedy feedback arc set heuristic of Eades, Lin and Smyth, and among the edges that go backwards in that order (a
+    feedback arc set of the component) the one that is in the most cycles is removed, see 'most_shared_edge_finder'.
+    The passes are repeated until every component has a single node, so the graph is a DAG.
+
+    Args:
+        columns : LIST[INT, INT, ...]
+            The graph packed by column (see 'Chromosome'), without loops on the diagonal
+
+    Returns:
+        LIST[INT, INT, ...]
+            The DAG packed by column
+    """
+    columns = list(columns)
+    while True:
+        components = [component for component in strongly_connected_components(columns) if len(component) > 1]
+        if not components:
+            return columns
+        for component in components:
+            parent, child = most_shared_edge_finder(component, columns)
+            columns[child] &= ~(1 << parent)
+
+
+# FUNCTION: strongly_connected_components
+def strongly_connected_components(columns):
+    """
+    Returns the strongly connected components of a directed graph, found by the algorithm of Tarjan in O(V+E) (written
+    without recursion).
+
+    Args:
+        columns : LIST[INT, INT, ...]
+            The graph packed by column, see 'Chromosome'
+
+    Returns:
+        LIST[LIST[INT, ...], ...]
+            The nodes of every component
     """
-    for i in range(0, len(matrix)):
-        matrix[i][i] = 0
+    num_genes = len(columns)
+    children = children_finder(columns)
+    index = [None] * num_genes
+    low_link = [0] * num_genes
+    on_stack = [False] * num_genes
+    stack = []
+    components = []
+    counter = 0
+    for root in range(0, num_genes):
+        if index[root] is not None:
+            continue
+        work = [(root, bits_iterator(children[root]))]
+        index[root] = low_link[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while work:
+            node, pending_children = work[-1]
+            for child in pending_children:
+                if index[child] is None:
+                    index[child] = low_link[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, bits_iterator(children[child])))
+                    break
+                elif on_stack[child]:
+                    low_link[node] = min(low_link[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    low_link[work[-1][0]] = min(low_link[work[-1][0]], low_link[node])
+                if low_link[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
 
 
-# FUNCTION: find_most_repeated_cycles
-def find_most_repeated_cycles(di_graph):
+# FUNCTION: eades_lin_smyth_order
+def eades_lin_smyth_order(component, columns, children):
     """
-    Returns a list filled with this format for each element: [edge : amount_of_appearances].
+    Orders the nodes of a component by the greedy heuristic of Eades, Lin and Smyth: sinks are moved to the end and
+    sources to the beginning of the order while there are any, and otherwise the node with the biggest difference
+    between its out-degree and its in-degree goes to the beginning. The edges that go backwards in the order are a
+    small feedback arc set.
 
     Args:
-        di_graph : nx.DiGraph()
-            A networkx DiGraph class for representing DAG
+        component : LIST[INT, ...]
+            The nodes of a strongly connected component
+        columns : LIST[INT, INT, ...]
+            The graph packed by column (the parents of every node)
+        children : LIST[INT, INT, ...]
+            The children of every node, see 'children_finder'
 
     Returns:
-        MATRIX[[TUPLE, INT], [TUPLE, INT], [TUPLE, INT], ...]
-            If we have at least one edge with one appearance
-        MATRIX[]
-            If we don't have edges
+        LIST[INT, ...]
+            The nodes of the component in the new order
     """
-    list_all_cycles = []
-    cycles = list(nx.simple_cycles(di_graph))
-    for i in range(0, len(cycles)):
-        list_all_cycles.append(find_cycle_edges(cycles[i], di_graph.edges(cycles[i])))
-    flatted_edges = sum(list_all_cycles, [])  # This flattens the nested list of edges
+    remaining = 0
+    for node in component:
+        remaining |= 1 << node
+    beginning = []
+    end = []
+    while remaining:
+        changed = True
+        while changed:
+            changed = False
+            for node in bits_iterator(remaining):
+                if not children[node] & remaining:
+                    end.append(node)
+                    remaining &= ~(1 << node)
+                    changed = True
+                elif not columns[node] & remaining:
+                    beginning.append(node)
+                    remaining &= ~(1 << node)
+                    changed = True
+        if remaining:
+            node = max(bits_iterator(remaining), key=lambda x: (children[x] & remaining).bit_count() -
+                       (columns[x] & remaining).bit_count())
+            beginning.append(node)
+            remaining &= ~(1 << node)
+    return beginning + end[::-1]
 
-    # This list contains a list of edges and their appearances on the list, but only appearances bigger than 0
-    checked_edges = []
-    while len(flatted_edges) > 0:
-        cont = flatted_edges.count(flatted_edges[0])
-        if cont > 0:  # Amount of appearances bigger than 1
-            checked_edges.append([flatted_edges[0], cont])
-        # This remove a value from a list
-        flatted_edges[:] = (value for value in flatted_edges if value != flatted_edges[0])
-    return checked_edges
 
+# FUNCTION: most_shared_edge_finder
+def most_shared_edge_finder(component, columns):
+    """
+    Returns the edge of a strongly connected component that should be removed first: the backward edge (u -> v) of the
+    order of 'eades_lin_smyth_order' that is in the most cycles. Every cycle through u -> v goes back from v to u by
+    forward edges, so the edge is scored by into[u] * out[v], where into[x] and out[x] are the numbers of paths made of
+    forward edges that end and start in the node x: an estimate of the cycles of the edge that is found for all the
+    edges by a single pass over the order (forwards for 'into' and backwards for 'out'), so the cycles are never
+    enumerated.
+
+    Args:
+        component : LIST[INT, ...]
+            The nodes of a strongly connected component with more than one node
+        columns : LIST[INT, INT, ...]
+            The graph packed by column
+
+    Returns:
+        TUPLE(INT, INT)
+            The edge (parent, child) to be removed
+    """
+    children = children_finder(columns)
+    order = eades_lin_smyth_order(component, columns, children)
+    position = {node: k for k, node in enumerate(order)}
+    mask = 0
+    for node in component:
+        mask |= 1 << node
+
+    # number of forward paths that end in every node (forward pass) and that start in every node (backward pass)
+    into = {}
+    for node in order:
+        into[node] = 1 + sum(into[parent] for parent in bits_iterator(columns[node] & mask)
+                             if position[parent] < position[node])
+    out = {}
+    for node in reversed(order):
+        out[node] = 1 + sum(out[child] for child in bits_iterator(children[node] & mask)
+                            if position[child] > position[node])
+
+    best_edge = None
+    best_count = -1
+    for parent in order:
+        for child in bits_iterator(children[parent] & mask):
+            if position[child] <= position[parent] and into[parent] * out[child] > best_count:
+                best_edge = (parent, child)
+                best_count = into[parent] * out[child]
+    return best_edge
 
-# FUNCTION: find_cycle_edges
-def find_cycle_edges(nodes, all_edges):
+
+# FUNCTION: children_finder
+def children_finder(columns):
     """
-    Returns all the edges between a set of certain nodes.
+    An auxiliary function that returns the children of every node of a graph packed by column.
 
     Args:
-        nodes : LIST[INT, INT, ...]
-            The nodes that matters for this filtering edges purpose
-        all_edges : LIST[TUPLE, TUPLE, ...]
-            All the edges of certain chromosome
+        columns : LIST[INT, INT, ...]
+            The graph packed by column (the parents of every node)
 
     Returns:
-        LIST[TUPLE, TUPLE, ...]
-            This list contains all the edges that belong to a set of nodes
-    """
-    edges = []
-    for i in range(0, len(all_edges)):
-        edge = all_edges[i]
-
-        cont = 0
-        for j in range(0, len(nodes)):
-            if edge[0] == nodes[j]:
-                cont += 1
-            if edge[1] == nodes[j]:
-                cont += 1
-
-        if cont == 2:
-            edges.append(edge)
-    return edges
+        LIST[INT, INT, ...]
+            The bitset of the children of every node
+    """
+    children = [0] * len(columns)
+    for j in range(0, len(columns)):
+        for i in bits_iterator(columns[j]):
+            children[i] |= 1 << j
+    return children
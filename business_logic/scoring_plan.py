@@ -0,0 +1,320 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.gram_tensors import SufficientStatistics, gram_tensors_creator
+import math
+import numpy as np
+import warnings
+
+
+# CLASS: ScoringPlan
+class ScoringPlan:
+    """
+    Everything the Patton-Norris marginal likelihood needs for a dataset and a time lag, computed once: the Gram
+    tensors of the lagged replicates and the constants of the closed form of f(Q | DAG) (page 33 of Kris Patton's
+    master's thesis, terms g, v0, sigma all equal to 1.0). The cotemporal paradigm is the lag 0, 'next step one' is
+    the lag 1 and 'next step one-two' is the lag 2, but any lag shorter than the series can be scored.
+
+    The log likelihood of a DAG is the sum of the terms of every family (a child and its parents) minus 1.0. The
+    'lgamma' function is used for the coefficient, so there is no overflow for long series (math.gamma overflows
+    when r*t is bigger than about 340).
+
+    Args:
+        gram_tensors : GramTensors
+            The products of the lagged replicates, see 'gram_tensors_creator'
+        lag : INT
+            The number of time points between the parent data and the child data
+
+    Attributes:
+        gram_tensors : GramTensors
+            The products of the lagged replicates
+        lag : INT
+            The number of time points between the parent data and the child data
+        log_without_parents : FLOAT
+            The term of a node without parents
+        log_coef : FLOAT
+            The coefficient of the term of a node with at least one parent
+        exponent : FLOAT
+            The power applied to the sum over the replicates, -(r*t+1)/2
+    """
+    # CONSTRUCTOR
+    def __init__(self, gram_tensors, lag):
+        self.gram_tensors = gram_tensors
+        self.lag = lag
+        _r = gram_tensors.get_num_reps()
+        _n = gram_tensors.get_num_obs()
+        self.log_without_parents = (-0.5 * _r * _n) * math.log(2.0 * math.pi * math.e)
+        self.log_coef = -0.5 * _r * _n * math.log(math.pi) + math.lgamma((_r * _n + 1) / 2.0)
+        self.exponent = -(_r * _n + 1) * 0.5
+
+    # ACCESSOR METHODS
+    def get_gram_tensors(self):
+        return self.gram_tensors
+
+    def get_lag(self):
+        return self.lag
+
+    def get_num_genes(self):
+        return self.gram_tensors.get_num_genes()
+
+    # METHODS
+    def score_families(self, families):
+        """
+        Computes the term of many families at once. The families are grouped by their number of parents and every
+        group is scored with a few stacked NumPy calls over arrays of shape (batch, r, k, k), see 'cholesky_terms'.
+        If a group has matrices that are not positive definite, a warning is shown and only the families of those
+        matrices are scored by 'slogdet_terms', so the score of a family doesn't depend on the other families of the
+        batch.
+
+        Args:
+            families : LIST[TUPLE(INT, TUPLE(INT, ...)), ...]
+                The families to be scored, every one as (child, parents)
+
+        Returns:
+            ARRAY(FLOAT)
+                The log likelihood contribution of every family, in the same order
+        """
+        scores = np.empty(len(families), dtype=np.float64)
+        groups = {}
+        for _index, (_child, _parents) in enumerate(families):
+            groups.setdefault(len(_parents), []).append(_index)
+
+        for _k, _indexes in groups.items():
+            if _k == 0:
+                scores[_indexes] = self.log_without_parents
+                continue
+            _children = np.array([families[_index][0] for _index in _indexes], dtype=np.intp)
+            _parents = np.array([sorted(families[_index][1]) for _index in _indexes], dtype=np.intp)
+            _rows = _parents[:, :, None]
+            _cols = _parents[:, None, :]
+
+            # shapes: (b, r), (b, r, k, k), (b, r, k), (b, k, k)
+            _child_values = np.transpose(self.gram_tensors.child_gram[:, _children, _children])
+            _parent_blocks = np.transpose(self.gram_tensors.parent_gram[:, _rows, _cols], (1, 0, 2, 3))
+            _cross = np.transpose(self.gram_tensors.cross_gram[:, _parents, _children[:, None]], (1, 0, 2))
+            _avg = self.gram_tensors.avg_parent_gram[_rows, _cols]
+            _blocks = _parent_blocks + _avg[:, None, :, :]
+
+            try:
+                _terms = self.cholesky_terms(_child_values, _cross, _avg, _blocks)
+            except np.linalg.LinAlgError:
+                # only the families that fail are scored by 'slogdet', so a score never depends on its batch
+                _failing = not_positive_definite_finder(_avg, _blocks)
+                _passing = ~_failing
+                warnings.warn(str(np.count_nonzero(_failing)) + " of the " + str(len(_indexes)) + " families with " +
+                              str(_k) + " parents have matrices that are not positive definite, they are scored "
+                              "with 'slogdet' instead of the Cholesky factors", RuntimeWarning)
+                _terms = np.empty(len(_indexes), dtype=np.float64)
+                if np.any(_passing):
+                    _terms[_passing] = self.cholesky_terms(_child_values[_passing], _cross[_passing], _avg[_passing],
+                                                           _blocks[_passing])
+                _terms[_failing] = self.slogdet_terms(_child_values[_failing], _cross[_failing], _avg[_failing],
+                                                      _blocks[_failing])
+            scores[_indexes] = _terms
+        return scores
+
+    def cholesky_terms(self, child_values, cross, avg, blocks):
+        """
+        Computes the terms of a group of families with the same number of parents through the Cholesky factors of the
+        averaged parent Gram blocks and of P_i + A: the log determinants are read from the diagonals of the factors
+        and the quadratic forms are found with a triangular solve.
+
+        Args:
+            child_values : ARRAY(b, r)
+                The child Gram value of every family and replicate
+            cross : ARRAY(b, r, k)
+                The parent-child cross products of every family and replicate
+            avg : ARRAY(b, k, k)
+                The averaged parent Gram block (A) of every family
+            blocks : ARRAY(b, r, k, k)
+                The sum P_i + A of every family and replicate
+
+        Returns:
+            ARRAY(FLOAT)
+                The log likelihood contribution of every family
+
+        Raises:
+            np.linalg.LinAlgError
+                If one of the matrices is not positive definite
+        """
+        _r = self.gram_tensors.get_num_reps()
+        _chol_avg = np.linalg.cholesky(avg)
+        _chol_blocks = np.linalg.cholesky(blocks)
+        _logdet_avg = 2.0 * np.sum(np.log(np.diagonal(_chol_avg, axis1=-2, axis2=-1)), axis=-1)
+        _logdet_blocks = 2.0 * np.sum(np.log(np.diagonal(_chol_blocks, axis1=-2, axis2=-1)), axis=-1)
+
+        # forward substitution L y = c, vectorized over families and replicates: c' (P_i + A)^-1 c = y'y
+        _solved = np.empty_like(cross)
+        for _i in range(0, cross.shape[-1]):
+            _partial = np.sum(_chol_blocks[..., _i, :_i] * _solved[..., :_i], axis=-1)
+            _solved[..., _i] = (cross[..., _i] - _partial) / _chol_blocks[..., _i, _i]
+        _quadratic = np.sum(_solved * _solved, axis=-1)
+        _xxxtemp = 1.0 + np.sum(child_values - _quadratic, axis=1)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            _terms = self.log_coef + self.exponent * np.log(_xxxtemp) + 0.5 * _r * _logdet_avg - \
+                0.5 * np.sum(_logdet_blocks, axis=1)
+        return np.where(_xxxtemp > 0, _terms, -np.inf)
+
+    def slogdet_terms(self, child_values, cross, avg, blocks):
+        """
+        Computes the same terms as 'cholesky_terms' with 'np.linalg.slogdet' and 'np.linalg.solve', which also work
+        for matrices that are not positive definite. Those families get a score of -inf.
+
+        Args:
+            child_values : ARRAY(b, r)
+                The child Gram value of every family and replicate
+            cross : ARRAY(b, r, k)
+                The parent-child cross products of every family and replicate
+            avg : ARRAY(b, k, k)
+                The averaged parent Gram block (A) of every family
+            blocks : ARRAY(b, r, k, k)
+                The sum P_i + A of every family and replicate
+
+        Returns:
+            ARRAY(FLOAT)
+                The log likelihood contribution of every family
+        """
+        _r = self.gram_tensors.get_num_reps()
+        _sign_avg, _logdet_avg = np.linalg.slogdet(avg)
+        _sign_blocks, _logdet_blocks = np.linalg.slogdet(blocks)
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            try:
+                _solved = np.linalg.solve(blocks, cross[..., None])[..., 0]
+            except np.linalg.LinAlgError:
+                _solved = np.matmul(np.linalg.pinv(blocks), cross[..., None])[..., 0]
+            _quadratic = np.sum(cross * _solved, axis=2)
+            _xxxtemp = 1.0 + np.sum(child_values - _quadratic, axis=1)
+            _valid = (_sign_avg > 0) & np.all(_sign_blocks > 0, axis=1) & (_xxxtemp > 0)
+            _terms = self.log_coef + self.exponent * np.log(_xxxtemp) + 0.5 * _r * _logdet_avg - \
+                0.5 * np.sum(_logdet_blocks, axis=1)
+        return np.where(_valid, _terms, -np.inf)
+
+    def score_family(self, child, parents):
+        """
+        Computes the term of a single family.
+
+        Args:
+            child : INT
+                The node whose family is being scored
+            parents : LIST[INT, INT, ...]
+                The parents of the child, an empty list for a node without parents
+
+        Returns:
+            FLOAT
+                The log likelihood contribution of the family
+        """
+        return float(self.score_families([(child, tuple(parents))])[0])
+
+    def score_parent_sets(self, parent_sets):
+        """
+        Computes the log likelihood of a DAG given the parents of every node.
+
+        Args:
+            parent_sets : LIST[TUPLE(INT, ...), ...]
+                The parents of every node, in the order of the nodes
+
+        Returns:
+            FLOAT
+                The log of the marginal likelihood of the DAG
+        """
+        families = [(child, tuple(parents)) for child, parents in enumerate(parent_sets)]
+        return float(np.sum(self.score_families(families))) - 1.0
+
+    def score(self, adjacency):
+        """
+        Computes the log likelihood of a DAG given its adjacency matrix, where the entry (i, j) is not 0 if there is
+        an edge from i to j.
+
+        Args:
+            adjacency : MATRIX[[INT, INT, ...], [INT, INT, ...], ...]
+                The adjacency matrix of the DAG
+
+        Returns:
+            FLOAT
+                The log of the marginal likelihood of the DAG
+        """
+        return self.score_parent_sets(parent_sets_extractor(adjacency))
+
+
+# FUNCTION: scoring_plan_creator
+def scoring_plan_creator(rep, lag):
+    """
+    Builds the scoring plan of the replicates for a time lag. The replicates can also be given by their
+    'SufficientStatistics', if they were accumulated for the lag.
+
+    Args:
+        rep : LIST[rep1, rep2, rep3, ...] or SufficientStatistics
+            A repN is a biological data used to calc the likelihood result
+        lag : INT
+            The number of time points between the parent data and the child data, 0 for the cotemporal paradigm
+
+    Returns:
+        ScoringPlan
+            The plan of the replicates for the lag
+    """
+    if isinstance(rep, SufficientStatistics):
+        return ScoringPlan(rep.get_gram_tensors(lag), lag)
+    return ScoringPlan(gram_tensors_creator(rep, lag), lag)
+
+
+# FUNCTION: not_positive_definite_finder
+def not_positive_definite_finder(avg, blocks):
+    """
+    Finds the families of a group whose averaged parent Gram block or one of whose P_i + A matrices is not positive
+    definite, trying the Cholesky factors of every family on its own.
+
+    Args:
+        avg : ARRAY(b, k, k)
+            The averaged parent Gram block (A) of every family
+        blocks : ARRAY(b, r, k, k)
+            The sum P_i + A of every family and replicate
+
+    Returns:
+        ARRAY(BOOLEAN)
+            True for every family whose matrices can't be factored
+    """
+    failing = np.zeros(len(avg), dtype=bool)
+    for _b in range(0, len(avg)):
+        try:
+            np.linalg.cholesky(avg[_b])
+            np.linalg.cholesky(blocks[_b])
+        except np.linalg.LinAlgError:
+            failing[_b] = True
+    return failing
+
+
+# FUNCTION: parent_sets_extractor
+def parent_sets_extractor(adjacency):
+    """
+    Returns the parents of every node, read from the nonzero entries of the columns of one adjacency matrix or of a
+    stack of them, with a single vectorized call and without building any graph object.
+
+    Args:
+        adjacency : ARRAY(n, n) or ARRAY(p, n, n)
+            The adjacency matrix of a DAG, or a stack of 'p' adjacency matrices
+
+    Returns:
+        LIST[TUPLE(INT, ...), ...]
+            The parents of every node, for a single matrix
+        LIST[LIST[TUPLE(INT, ...), ...], ...]
+            The parents of every node of every matrix, for a stack
+    """
+    adjacency = np.asarray(adjacency) != 0
+    single = adjacency.ndim == 2
+    if single:
+        adjacency = adjacency[None, :, :]
+    num_matrices, num_genes = adjacency.shape[0], adjacency.shape[1]
+
+    # the nonzeros of the transposed stack come sorted by matrix, child and parent
+    parents = np.nonzero(np.transpose(adjacency, (0, 2, 1)))[2].tolist()
+    in_degrees = adjacency.sum(axis=1).ravel().tolist()
+    parent_sets = []
+    start = 0
+    for in_degree in in_degrees:
+        parent_sets.append(tuple(parents[start:start+in_degree]))
+        start += in_degree
+    parent_sets = [parent_sets[i*num_genes:(i+1)*num_genes] for i in range(0, num_matrices)]
+    return parent_sets[0] if single else parent_sets
@@ -1,12 +1,13 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: January, 2016.
-# Updated at: April, 2016.
+# Updated at: October, 2026.
 
 # LIBRARIES
-from business_logic.chromosome import Chromosome
 from business_logic.general_functions import *
-from copy import deepcopy
+from business_logic.population import Population
 from random import randint
+import math
+import numpy as np
 import random
 
 
@@ -17,37 +18,57 @@ import random
 # FUNCTION: fitness_calculator
 def fitness_calculator(ordered_population):
     """
-    Calculates the 'fitness' that will be used for doing a rank based selection.
+    Calculates the 'fitness' that will be used for doing a rank based selection: the chromosome at the rank i (from 0)
+    gets 2*(size-i)/(size*(size+1)), so the fitness of the whole population sums 1.
 
     Args:
-        ordered_population : LIST[Chromosome]
+        ordered_population : LIST[Chromosome] or Population
             A list filled with 'Chromosome' objects sorted by the likelihood result
     """
     size = len(ordered_population)
-    for i in range(0, size):
-        ordered_population[i].fitness = (2*(size+1-(i+1)))/(size*(size+1))
+    fitness = (2.0*np.arange(size, 0, -1))/(size*(size+1))
+    if isinstance(ordered_population, Population):
+        ordered_population.get_fitness()[:] = fitness
+    else:
+        for chromosome, value in zip(ordered_population, fitness.tolist()):
+            chromosome.fitness = value
 
 
 # FUNCTION: selection_function
-def selection_function(population, num_survivors, selection_prop):
+def selection_function(population, num_survivors, selection_prop, by_score=False, by_equivalence=False,
+                       acyclic=False, rng=None):
     """
     Creates the new generation of chromosomes by doing the crossover on every two parents. The elitism happens here.
+    The parents of the whole generation are drawn at once by a roulette over the fitness, see 'match_list_finder'.
+    When the population is a 'Population' the new generation is also a 'Population', and the crossover of all the
+    pairs is done over it by 'crossover_kernel' (or by 'acyclic_crossover_kernel').
 
     Args:
-        population : LIST[Chromosome]
+        population : LIST[Chromosome] or Population
             A list filled with 'Chromosome' objects
         num_survivors : INT
             The number of survivors, based on pre-calculated data using the percentage of elitism
         selection_prop : FLOAT
             The desired probability of selection
+        by_score : BOOLEAN
+            True for finding the unique chromosomes of the elitism by their relative likelihood result instead of
+            their genes, see 'select_uniques_chromosomes'
+        by_equivalence : BOOLEAN
+            True for finding the unique chromosomes of the elitism by their Markov equivalence class, so equivalent
+            DAGs do not take the place of each other among the survivors
+        acyclic : BOOLEAN
+            True for doing the crossover with 'acyclic_crossover_function', so the offsprings of DAGs are DAGs
+        rng : np.random.Generator
+            The random generator of the roulette and of 'crossover_kernel', by default a generator seeded by the
+            'random' module
     Returns:
-        LIST[Chromosome]
+        LIST[Chromosome] or Population
             A list filled with 'Chromosome' objects, containing the new population
     """
     match_list = match_list_creator(population)
 
     # Elitism
-    unique_population = select_uniques_chromosomes(population)
+    unique_population = select_uniques_chromosomes(population, by_score, by_equivalence)
     if len(unique_population) > num_survivors:
         new_population = unique_population[:num_survivors]
     else:
@@ -57,12 +78,23 @@ def selection_function(population, num_survivors, selection_prop):
             num_survivors += 1
 
     # Selection
-    for i in range(0, len(population)-num_survivors, 2):
-        random1 = random.random()
-        random2 = random.random()
-        children = crossover_function(population[match_list_finder(match_list, random1)],
-                                      population[match_list_finder(match_list, random2)],
-                                      selection_prop)
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    num_matings = len(range(0, len(population)-num_survivors, 2))
+    parents = match_list_finder(match_list, rng.random((num_matings, 2)))
+    if isinstance(population, Population):
+        survivors = np.array([chromosome.index for chromosome in new_population], dtype=np.intp)
+        new_population = population.take(np.concatenate((survivors, parents.ravel())))
+        if acyclic:
+            acyclic_crossover_kernel(new_population, len(survivors), selection_prop)
+        else:
+            crossover_kernel(new_population, len(survivors), selection_prop, rng)
+        return new_population
+    for parent1, parent2 in parents.tolist():
+        if acyclic:
+            children = acyclic_crossover_function(population[parent1], population[parent2], selection_prop)
+        else:
+            children = crossover_function(population[parent1], population[parent2], selection_prop)
         new_population.append(children[0])
         new_population.append(children[1])
     return new_population
@@ -107,54 +139,196 @@ def crossover_function(parent_a, parent_b, selection_prop):
         TUPLE(Chromosome, Chromosome)
             A tuple formed by two offsprings, represented by a 'Chromosome' object
     """
-    genes_a = deepcopy(parent_a.get_genes())
-    genes_b = deepcopy(parent_b.get_genes())
+    offspring_a = parent_a.copy()
+    offspring_b = parent_b.copy()
+    match_prop = random.random()
+    if match_prop <= selection_prop:
+        column_number = randint(0, offspring_a.get_num_genes()-1)
+        offspring_a.swap_column(offspring_b, column_number)
+        # the family of the swapped column is exactly the family of the other parent, so its score moves with it
+        family_scores_swapper(offspring_a, offspring_b, column_number)
+    return offspring_a, offspring_b
+
+
+# FUNCTION: crossover_kernel
+def crossover_kernel(population, first, selection_prop, rng):
+    """
+    Does the crossover of 'crossover_function' on a whole generation at once. From the position 'first', every two
+    chromosomes of the population are a pair of parents that are replaced by their offsprings. The crossover decision
+    and the swapped column of every pair are drawn together, and the columns are swapped by fancy indexing over the
+    gene tensor, so the offsprings have the same distribution as the ones of 'crossover_function'.
+
+    Args:
+        population : Population
+            The parents, in pairs from the position 'first'
+        first : INT
+            The position of the first parent (the chromosomes before it are not changed)
+        selection_prop : FLOAT
+            The desired probability of selection
+        rng : np.random.Generator
+            The random generator
+    """
+    genes = population.get_genes()
+    num_pairs = (len(population)-first)//2
+    crossed = np.flatnonzero(rng.random(num_pairs) <= selection_prop)
+    column_numbers = rng.integers(0, genes.shape[2], size=len(crossed))
+    offsprings_a = first + 2*crossed
+    offsprings_b = offsprings_a + 1
+    columns_a = genes[offsprings_a, :, column_numbers]
+    genes[offsprings_a, :, column_numbers] = genes[offsprings_b, :, column_numbers]
+    genes[offsprings_b, :, column_numbers] = columns_a
+    for a, b, column_number in zip(offsprings_a.tolist(), offsprings_b.tolist(), column_numbers.tolist()):
+        family_scores_swapper(population[a], population[b], column_number)
+
+
+# FUNCTION: acyclic_crossover_function
+def acyclic_crossover_function(parent_a, parent_b, selection_prop):
+    """
+    Does the crossover of 'crossover_function' given two parents whose genes are DAGs, and returns two offsprings that
+    are also DAGs. The swapped column gives new parents to its node, and a cycle is only created when one of the new
+    parents is a descendant of the node; those parents are dropped from the column, so the rest of the swap is kept.
+
+    Args:
+        parent_a : Chromosome
+            An object 'Chromosome' that will be used for mating
+        parent_b : Chromosome
+            An object 'Chromosome' that will be used for mating
+        selection_prop : FLOAT
+            The desired probability of selection
+
+    Returns:
+        TUPLE(Chromosome, Chromosome)
+            A tuple formed by two offsprings, represented by a 'Chromosome' object
+    """
+    offspring_a = parent_a.copy()
+    offspring_b = parent_b.copy()
+    acyclic_column_swapper(offspring_a, offspring_b, selection_prop)
+    return offspring_a, offspring_b
+
+
+# FUNCTION: acyclic_crossover_kernel
+def acyclic_crossover_kernel(population, first, selection_prop):
+    """
+    Does the crossover of 'acyclic_crossover_function' on a whole generation, in place. From the position 'first',
+    every two chromosomes of the population are a pair of parents that are replaced by their offsprings.
+
+    Args:
+        population : Population
+            The parents, in pairs from the position 'first', whose genes are DAGs
+        first : INT
+            The position of the first parent (the chromosomes before it are not changed)
+        selection_prop : FLOAT
+            The desired probability of selection
+    """
+    for a in range(first, len(population)-1, 2):
+        acyclic_column_swapper(population[a], population[a+1], selection_prop)
+
+
+# FUNCTION: acyclic_column_swapper
+def acyclic_column_swapper(offspring_a, offspring_b, selection_prop):
+    """
+    An auxiliary function that swaps a random column of two DAGs with the probability of selection, and drops from
+    the swapped column of every offspring the new parents that would close a cycle.
+
+    Args:
+        offspring_a : Chromosome
+            An object 'Chromosome' whose genes are a DAG, changed in place
+        offspring_b : Chromosome
+            An object 'Chromosome' whose genes are a DAG, changed in place
+        selection_prop : FLOAT
+            The desired probability of selection
+    """
     match_prop = random.random()
     if match_prop <= selection_prop:
-        column_number = randint(0, len(genes_a)-1)
-        for i in range(0, len(genes_a)):
-            genes_a[i][column_number], genes_b[i][column_number] = genes_b[i][column_number], genes_a[i][column_number]
-    return Chromosome(genes_a), Chromosome(genes_b)
+        column_number = randint(0, offspring_a.get_num_genes()-1)
+        offspring_a.swap_column(offspring_b, column_number)
+        family_scores_swapper(offspring_a, offspring_b, column_number)
+        for offspring in (offspring_a, offspring_b):
+            cycle_parents = offspring.get_column(column_number) & offspring.descendants(column_number)
+            if cycle_parents:
+                offspring.set_column(column_number, offspring.get_column(column_number) & ~cycle_parents)
+                offspring.get_changed_columns().add(column_number)
+
+
+# FUNCTION: family_scores_swapper
+def family_scores_swapper(offspring_a, offspring_b, column_number):
+    """
+    Swaps the family score of a column between two offsprings after their genes swapped that column, updating their
+    likelihood result by the difference (or by the sum of their family scores if one of the swapped scores or of the
+    likelihood results is not finite). If one of them has no family scores, the column is marked as changed.
+
+    Args:
+        offspring_a : Chromosome
+            An object 'Chromosome' created by the crossover
+        offspring_b : Chromosome
+            An object 'Chromosome' created by the crossover
+        column_number : INT
+            The column that was swapped
+    """
+    scores_a = offspring_a.get_family_scores()
+    scores_b = offspring_b.get_family_scores()
+    if scores_a is None or scores_b is None:
+        offspring_a.get_changed_columns().add(column_number)
+        offspring_b.get_changed_columns().add(column_number)
+        return
+    score_a = scores_a[column_number]
+    score_b = scores_b[column_number]
+    scores_a[column_number] = score_b
+    scores_b[column_number] = score_a
+    if math.isfinite(score_a) and math.isfinite(score_b) and finite_likelihood(offspring_a) and \
+            finite_likelihood(offspring_b):
+        offspring_a.log_likelihood_result += score_b - score_a
+        offspring_b.log_likelihood_result -= score_b - score_a
+    else:
+        offspring_a.log_likelihood_result = float(sum(scores_a)) - 1.0
+        offspring_b.log_likelihood_result = float(sum(scores_b)) - 1.0
+
+    changed_a = offspring_a.get_changed_columns()
+    changed_b = offspring_b.get_changed_columns()
+    dirty_a = column_number in changed_a
+    dirty_b = column_number in changed_b
+    changed_a.discard(column_number)
+    changed_b.discard(column_number)
+    if dirty_b:
+        changed_a.add(column_number)
+    if dirty_a:
+        changed_b.add(column_number)
 
 
 # FUNCTION: match_list_creator
 def match_list_creator(population):
     """
-    Given a population this function returns a list of probabilities that will be used in the selection process.
+    Given a population this function returns a list of probabilities that will be used in the selection process: the
+    cumulative sum of the fitness of the chromosomes, in the order of the population.
 
     Args:
-        population : LIST[Chromosome]
+        population : LIST[Chromosome] or Population
             A list filled with 'Chromosome' objects
 
     Returns:
-        LIST[FLOAT]
-            A list of probabilities in the range 0 to 1
+        ARRAY(FLOAT)
+            An increasing array of probabilities in the range 0 to 1
     """
-    match_list = []
-    sum_ = 0
-    for i in range(0, len(population)):
-        sum_ += population[i].get_fitness()
-        match_list.append(sum_)
-    return match_list
+    return np.cumsum(population_values(population, "fitness"))
 
 
 # FUNCTION: match_list_finder
 def match_list_finder(match_list, random_num):
     """
     Using the list created in the function 'match_list_creator', this function returns and index that represents the
-    position of a parent in the ordered population that is being mating.
+    position of a parent in the ordered population that is being mating: the first position whose cumulative
+    probability is not smaller than the random number. The position is found by a binary search, and many random
+    numbers can be given at once. A random number bigger than the last probability (the sum of the fitness can be
+    a little smaller than 1 because of the rounding) gives the last position.
 
     Args:
-        match_list : LIST[FLOAT]
-            A list of probabilities in the range 0 to 1
-        random_num: FLOAT
-            A random generated number that is created in the selection function
+        match_list : ARRAY(FLOAT)
+            An increasing array of probabilities in the range 0 to 1
+        random_num: FLOAT or ARRAY(FLOAT)
+            A random generated number that is created in the selection function, or an array of them
 
     Returns:
-        INT
-            An index representing a parent position
+        INT or ARRAY(INT)
+            An index representing a parent position, or an array of them
     """
-    for i in range(0, len(match_list)):
-        if random_num <= match_list[i]:
-            return i
-    return len(match_list)
+    return np.minimum(np.searchsorted(match_list, random_num, side="left"), len(match_list)-1)
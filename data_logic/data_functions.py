@@ -1,6 +1,6 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: January, 2016.
-# Updated at: April, 2016.
+# Updated at: October, 2026.
 
 # LIBRARIES
 import numpy as np
@@ -69,3 +69,29 @@ def zscore_function(rep):
     rep = map(lambda x: np.asmatrix(np.transpose(np.array([sss.zscore(item) for item in np.transpose(np.asarray(x))]))),
               rep)
     return list(rep)
+
+
+# FUNCTION: npy_chunk_reader
+def npy_chunk_reader(filenames, chunk_size):
+    """
+    Creates a chunk reader for replicates stored in '.npy' files (one file per replicate, every row is a time point
+    and every column is a gene). The files are memory-mapped, so only 'chunk_size' rows of every replicate are read
+    at a time. See 'sufficient_statistics_creator'.
+
+    Args:
+        filenames : LIST[STRING, STRING, ...]
+            The paths of the replicate files
+        chunk_size : INT
+            The number of rows read from every replicate at a time
+
+    Returns:
+        FUNCTION
+            A function without arguments that returns a new iterator over the chunks of all the replicates
+    """
+    def chunk_reader():
+        replicates = [np.load(filename, mmap_mode="r") for filename in filenames]
+        if len(set(replicate.shape for replicate in replicates)) != 1:
+            raise ValueError("All the replicates must have the same number of time points and genes")
+        for start in range(0, replicates[0].shape[0], chunk_size):
+            yield [np.array(replicate[start:start+chunk_size]) for replicate in replicates]
+    return chunk_reader
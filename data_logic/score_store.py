@@ -0,0 +1,152 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+import sqlite3
+
+
+# CLASS: ScoreStore
+class ScoreStore:
+    """
+    An on-disk store (SQLite) of family scores that survives between runs. The scores are keyed by the fingerprint of
+    the transformed replicates and the likelihood paradigm, so a run over the same data never computes again a family
+    that a previous run already scored. The store is read once at startup and written in bulk at the end of a run.
+
+    Args:
+        path : STRING
+            The file of the store, created if it does not exist
+        max_entries : INT
+            The maximum number of scores kept after a compaction
+
+    Attributes:
+        path : STRING
+            The file of the store
+        max_entries : INT
+            The maximum number of scores kept after a compaction
+        connection : sqlite3.Connection
+            The open connection to the store
+        run_number : INT
+            The number of this run, used to know which scores were used most recently
+    """
+    # CONSTRUCTOR
+    def __init__(self, path, max_entries=2000000):
+        self.path = path
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS scores ("
+                                "fingerprint TEXT NOT NULL, "
+                                "paradigm INTEGER NOT NULL, "
+                                "child INTEGER NOT NULL, "
+                                "parents TEXT NOT NULL, "
+                                "score REAL NOT NULL, "
+                                "last_run INTEGER NOT NULL, "
+                                "PRIMARY KEY (fingerprint, paradigm, child, parents))")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS scores_last_run ON scores (last_run)")
+        self.connection.commit()
+        last_run = self.connection.execute("SELECT MAX(last_run) FROM scores").fetchone()[0]
+        self.run_number = 1 if last_run is None else last_run+1
+
+    # ACCESSOR METHODS
+    def get_path(self):
+        return self.path
+
+    def get_max_entries(self):
+        return self.max_entries
+
+    # METHODS
+    def load(self, likelihood_function, fingerprint):
+        """
+        Reads every score stored for the data and the paradigm, the least recently used first.
+
+        Args:
+            likelihood_function : INT
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+            fingerprint : STRING
+                The fingerprint of the replicates, see 'dataset_fingerprint'
+
+        Returns:
+            LIST[TUPLE(INT, TUPLE(INT, ...), FLOAT), ...]
+                The stored families, as (child, parents, score)
+        """
+        rows = self.connection.execute("SELECT child, parents, score FROM scores "
+                                       "WHERE fingerprint = ? AND paradigm = ? ORDER BY last_run",
+                                       (fingerprint, likelihood_function))
+        return [(child, parents_decoder(parents), score) for child, parents, score in rows]
+
+    def save(self, likelihood_function, fingerprint, families):
+        """
+        Writes the scores of a run in a single transaction. The families already stored are marked as used by this
+        run, so the compaction keeps them.
+
+        Args:
+            likelihood_function : INT
+                1 = cotemporal, 2 = next_step_one, 3 = next_step_one_two
+            fingerprint : STRING
+                The fingerprint of the replicates, see 'dataset_fingerprint'
+            families : LIST[TUPLE(INT, TUPLE(INT, ...), FLOAT), ...]
+                The families to store, as (child, parents, score)
+        """
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?)",
+                                        [(fingerprint, likelihood_function, child, parents_encoder(parents), score,
+                                          self.run_number) for child, parents, score in families])
+
+    def compact(self):
+        """
+        Deletes the least recently used scores when the store has more than 'max_entries' of them and gives the free
+        space back to the file system.
+
+        Returns:
+            INT
+                The number of deleted scores
+        """
+        size = len(self)
+        if size <= self.max_entries:
+            return 0
+        with self.connection:
+            self.connection.execute("DELETE FROM scores WHERE rowid IN (SELECT rowid FROM scores "
+                                    "ORDER BY last_run LIMIT ?)", (size-self.max_entries,))
+        self.connection.execute("VACUUM")
+        return size-len(self)
+
+    def close(self):
+        """ Closes the connection to the store. """
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+
+# FUNCTION: parents_encoder
+def parents_encoder(parents):
+    """
+    Converts a parent set into the text stored in the column 'parents'.
+
+    Args:
+        parents : LIST[INT, INT, ...]
+            The parents of a child
+
+    Returns:
+        STRING
+            The sorted parents separated by commas
+    """
+    return ",".join(str(parent) for parent in sorted(parents))
+
+
+# FUNCTION: parents_decoder
+def parents_decoder(text):
+    """
+    Converts the text of the column 'parents' into a parent set.
+
+    Args:
+        text : STRING
+            The sorted parents separated by commas
+
+    Returns:
+        TUPLE(INT, INT, ...)
+            The parents of a child
+    """
+    if text == "":
+        return ()
+    return tuple(int(parent) for parent in text.split(","))
@@ -1,6 +1,6 @@
 # Created by: Dr. David John & Kenneth Meza.
 # Created at: January, 2016.
-# Updated at: May, 2016.
+# Updated at: October, 2026.
 
 # LIBRARIES
 from business_logic.models_functions import *
@@ -8,10 +8,15 @@ from business_logic.initialization_functions import *
 from business_logic.mutation_functions import *
 from business_logic.repair_functions import *
 from business_logic.selection_functions import *
-from copy import deepcopy
+from business_logic.composite_runner import composite_runs_executor
+from business_logic.island_model import island_runs_executor
+from business_logic.distributed_runs import coordinator_runs_executor, run_worker
+from business_logic.gram_tensors import sufficient_statistics_creator
 from data_logic.data_functions import *
+from data_logic.score_store import ScoreStore
 import data_logic.data_input as data
 import os
+import sys
 from presentation_logic.IO_functions import *
 
 
@@ -36,69 +41,114 @@ def main():
     per_filter_am = 0.7  # Percentage for filtering values in the amalgamated model
     num_matings = 500  # Amount of matings (generations)
     num_composite_model = 12  # Amount of composite models
+    max_parents = 3  # Maximum number of parents of every gene (edges on every column of the matrix)
+    use_score_table = False  # Precompute every family of at most 'max_parents' parents (in '../Score Tables')
+    use_score_store = False  # Reuse the family scores computed by previous runs over the same data ('../Scores.db')
+    max_stored_scores = 2000000  # Maximum number of family scores kept in the score store
+    replicate_files = []  # '.npy' files (one per replicate) to stream instead of the data in 'data_input.py'
+    chunk_size = 4096  # Number of time points read at a time from every replicate file
+    unique_by_score = False  # Find the unique chromosomes by their relative likelihood result instead of their genes
+    use_equivalence_classes = False  # Treat Markov equivalent DAGs (same CPDAG) as one chromosome, scored only once
+    keep_acyclic = False  # Use crossover and mutation operators that never create cycles, so the repair is skipped
+    use_bigfloat = False  # Calculate the relative likelihood results in quadruple precision (needs 'bigfloat')
+    random_seed = None  # Seed of the whole execution (the same seed gives the same models), None for a random one
+    num_run_workers = 1  # Worker processes for the composite models (None = one per CPU), 1 = run them one by one
+    num_score_workers = 1  # Worker processes that share the scoring of every generation (None = one per CPU)
+    use_islands = False  # Evolve the composite models at the same time as islands that exchange their best chromosomes
+    migration_interval = 25  # Generations between two migrations of the islands
+    num_migrants = 2  # Chromosomes sent by every island in a migration
+    migration_topology = "ring"  # Where the migrants go: "ring" (to the next island) or "random" (a new ring each time)
+    distributed_mode = None  # None, "coordinator" (serve the composite runs to the workers) or "worker" (do them)
+    coordinator_bind_host = "0.0.0.0"  # Interface where the coordinator listens, "0.0.0.0" = every interface
+    coordinator_address = ("localhost", 6000)  # Host (name or IP of the coordinator) and port that the workers dial
+    authkey_variable = "SGA_AUTHKEY"  # Environment variable with the secret key shared by the coordinator and workers
+    num_local_workers = 0  # Workers started by the coordinator on this machine (besides the ones of other machines)
 
     filter_likelihood_selection(likelihood_function)
 
+    if distributed_mode is not None:
+        # The coordinator unpickles what the workers send, so it only accepts the ones that know a secret key
+        if not os.environ.get(authkey_variable):
+            sys.exit("ERROR: You need to set the secret key of the coordinator and the workers in the environment "
+                     "variable '" + authkey_variable + "'.")
+        coordinator_authkey = os.environ[authkey_variable].encode()
+
     # The variable 'rep' can be found inside 'data_logic.data_input.py'. Refers to replications.
-    data.rep = data_switcher(data.a_switch_log, data.a_switch_zscore, data.rep)  # log & zscore transforms
+    if replicate_files:
+        # Only the sufficient statistics of the (transformed) replicates are kept in memory
+        print("* Reading the replicate files...")
+        rep = sufficient_statistics_creator(npy_chunk_reader(replicate_files, chunk_size),
+                                            [paradigm_lag(likelihood_function)], data.a_switch_log,
+                                            data.a_switch_zscore)
+        print("\tread " + str(rep.get_num_times()) + " time points of " + str(rep.get_num_reps()) + " replicates.\n")
+    else:
+        rep = data_switcher(data.a_switch_log, data.a_switch_zscore, data.rep)  # log & zscore transforms
+    fingerprint = find_dataset_fingerprint(rep)  # hashed once, identifies the scores of this data
+
+    if use_score_table:
+        print("* Loading the family score table...")
+        family_score_table_loader(rep, likelihood_function, "../Score Tables", max_parents)
+        print("\tloaded.\n")
+
+    if use_score_store:
+        print("* Loading the score store...")
+        score_store = ScoreStore("../Scores.db", max_stored_scores)
+        family_score_cache.preload(likelihood_function, fingerprint, score_store.load(likelihood_function, fingerprint))
+        print("\tloaded " + str(len(family_score_cache)) + " family scores.\n")
+
+    if num_score_workers != 1:
+        print("* Starting the scoring workers...")
+        scoring_pool = scoring_pool_starter(rep, likelihood_function, num_score_workers)
+        print("\tstarted " + str(scoring_pool.get_num_workers()) + " workers.\n")
+
+    if distributed_mode == "worker":
+        # A worker only does the composite runs of the coordinator, the models are created by the coordinator
+        print("* Working for the coordinator at " + str(coordinator_address) + "...")
+        num_runs = run_worker(coordinator_address, coordinator_authkey, rep)
+        print("\tdone " + str(num_runs) + " composite runs.\n")
+        scoring_pools_closer()
+        return
 
     # Pre-calculation of values
     num_survivors = calc_num_survivors(pop_size, per_elitism)
 
     print("=== SIMPLE GENETIC ALGORITHM ===\n")
     amalgamated_population = []  # contains the chromosomes that will be used for creating the amalgamated model
-    for i in range(0, num_composite_model):
+    run_parameters = {"pop_size": pop_size, "num_genes": num_genes, "per_ones": per_ones,
+                      "likelihood_function": likelihood_function, "num_survivors": num_survivors,
+                      "selection_prop": selection_prop, "mutation_prop": mutation_prop, "num_mutations": num_mutations,
+                      "num_matings": num_matings, "max_parents": max_parents, "by_score": unique_by_score,
+                      "by_equivalence": use_equivalence_classes, "acyclic": keep_acyclic, "use_bigfloat": use_bigfloat}
+    if use_islands:
+        print("* Evolving " + str(num_composite_model) + " islands at the same time...\n")
+        composite_results = island_runs_executor(num_composite_model, rep, random_seed, migration_interval,
+                                                 num_migrants, migration_topology, use_score_store, **run_parameters)
+    elif distributed_mode == "coordinator":
+        # The coordinator listens on the port of 'coordinator_address', the host is the one the workers dial
+        bind_address = (coordinator_bind_host, coordinator_address[1])
+        print("* Serving " + str(num_composite_model) + " composite runs at " + str(bind_address) + "...\n")
+        composite_results = coordinator_runs_executor(num_composite_model, rep, coordinator_authkey, random_seed,
+                                                      bind_address, num_local_workers, use_score_store,
+                                                      **run_parameters)
+    else:
+        composite_results = composite_runs_executor(num_composite_model, rep, random_seed, num_run_workers,
+                                                    use_score_store, **run_parameters)
+    for i, composite_result in enumerate(composite_results):
         print("* GENERATING COMPOSITE MODEL " + str(i+1))
+        current_population = composite_result.get_population()
+        print("* The last generation ends with " + str(len(current_population)) + " unique chromosomes, after " +
+              str(composite_result.get_num_evaluations()) + " evaluations of chromosomes.")
 
-        # Creation of the initial population using "seeding" method. See the function documentation.
-        print("* Creating the initial population...")
-        current_population = seed_population(pop_size, num_genes, per_ones, likelihood_function, data.rep)
-        print("* Initial Population created, having " + str(len(select_uniques_chromosomes(current_population))) +
-              " unique chromosomes.")
-
-        for j in range(0, num_matings):
-            print("* Working on generation " + str(j + 1) + "...")
-            # 1) Given a sorted population, this function add ranks used on selection
-            fitness_calculator(current_population)
-
-            # 2) Creation of the new population, by doing the selection process
-            new_population = selection_function(current_population, num_survivors, selection_prop)
-
-            # 3) Application of the mutation function to the population
-            mutation_function(new_population, mutation_prop, num_mutations)
-
-            # 4) Application of the repairing function to the population
-            current_population = repair_population(new_population)
-
-            # 5) The applying of the likelihood on every chromosome to obtain the 'likelihood result'
-            likelihood_result_calculator(current_population, likelihood_function, data.rep)
-
-            # 6) Finding the 'relative likelihood result' for every chromosome
-            relative_likelihood_result_calculator(current_population)
-
-            # 7) Sorting of the population based on the 'likelihood result' of every chromosome
-            relative_likelihood_result_sorting(current_population)
-
-            print("\tcreated.")
-
-        # Removing from the population the repeated chromosomes
-        current_population = select_uniques_chromosomes(current_population)
-        print("* The last generation ends with " + str(len(current_population)) + " unique chromosomes.")
-
-        # Recalculation of 'likelihood' values and fitness on the current population (unique chromosomes)
-        likelihood_result_calculator(current_population, likelihood_function, data.rep)
-        relative_likelihood_result_calculator(current_population)
-        relative_likelihood_result_sorting(current_population)
-        fitness_calculator(current_population)
+        # The families used by a worker process are kept, so they can be saved in the score store
+        family_score_cache.merge_families(likelihood_function, fingerprint, composite_result.get_families(),
+                                          composite_result.get_disk_hits())
 
         # All the chromosomes in the unique current population are appended to the amalgamated population
         for chromosome in current_population:
-            amalgamated_population.append(Chromosome(deepcopy(chromosome.get_genes())))
+            amalgamated_population.append(chromosome.copy())
 
-        # Creating and displaying of the composite model
-        print("* Creating the composite model...")
-        composite_model = model_creator(current_population, num_genes, likelihood_function)
-        print("\tcreated.\n")
+        # Displaying of the composite model
+        composite_model = composite_result.get_composite_model()
 
         view_model(composite_model, "COMPOSITE MODEL (ROUNDED TO 3 DECIMALS)")
 
@@ -119,16 +169,20 @@ def main():
     # Creating and displaying of the amalgamated model
     print("* Creating the amalgamated model...")
 
-    likelihood_result_calculator(amalgamated_population, likelihood_function, data.rep)
-    relative_likelihood_result_calculator(amalgamated_population)
+    likelihood_result_calculator(amalgamated_population, likelihood_function, rep,
+                                 by_equivalence=use_equivalence_classes)
+    relative_likelihood_result_calculator(amalgamated_population, use_bigfloat)
 
     # Removing from the amalgamated population the repeated chromosomes
-    amalgamated_population = select_uniques_chromosomes(amalgamated_population)
+    amalgamated_population = select_uniques_chromosomes(amalgamated_population, unique_by_score,
+                                                        use_equivalence_classes)
     print("\t\t- The amalgamated population ends with " + str(len(amalgamated_population)) + " unique chromosomes.")
 
-    # Recalculation of 'likelihood' values and fitness on the amalgamated population (unique chromosomes)
-    likelihood_result_calculator(amalgamated_population, likelihood_function, data.rep)
-    relative_likelihood_result_calculator(amalgamated_population)
+    # Recalculation of 'likelihood' values and fitness on the amalgamated population (unique chromosomes), reusing the
+    # stored scores
+    likelihood_result_calculator(amalgamated_population, likelihood_function, rep,
+                                 by_equivalence=use_equivalence_classes)
+    relative_likelihood_result_calculator(amalgamated_population, use_bigfloat)
     relative_likelihood_result_sorting(amalgamated_population)
     fitness_calculator(amalgamated_population)
 
@@ -153,7 +207,23 @@ def main():
     print("\tcreated.")
 
     print("* Done.\n")
+
+    scoring_pools_closer()
+
+    if use_score_store:
+        print("* Saving the score store...")
+        score_store.save(likelihood_function, fingerprint,
+                         family_score_cache.used_families(likelihood_function, fingerprint))
+        num_deleted = score_store.compact()
+        print("\t" + str(family_score_cache.get_disk_hits()) + " family evaluations were served from disk, " +
+              str(len(score_store)) + " scores stored (" + str(num_deleted) + " removed by the compaction).")
+        score_store.close()
+        print("* Done.\n")
     # = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = =
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # the scoring workers are stopped and their shared memory is released even if the run fails or is interrupted
+        scoring_pools_closer()
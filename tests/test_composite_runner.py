@@ -0,0 +1,40 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.composite_runner import composite_runs_executor
+from data_logic.data_functions import data_switcher
+import contextlib
+import data_logic.data_input as data
+import io
+import numpy as np
+import unittest
+
+
+# CLASS: CompositeRunsExecutorTest
+class CompositeRunsExecutorTest(unittest.TestCase):
+    """ The composite runs of an execution done by one or by several worker processes. """
+    def setUp(self):
+        self.rep = data_switcher(False, True, data.rep)
+        self.parameters = dict(pop_size=20, num_genes=np.shape(self.rep[0])[1], per_ones=5, likelihood_function=1,
+                               num_survivors=2, selection_prop=0.3, mutation_prop=0.3, num_mutations=1,
+                               num_matings=6)
+
+    def test_results_do_not_depend_on_the_workers(self):
+        for acyclic in (False, True):
+            with contextlib.redirect_stdout(io.StringIO()):
+                serial_results = list(composite_runs_executor(4, self.rep, 42, 1, acyclic=acyclic, **self.parameters))
+            pool_results = list(composite_runs_executor(4, self.rep, 42, 2, acyclic=acyclic, **self.parameters))
+            self.assertEqual(len(serial_results), len(pool_results))
+            for serial_result, pool_result in zip(serial_results, pool_results):
+                self.assertEqual(serial_result.get_composite_model(), pool_result.get_composite_model())
+                self.assertEqual(serial_result.get_num_evaluations(), pool_result.get_num_evaluations())
+                serial_population = serial_result.get_population()
+                pool_population = pool_result.get_population()
+                self.assertEqual([serial_population[i].get_genes() for i in range(0, len(serial_population))],
+                                 [pool_population[i].get_genes() for i in range(0, len(pool_population))])
+            # a different seed gives different runs
+            other_results = list(composite_runs_executor(4, self.rep, 43, 2, acyclic=acyclic, **self.parameters))
+            self.assertNotEqual([result.get_composite_model() for result in serial_results],
+                                [result.get_composite_model() for result in other_results])
@@ -0,0 +1,156 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.composite_runner import composite_runs_executor
+from business_logic.distributed_runs import RunCoordinator, RunSpec, coordinator_runs_executor, local_address_finder
+from data_logic.data_functions import data_switcher
+from multiprocessing.connection import Client
+import contextlib
+import data_logic.data_input as data
+import io
+import multiprocessing
+import numpy as np
+import threading
+import time
+import unittest
+
+AUTHKEY = b"test-coordinator-key"
+
+
+# FUNCTION: results_summary
+def results_summary(results):
+    """ Returns the composite model, the number of evaluations and the genes of every result. """
+    summary = []
+    for result in results:
+        population = result.get_population()
+        summary.append((result.get_composite_model(), result.get_num_evaluations(),
+                        [population[i].get_genes() for i in range(0, len(population))]))
+    return summary
+
+
+# FUNCTION: worker_killer
+def worker_killer(delay):
+    """ Kills the first worker process of this process after 'delay' seconds, while it is doing a run. """
+    deadline = time.monotonic() + 10.0
+    while not multiprocessing.active_children() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(delay)
+    workers = multiprocessing.active_children()
+    if workers:
+        workers[0].kill()
+
+
+# CLASS: CoordinatorRunsExecutorTest
+class CoordinatorRunsExecutorTest(unittest.TestCase):
+    """ The composite runs served by a coordinator to local workers. """
+    def setUp(self):
+        self.rep = data_switcher(False, True, data.rep)
+        self.parameters = dict(pop_size=16, num_genes=np.shape(self.rep[0])[1], per_ones=5, likelihood_function=1,
+                               num_survivors=2, selection_prop=0.3, mutation_prop=0.3, num_mutations=1,
+                               num_matings=6)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.expected = results_summary(composite_runs_executor(4, self.rep, 42, 1, **self.parameters))
+
+    def test_results_are_the_ones_of_composite_runs_executor(self):
+        results = coordinator_runs_executor(4, self.rep, AUTHKEY, 42, num_local_workers=2, **self.parameters)
+        self.assertEqual(results_summary(results), self.expected)
+
+    def test_runs_of_a_killed_worker_are_done_again(self):
+        # longer runs, so the worker is killed in the middle of one
+        parameters = dict(self.parameters, pop_size=40, num_matings=40)
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = results_summary(composite_runs_executor(3, self.rep, 7, 1, **parameters))
+        killer = threading.Thread(target=worker_killer, args=(0.3,))
+        killer.start()
+        results = coordinator_runs_executor(3, self.rep, AUTHKEY, 7, ("0.0.0.0", 0), num_local_workers=2,
+                                            **parameters)
+        self.assertEqual(results_summary(results), expected)
+        killer.join()
+
+    def test_local_address(self):
+        self.assertEqual(local_address_finder(("0.0.0.0", 6000)), ("localhost", 6000))
+        self.assertEqual(local_address_finder(("10.0.0.2", 6000)), ("10.0.0.2", 6000))
+
+
+# CLASS: RunCoordinatorTest
+class RunCoordinatorTest(unittest.TestCase):
+    """ The leases of a coordinator, with clients that follow the protocol of 'run_worker'. """
+    def coordinator_creator(self, num_runs, lease_timeout=None, max_attempts=3):
+        """ Returns a coordinator of runs without parameters, closed at the end of the test. """
+        specs = [RunSpec(run_number, "data", {}, run_number) for run_number in range(0, num_runs)]
+        coordinator = RunCoordinator(specs, AUTHKEY, ("localhost", 0), lease_timeout, max_attempts)
+        self.addCleanup(coordinator.close)
+        return coordinator
+
+    def client_creator(self, coordinator):
+        """ Returns a connection to a coordinator, closed at the end of the test. """
+        connection = Client(coordinator.get_address(), authkey=AUTHKEY)
+        self.addCleanup(connection.close)
+        return connection
+
+    @staticmethod
+    def run_requester(connection):
+        """ Asks for a run and returns its number. """
+        connection.send(("request",))
+        message = connection.recv()
+        return message[1].get_run_number() if message[0] == "run" else message
+
+    def test_run_of_a_dropped_worker_is_leased_again(self):
+        coordinator = self.coordinator_creator(2)
+        dropped = self.client_creator(coordinator)
+        self.assertEqual(self.run_requester(dropped), 0)
+        dropped.close()
+        worker = self.client_creator(coordinator)
+        deadline = time.monotonic() + 5.0
+        run_number = self.run_requester(worker)
+        while run_number != 0 and time.monotonic() < deadline:
+            if isinstance(run_number, int):
+                worker.send(("reject", run_number))
+            time.sleep(0.05)
+            run_number = self.run_requester(worker)
+        self.assertEqual(run_number, 0)
+        self.assertEqual(coordinator.attempts[0], 2)
+
+    def test_expired_lease_is_given_to_another_worker(self):
+        coordinator = self.coordinator_creator(1, lease_timeout=0.1)
+        slow = self.client_creator(coordinator)
+        fast = self.client_creator(coordinator)
+        self.assertEqual(self.run_requester(slow), 0)
+        self.assertEqual(self.run_requester(fast), ("wait", 0.5))
+        time.sleep(0.2)
+        self.assertEqual(self.run_requester(fast), 0)
+        fast.send(("result", 0, "fast result"))
+        self.assertEqual(fast.recv(), ("ok",))
+        # the late result of the expired lease is discarded
+        slow.send(("result", 0, "slow result"))
+        self.assertEqual(slow.recv(), ("ok",))
+        self.assertEqual(coordinator.wait_result(0), "fast result")
+        self.assertEqual(coordinator.get_num_duplicates(), 1)
+        self.assertEqual(self.run_requester(slow), ("done",))
+
+    def test_duplicate_result_is_counted_once(self):
+        coordinator = self.coordinator_creator(1)
+        worker = self.client_creator(coordinator)
+        self.assertEqual(self.run_requester(worker), 0)
+        for result in ("first result", "second result"):
+            worker.send(("result", 0, result))
+            self.assertEqual(worker.recv(), ("ok",))
+        self.assertEqual(coordinator.wait_result(0), "first result")
+        self.assertEqual(coordinator.get_num_duplicates(), 1)
+
+    def test_run_lost_max_attempts_times_stops_the_execution(self):
+        coordinator = self.coordinator_creator(1, max_attempts=2)
+        for attempt in range(0, 2):
+            worker = self.client_creator(coordinator)
+            deadline = time.monotonic() + 5.0
+            run_number = self.run_requester(worker)
+            while run_number != 0 and time.monotonic() < deadline:
+                time.sleep(0.05)
+                run_number = self.run_requester(worker)
+            self.assertEqual(run_number, 0)
+            worker.close()
+        with self.assertRaises(RuntimeError):
+            coordinator.wait_result(0)
+        self.assertEqual(coordinator.attempts[0], 2)
@@ -0,0 +1,93 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.chromosome import Chromosome
+from business_logic.equivalence_functions import canonical_dag_creator, cpdag_creator, equivalence_key
+import business_logic.general_functions as general_functions
+import data_logic.data_input as data
+import numpy as np
+import random
+import unittest
+from unittest import mock
+
+
+# FUNCTION: chromosome_creator
+def chromosome_creator(num_genes, edges):
+    """ Returns a chromosome with the given edges (parent, child). """
+    genes = [[0] * num_genes for i in range(0, num_genes)]
+    for parent, child in edges:
+        genes[parent][child] = 1
+    return Chromosome(genes)
+
+
+# FUNCTION: random_dag_creator
+def random_dag_creator(num_genes, edge_prob, random_generator):
+    """ Returns the columns of a random DAG, whose edges follow a random order of the nodes. """
+    order = list(range(0, num_genes))
+    random_generator.shuffle(order)
+    columns = [0] * num_genes
+    for a in range(0, num_genes):
+        for b in range(a + 1, num_genes):
+            if random_generator.random() < edge_prob:
+                columns[order[b]] |= 1 << order[a]
+    return columns
+
+
+# FUNCTION: skeleton_finder
+def skeleton_finder(columns):
+    """ Returns the edges of a graph packed by column without their direction. """
+    return {frozenset((i, j)) for j in range(0, len(columns)) for i in range(0, len(columns)) if columns[j] >> i & 1}
+
+
+# CLASS: EquivalenceFunctionsTest
+class EquivalenceFunctionsTest(unittest.TestCase):
+    """ The CPDAG keys of Markov equivalent DAGs and the canonical DAG of every class. """
+    def setUp(self):
+        self.num_genes = np.shape(data.rep[0])[1]
+        general_functions.equivalence_score_cache.clear()
+
+    def tearDown(self):
+        general_functions.equivalence_score_cache.clear()
+
+    def test_equivalent_dags_are_scored_once(self):
+        population = [chromosome_creator(self.num_genes, [(0, 1)]),
+                      chromosome_creator(self.num_genes, [(1, 0)]),
+                      chromosome_creator(self.num_genes, [(0, 2), (1, 2)])]
+        self.assertEqual(equivalence_key(population[0]), equivalence_key(population[1]))
+        self.assertNotEqual(equivalence_key(population[0]), equivalence_key(population[2]))
+
+        with mock.patch.object(general_functions, "likelihood_result_calculator",
+                               wraps=general_functions.likelihood_result_calculator) as calculator:
+            evaluated = general_functions.equivalence_likelihood_calculator(population, 1, data.rep)
+        self.assertEqual(evaluated, 3)
+        self.assertEqual(calculator.call_count, 1)
+        self.assertEqual(len(calculator.call_args[0][0]), 2)
+        self.assertEqual(len(general_functions.equivalence_score_cache), 2)
+        self.assertEqual(population[0].get_log_likelihood_result(), population[1].get_log_likelihood_result())
+
+        # the class is found in the cache, so nothing is scored again
+        population = [chromosome_creator(self.num_genes, [(1, 0)])]
+        with mock.patch.object(general_functions, "likelihood_result_calculator",
+                               wraps=general_functions.likelihood_result_calculator) as calculator:
+            general_functions.equivalence_likelihood_calculator(population, 1, data.rep)
+        self.assertEqual(len(calculator.call_args[0][0]), 0)
+
+    def test_canonical_dag_is_a_consistent_extension(self):
+        random_generator = random.Random(7)
+        for k in range(0, 200):
+            columns = random_dag_creator(self.num_genes, 0.3, random_generator)
+            cpdag = cpdag_creator(columns)
+            canonical_dag = canonical_dag_creator(cpdag)
+            chromosome = Chromosome.from_columns(canonical_dag)
+            for node in range(0, self.num_genes):
+                self.assertFalse(chromosome.descendants(node) >> node & 1)
+            self.assertEqual(skeleton_finder(canonical_dag), skeleton_finder(columns))
+            self.assertEqual(cpdag_creator(canonical_dag), cpdag)
+            # the directed edges of the CPDAG keep their direction
+            for j in range(0, self.num_genes):
+                for i in range(0, self.num_genes):
+                    if cpdag[j] >> i & 1 and not cpdag[i] >> j & 1:
+                        self.assertTrue(canonical_dag[j] >> i & 1)
+            self.assertEqual(canonical_dag_creator(cpdag_creator(canonical_dag)), canonical_dag)
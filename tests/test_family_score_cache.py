@@ -0,0 +1,35 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.family_score_cache import FamilyScoreCache
+import unittest
+
+
+# CLASS: FamilyScoreCacheTest
+class FamilyScoreCacheTest(unittest.TestCase):
+    """ The families and disk hits reported by a worker process and merged by the parent process. """
+    def setUp(self):
+        self.stored_families = [(0, (1,), -10.0), (2, (3, 4), -20.0), (5, (), -30.0)]
+        self.parent_cache = FamilyScoreCache()
+        self.parent_cache.preload(1, "data", self.stored_families)
+        self.worker_cache = FamilyScoreCache()
+        self.worker_cache.preload(1, "data", self.stored_families)
+
+    def test_disk_families_used_by_a_worker_are_saved(self):
+        self.worker_cache.get(self.worker_cache.family_key(1, "data", 2, (4, 3)))
+        self.worker_cache.get(self.worker_cache.family_key(1, "data", 2, (3, 4)))
+        self.worker_cache.put(self.worker_cache.family_key(1, "data", 6, (0,)), -40.0)
+
+        families = self.worker_cache.new_used_families(1, "data")
+        disk_hits = self.worker_cache.new_disk_hits()
+        self.assertEqual(sorted(families), [(2, (3, 4), -20.0), (6, (0,), -40.0)])
+        self.assertEqual(disk_hits, 2)
+        self.assertEqual(self.worker_cache.new_used_families(1, "data"), [])
+        self.assertEqual(self.worker_cache.new_disk_hits(), 0)
+
+        self.assertEqual(self.parent_cache.used_families(1, "data"), [])
+        self.parent_cache.merge_families(1, "data", families, disk_hits)
+        self.assertEqual(sorted(self.parent_cache.used_families(1, "data")), [(2, (3, 4), -20.0), (6, (0,), -40.0)])
+        self.assertEqual(self.parent_cache.get_disk_hits(), 2)
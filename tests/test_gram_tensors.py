@@ -0,0 +1,46 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.family_score_cache import dataset_fingerprint
+from business_logic.gram_tensors import gram_tensors_creator, sufficient_statistics_creator
+from data_logic.data_functions import data_switcher, npy_chunk_reader
+import data_logic.data_input as data
+import numpy as np
+import os
+import tempfile
+import unittest
+
+
+# CLASS: StreamedGramTensorsTest
+class StreamedGramTensorsTest(unittest.TestCase):
+    """ The Gram tensors of the replicates streamed in chunks and of the same replicates in memory. """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filenames = []
+        for i, replicate in enumerate(data.rep):
+            filename = os.path.join(self.directory.name, "rep" + str(i) + ".npy")
+            np.save(filename, np.asarray(replicate, dtype=np.float64))
+            self.filenames.append(filename)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_streamed_and_batch_tensors_are_equal(self):
+        lags = [0, 1, 2]
+        for a_switch_zscore in (False, True):
+            for chunk_size in (1, 3, 100):
+                rep = data_switcher(False, a_switch_zscore, data.rep)
+                statistics = sufficient_statistics_creator(npy_chunk_reader(self.filenames, chunk_size), lags,
+                                                           False, a_switch_zscore)
+                self.assertEqual(statistics.get_num_times(), np.shape(rep[0])[0])
+                for lag in lags:
+                    streamed = statistics.get_gram_tensors(lag)
+                    batch = gram_tensors_creator(rep, lag)
+                    self.assertEqual(streamed.get_num_obs(), batch.get_num_obs())
+                    for name in ("child_gram", "parent_gram", "cross_gram", "avg_parent_gram"):
+                        np.testing.assert_allclose(getattr(streamed, name), getattr(batch, name), rtol=1e-10,
+                                                   atol=1e-10)
+                if not a_switch_zscore:
+                    self.assertEqual(statistics.get_fingerprint(), dataset_fingerprint(rep))
@@ -0,0 +1,109 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.chromosome import Chromosome
+from business_logic.general_functions import likelihood_result_calculator, relative_likelihood_result_calculator, \
+    relative_likelihood_result_sorting
+from business_logic.island_model import Migrator, island_runs_executor
+from business_logic.population import Population
+from data_logic.data_functions import data_switcher
+import data_logic.data_input as data
+import numpy as np
+import queue
+import random
+import threading
+import unittest
+
+
+# FUNCTION: island_population_creator
+def island_population_creator(pop_size, num_genes, rep, random_generator):
+    """ Returns a scored and sorted population of chromosomes with different random edges. """
+    chromosomes = []
+    keys = set()
+    while len(chromosomes) < pop_size:
+        genes = [[int(i < j and random_generator.random() < 0.2) for j in range(0, num_genes)]
+                 for i in range(0, num_genes)]
+        chromosome = Chromosome(genes)
+        if chromosome.structural_key() not in keys:
+            keys.add(chromosome.structural_key())
+            chromosomes.append(chromosome)
+    population = Population.from_chromosomes(chromosomes)
+    likelihood_result_calculator(population, 1, rep)
+    relative_likelihood_result_calculator(population)
+    relative_likelihood_result_sorting(population)
+    return population
+
+
+# CLASS: MigratorTest
+class MigratorTest(unittest.TestCase):
+    """ The chromosomes exchanged by the islands in a migration. """
+    def setUp(self):
+        self.rep = data_switcher(False, True, data.rep)
+        self.num_genes = np.shape(self.rep[0])[1]
+
+    def test_best_chromosomes_replace_the_worst_ones(self):
+        num_islands = 4
+        num_migrants = 2
+        for topology in ("ring", "random"):
+            random_generator = random.Random(5)
+            populations = [island_population_creator(8, self.num_genes, self.rep, random_generator)
+                           for island in range(0, num_islands)]
+            old_genes = [[population[i].get_genes() for i in range(0, len(population))] for population in populations]
+            old_scores = [population.get_log_likelihood_results().copy() for population in populations]
+            inboxes = [queue.Queue() for island in range(0, num_islands)]
+            migrators = [Migrator(island, inboxes, 3, num_migrants, topology, 17) for island in range(0, num_islands)]
+            destinations = migrators[0].destinations(2)
+            self.assertEqual(sorted(destinations), list(range(0, num_islands)))
+            self.assertTrue(all(destinations[island] != island for island in range(0, num_islands)))
+
+            # every island waits for the migrants of the previous one, so the islands migrate at the same time
+            threads = [threading.Thread(target=migrators[island].migrate, args=(populations[island], 6))
+                       for island in range(0, num_islands)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+                self.assertFalse(thread.is_alive())
+
+            for source in range(0, num_islands):
+                target = destinations[source]
+                population = populations[target]
+                self.assertEqual(len(population), 8)
+                genes = [population[i].get_genes() for i in range(0, len(population))]
+                # the worst chromosomes of the target are the best ones of the source, with their scores
+                self.assertEqual(genes[:-num_migrants], old_genes[target][:-num_migrants])
+                self.assertEqual(genes[-num_migrants:], old_genes[source][:num_migrants])
+                np.testing.assert_array_equal(population.get_log_likelihood_results()[-num_migrants:],
+                                              old_scores[source][:num_migrants])
+
+    def test_ring_and_random_destinations(self):
+        migrator = Migrator(0, [queue.Queue() for island in range(0, 5)], 3, 2, "ring", 17)
+        self.assertEqual(migrator.destinations(1), [1, 2, 3, 4, 0])
+        self.assertEqual(migrator.destinations(1), migrator.destinations(2))
+        inboxes = [queue.Queue() for island in range(0, 5)]
+        migrator = Migrator(0, inboxes, 3, 2, "random", 17)
+        # every island draws the same ring from the shared seed
+        self.assertEqual(migrator.destinations(1), Migrator(3, inboxes, 3, 2, "random", 17).destinations(1))
+        epochs = [migrator.destinations(epoch) for epoch in range(1, 6)]
+        self.assertTrue(any(destinations != epochs[0] for destinations in epochs))
+
+
+# CLASS: IslandRunsExecutorTest
+class IslandRunsExecutorTest(unittest.TestCase):
+    """ The composite runs of an island model with the same seed. """
+    def test_seeded_islands_are_reproducible(self):
+        rep = data_switcher(False, True, data.rep)
+        parameters = dict(pop_size=16, num_genes=np.shape(rep[0])[1], per_ones=5, likelihood_function=1,
+                          num_survivors=2, selection_prop=0.3, mutation_prop=0.3, num_mutations=1, num_matings=6)
+        executions = []
+        for k in range(0, 2):
+            execution = []
+            for result in island_runs_executor(3, rep, 42, 2, 2, "random", **parameters):
+                population = result.get_population()
+                execution.append((result.get_composite_model(),
+                                  [population[i].get_genes() for i in range(0, len(population))]))
+            executions.append(execution)
+        self.assertEqual(len(executions[0]), 3)
+        self.assertEqual(executions[0], executions[1])
@@ -0,0 +1,60 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.chromosome import Chromosome
+from business_logic.population import Population
+from business_logic.repair_functions import cycles_breaker, most_shared_edge_finder, repair_population
+import numpy as np
+import random
+import unittest
+
+
+# FUNCTION: random_population_creator
+def random_population_creator(pop_size, num_genes, edge_prob, random_generator):
+    """ Returns a list of chromosomes with random genes, with loops and cycles. """
+    population = []
+    for k in range(0, pop_size):
+        genes = [[int(random_generator.random() < edge_prob) for j in range(0, num_genes)] for i in range(0, num_genes)]
+        population.append(Chromosome(genes))
+    return population
+
+
+# FUNCTION: acyclic_checker
+def acyclic_checker(chromosome):
+    """ Returns True if the genes of a chromosome are a DAG. """
+    return not any(chromosome.descendants(node) >> node & 1 for node in range(0, chromosome.get_num_genes()))
+
+
+# CLASS: RepairFunctionsTest
+class RepairFunctionsTest(unittest.TestCase):
+    """ The DAGs returned by the repair of random populations. """
+    def test_repaired_population_is_acyclic(self):
+        random_generator = random.Random(11)
+        for max_parents in (1, 2, 3):
+            for edge_prob in (0.2, 0.5, 0.9):
+                population = random_population_creator(20, 8, edge_prob, random_generator)
+                old_genes = [chromosome.get_genes() for chromosome in population]
+                repaired_lists = [repair_population(population, max_parents, np.random.default_rng(3)),
+                                  repair_population(Population.from_chromosomes(population), max_parents,
+                                                    np.random.default_rng(3))]
+                for repaired_population in repaired_lists:
+                    self.assertEqual(len(repaired_population), len(population))
+                    for i in range(0, len(repaired_population)):
+                        chromosome = repaired_population[i]
+                        self.assertTrue(acyclic_checker(chromosome))
+                        genes = np.array(chromosome.get_genes())
+                        self.assertLessEqual(genes.sum(axis=0).max(), max_parents)
+                        # the repair only removes edges
+                        self.assertFalse(np.any(genes > np.array(old_genes[i])))
+                self.assertEqual([chromosome.get_genes() for chromosome in repaired_lists[0]],
+                                 [chromosome.get_genes() for chromosome in repaired_lists[1]])
+
+    def test_most_shared_edge_of_two_cycles(self):
+        # the cycles 0 -> 1 -> 2 -> 0 and 0 -> 1 -> 3 -> 0 share the edge 0 -> 1
+        genes = [[0, 1, 0, 0], [0, 0, 1, 1], [1, 0, 0, 0], [1, 0, 0, 0]]
+        columns = Chromosome(genes).get_columns()
+        parent, child = most_shared_edge_finder([0, 1, 2, 3], columns)
+        self.assertEqual((parent, child), (0, 1))
+        self.assertEqual(cycles_breaker(columns), [columns[0], 0, columns[2], columns[3]])
@@ -0,0 +1,35 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.scoring_plan import scoring_plan_creator
+import data_logic.data_input as data
+import math
+import numpy as np
+import unittest
+import warnings
+
+
+# CLASS: ScoringPlanTest
+class ScoringPlanTest(unittest.TestCase):
+    """ The scores of the families of a batch where one family has a singular matrix. """
+    def setUp(self):
+        rep = []
+        for replicate in data.rep:
+            replicate = np.array(replicate, dtype=np.float64)
+            replicate[:, 2] = replicate[:, 1]  # the family {1,2}->0 is singular
+            rep.append(replicate)
+        self.scoring_plan = scoring_plan_creator(rep, 0)
+
+    def test_score_does_not_depend_on_the_batch(self):
+        families = [(0, (1, 3)), (0, (1, 2)), (5, (4, 6)), (7, (2, 8))]
+        alone = [self.scoring_plan.score_family(child, parents) for child, parents in families]
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            batched = self.scoring_plan.score_families(families).tolist()
+        self.assertEqual(batched, alone)
+        self.assertEqual(alone[1], -math.inf)
+        self.assertTrue(all(math.isfinite(score) for k, score in enumerate(alone) if k != 1))
+        self.assertEqual(len(caught), 1)
+        self.assertTrue(str(caught[0].message).startswith("1 of the 4 families"))
@@ -0,0 +1,102 @@
+# Created by: Dr. David John & Kenneth Meza.
+# Created at: October, 2026.
+# Updated at: October, 2026.
+
+# LIBRARIES
+from business_logic.chromosome import Chromosome
+from business_logic.general_functions import likelihood_result_calculator, relative_likelihood_result_calculator
+from business_logic.population import Population
+from business_logic.selection_functions import family_scores_swapper
+import data_logic.data_input as data
+import math
+import numpy as np
+import unittest
+
+
+# FUNCTION: singular_rep_creator
+def singular_rep_creator():
+    """
+    Returns the replicates of 'data_input.py' with the column 1 copied into the column 2, so the family {1,2}->0 has a
+    singular Gram matrix and its score is -inf.
+    """
+    rep = []
+    for replicate in data.rep:
+        replicate = np.array(replicate, dtype=np.float64)
+        replicate[:, 2] = replicate[:, 1]
+        rep.append(replicate)
+    return rep
+
+
+# FUNCTION: chromosome_creator
+def chromosome_creator(num_genes, edges):
+    """ Returns a chromosome with the given edges (parent, child). """
+    genes = [[0] * num_genes for i in range(0, num_genes)]
+    for parent, child in edges:
+        genes[parent][child] = 1
+    return Chromosome(genes)
+
+
+# FUNCTION: fresh_likelihood
+def fresh_likelihood(chromosome, rep):
+    """ Returns the likelihood result of the genes of a chromosome, scored from scratch. """
+    fresh = Chromosome(chromosome.get_genes())
+    likelihood_result_calculator([fresh], 1, rep)
+    return fresh.get_log_likelihood_result()
+
+
+# CLASS: SingularFamilyTest
+class SingularFamilyTest(unittest.TestCase):
+    """ The likelihood results updated by difference when a family score is -inf. """
+    def setUp(self):
+        self.rep = singular_rep_creator()
+        self.num_genes = np.shape(self.rep[0])[1]
+
+    def test_mutation_of_a_singular_family(self):
+        for as_population in (False, True):
+            population = [chromosome_creator(self.num_genes, [(1, 0), (2, 0)]),
+                          chromosome_creator(self.num_genes, [(3, 0)]),
+                          chromosome_creator(self.num_genes, [(4, 5)])]
+            if as_population:
+                population = Population.from_chromosomes(population)
+            likelihood_result_calculator(population, 1, self.rep)
+            self.assertEqual(population[0].get_log_likelihood_result(), -math.inf)
+
+            population[0].bit_changer(2, 0)
+            likelihood_result_calculator(population, 1, self.rep)
+            self.assertTrue(math.isfinite(population[0].get_log_likelihood_result()))
+            self.assertAlmostEqual(population[0].get_log_likelihood_result(),
+                                   fresh_likelihood(population[0], self.rep), places=9)
+
+            relative_likelihood_result_calculator(population)
+            for chromosome in population:
+                self.assertFalse(math.isnan(chromosome.get_relative_likelihood_result()))
+
+            # a second mutation of the same chromosome is also updated by difference
+            population[0].bit_changer(6, 0)
+            likelihood_result_calculator(population, 1, self.rep)
+            self.assertAlmostEqual(population[0].get_log_likelihood_result(),
+                                   fresh_likelihood(population[0], self.rep), places=9)
+
+    def test_crossover_of_a_singular_family(self):
+        offspring_a = chromosome_creator(self.num_genes, [(1, 0), (2, 0), (4, 5)])
+        offspring_b = chromosome_creator(self.num_genes, [(3, 0), (6, 7)])
+        likelihood_result_calculator([offspring_a, offspring_b], 1, self.rep)
+        offspring_a.swap_column(offspring_b, 0)
+        family_scores_swapper(offspring_a, offspring_b, 0)
+        self.assertAlmostEqual(offspring_a.get_log_likelihood_result(), fresh_likelihood(offspring_a, self.rep),
+                               places=9)
+        self.assertEqual(offspring_b.get_log_likelihood_result(), -math.inf)
+
+    def test_missing_likelihood_is_evaluated_again(self):
+        for as_population in (False, True):
+            population = [chromosome_creator(self.num_genes, [(3, 0), (4, 5)]),
+                          chromosome_creator(self.num_genes, [(6, 7)])]
+            if as_population:
+                population = Population.from_chromosomes(population)
+            likelihood_result_calculator(population, 1, self.rep)
+            population[0].set_log_likelihood_result(math.nan)
+            population[1].set_log_likelihood_result(None)
+            self.assertEqual(likelihood_result_calculator(population, 1, self.rep), 2)
+            for chromosome in population:
+                self.assertAlmostEqual(chromosome.get_log_likelihood_result(), fresh_likelihood(chromosome, self.rep),
+                                       places=9)